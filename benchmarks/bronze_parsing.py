@@ -0,0 +1,107 @@
+"""
+Bronze -> Silver benchmark: per-row parsing (json.loads + Comment + dict per comment) against the
+Arrow path (multithreaded read_json with an explicit schema + column kernels).
+
+    python benchmarks/bronze_parsing.py --comments 1000000 [--codec gzip]
+
+Generates a synthetic Bronze file (seeded; ~30% non-ASCII comments, URLs, replies, missing
+fields), times each step on it and checks that both engines write the same Silver rows.
+"""
+from __future__ import annotations
+
+import argparse
+import random
+import tempfile
+import time
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+
+import pyarrow as pa
+import pyarrow.parquet as pq
+
+from yt_comments.ingestion.models import Comment
+from yt_comments.preprocessing.preprocess_service import PreprocessCommentsService
+from yt_comments.preprocessing.text_preprocessor import TextPreprocessor
+from yt_comments.storage.bronze_codecs import BRONZE_CODECS
+from yt_comments.storage.bronze_comments_repository import JSONLCommentsRepository
+from yt_comments.storage.silver_comments_repository import ParquetSilverCommentsRepository
+
+
+
+VIDEO_ID = "benchVideo1"
+WORDS = (
+    "great video thanks for sharing this is amazing I learned a lot the best explanation "
+    "so far can you make one about next please love it first watching from"
+).split()
+EXTRAS = ["", "", "", " 🔥🔥", " ❤️", " Ölçü", " très bien", " ΣΟΦΟΣ", "  https://example.com/x?id=1", " WWW.Site.org"]
+
+
+def _generate(n: int, seed: int = 7):
+    rng = random.Random(seed)
+    start = datetime(2025, 1, 1, tzinfo=timezone.utc)
+    for i in range(n):
+        text = " ".join(rng.choices(WORDS, k=rng.randint(3, 30))).capitalize() + rng.choice(EXTRAS)
+        is_reply = rng.random() < 0.3
+        yield Comment(
+            video_id=VIDEO_ID,
+            comment_id=f"c{i}",
+            text=text,
+            author=f"@user{rng.randint(1, 50_000)}" if rng.random() < 0.98 else None,
+            like_count=rng.randint(0, 500) if rng.random() < 0.9 else None,
+            published_at=start + timedelta(seconds=i * 7),
+            is_reply=is_reply,
+            parent_id=f"c{rng.randint(0, max(0, i - 1))}" if is_reply else None,
+        )
+
+
+def _timed(label: str, fn, results: list[tuple[str, float]]):
+    started = time.perf_counter()
+    value = fn()
+    results.append((label, time.perf_counter() - started))
+    return value
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--comments", type=int, default=1_000_000)
+    parser.add_argument("--codec", choices=list(BRONZE_CODECS), default="none")
+    parser.add_argument("--batch-size", type=int, default=5000)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        tmp_path = Path(tmp)
+        bronze = JSONLCommentsRepository(tmp_path / "bronze", codec=args.codec)
+        path = bronze.save(VIDEO_ID, _generate(args.comments))
+        print(f"Bronze file: {path.name} | comments={args.comments} | size_mb={path.stat().st_size / 2**20:.1f}")
+
+        results: list[tuple[str, float]] = []
+        comments = _timed("parse: load() -> list[Comment]", lambda: bronze.load(VIDEO_ID), results)
+        table = _timed("parse: read_table() -> pa.Table", lambda: bronze.read_table(VIDEO_ID), results)
+        assert len(comments) == table.num_rows == args.comments
+        del comments, table
+
+        silver_paths = {}
+        for engine in ("rows", "arrow"):
+            service = PreprocessCommentsService(
+                bronze_repo=bronze,
+                silver_repo=ParquetSilverCommentsRepository(tmp_path / f"silver_{engine}"),
+                text_preprocessor=TextPreprocessor(),
+            )
+            silver_paths[engine] = _timed(
+                f"preprocess: engine={engine}",
+                lambda: service.run(VIDEO_ID, batch_size=args.batch_size, engine=engine),
+                results,
+            )
+
+        rows, arrow = (pq.read_table(silver_paths[e]).drop_columns(["processed_at"]) for e in ("rows", "arrow"))
+        print(f"Silver identical: {rows.equals(arrow)} | arrow threads: {pa.cpu_count()}")
+
+    print()
+    print("| step | seconds |")
+    print("|---|---|")
+    for label, seconds in results:
+        print(f"| {label} | {seconds:.2f} |")
+
+
+if __name__ == "__main__":
+    main()
@@ -14,4 +14,5 @@ class ChannelRunSummary:
     video_limit: int | None
     comment_limit: int | None
     published_after: datetime | None
-    published_before: datetime | None
\ No newline at end of file
+    published_before: datetime | None
+    skipped_unchanged_count: int = 0 # videos in video_ids not re-scraped because their commentCount didn't change
\ No newline at end of file
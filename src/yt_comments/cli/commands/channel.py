@@ -1,9 +1,15 @@
 from __future__ import annotations
 
 import argparse
+import math
 import os
+import time
 
-from datetime import datetime, timezone
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass, field, replace
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+from typing import Callable
 
 from yt_comments.analysis.features import hash_config
 from yt_comments.analysis.basic_stats.models import BasicStatsConfig
@@ -14,45 +20,85 @@ from yt_comments.analysis.distinctive_keywords.service import DistinctiveKeyword
 from yt_comments.analysis.tfidf.models import TfidfConfig
 
 from yt_comments.cli.helpers import (
-    _format_optional_dt, _load_channel_id_ref_mapping, 
-    _save_channel_id_ref_mapping, _scrape_video, logger
+    _build_response_cache, _format_optional_dt, _load_api_key_pool, _load_channel_id_ref_mapping, 
+    _resolve_channel_ref, _scrape_video, logger
 )
 
-from yt_comments.ingestion.channel_ref_parser import parse_channel_ref
+from yt_comments.ingestion.api_key_pool import ApiKeyPool
 from yt_comments.ingestion.channel_video_discovery_service import ChannelVideoDiscoveryService
-from yt_comments.ingestion.models import ChannelVideoDiscovery
+from yt_comments.ingestion.comment_allocation import allocate_comment_limits
+from yt_comments.ingestion.http_transport import HttpTransport, HttpTransportConfig
+from yt_comments.ingestion.freshness import partition_unchanged
+from yt_comments.ingestion.models import ChannelVideo, ChannelVideoDiscovery, FailedVideo, VideoRefreshState
+from yt_comments.ingestion.quota import (
+    ENDPOINT_COSTS, QuotaLedger, RateLimiter, estimate_comment_units, key_fingerprint, plan_within_budget
+)
+from yt_comments.ingestion.refresh_schedule import due_for_refresh, mark_scraped, observe_comment_count
+from yt_comments.ingestion.response_cache import ResponseCache
+from yt_comments.ingestion.retry import RetryPolicy
 from yt_comments.ingestion.video_id_extractor import extract_video_id
-from yt_comments.ingestion.youtube_api_client import YouTubeApiClient
+from yt_comments.ingestion.youtube_api_client import DEFAULT_BASE_URL, YouTubeApiClient
 
 from yt_comments.nlp.stopwords import STOPWORDS
 
+from yt_comments.preprocessing.preprocess_queue import PreprocessQueue
 from yt_comments.preprocessing.preprocess_service import PreprocessCommentsService
 from yt_comments.preprocessing.text_preprocessor import TextPreprocessor
 
+from yt_comments.storage.bronze_codecs import codec_available
 from yt_comments.storage.bronze_comments_repository import JSONLCommentsRepository
+from yt_comments.storage.comment_count_repository import JSONCommentCountRepository
+from yt_comments.storage.failed_video_repository import JSONFailedVideoRepository
 from yt_comments.storage.gold_channel_run_summary_repository import JSONChannelRunSummaryRepository
 from yt_comments.storage.gold_channel_tfidf_repository import ParquetChannelTfidfKeywordsRepository
 from yt_comments.storage.gold_channel_token_stats_repository import ParquetChannelTokenStatsRepository
 from yt_comments.storage.gold_corpus_df_parquet_repository import ParquetCorpusDfRepository
 from yt_comments.storage.gold_distinctive_keywords_repository import ParquetDistinctiveKeywordsRepository
 from yt_comments.storage.gold_tfidf_keywords_parquet_repository import ParquetTfidfKeywordsRepository
+from yt_comments.storage.quota_ledger_repository import JSONQuotaLedgerRepository
+from yt_comments.storage.refresh_state_repository import JSONRefreshStateRepository
 from yt_comments.storage.silver_comments_repository import ParquetSilverCommentsRepository
 
 
 
 def run_discover_vids(args: argparse.Namespace) -> int:
+    if args.discovery_shards < 1:
+        logger.error("Invalid argument | --discovery-shards must be >= 1")
+        return 2
+    
+    if args.ref_ttl_days < 0:
+        logger.error("Invalid argument | --ref-ttl-days must be >= 0")
+        return 2
+    
+    if args.http_cache_ttl_hours < 0 or args.http_cache_max_mb < 1:
+        logger.error("Invalid argument | --http-cache-ttl-hours must be >= 0 and --http-cache-max-mb >= 1")
+        return 2
+    
     logger.info("Looking up YouTube API key")
-    api_key = os.getenv("YOUTUBE_API_KEY")
+    key_pool = _load_api_key_pool()
     
     channel_id = args.channelId
 
-    if api_key:
-            logger.info("Using YouTube API client | channel_ref=%s", args.channelId)
-            parsed_channel_id = parse_channel_ref(args.channelId)
-            client = YouTubeApiClient(api_key=api_key)
-            channel_id = client.resolve_channel_id(parsed_channel_id)
-            _save_channel_id_ref_mapping(data_root=args.data_root, raw_input=parsed_channel_id.value, channel_id=channel_id)
-            logger.info("Resolved channel reference | input=%s channel_id=%s", args.channelId, channel_id)
+    if key_pool:
+            logger.info("Using YouTube API client | channel_ref=%s keys=%s", args.channelId, len(key_pool.keys))
+            quota = QuotaLedger(
+                daily_budget=args.daily_quota,
+                repo=JSONQuotaLedgerRepository(data_root=args.data_root),
+            )
+            client = YouTubeApiClient(
+                api_key=key_pool.keys[0],
+                base_url=os.getenv("YOUTUBE_API_BASE_URL", DEFAULT_BASE_URL),
+                quota=quota,
+                key_pool=key_pool,
+                response_cache=_build_response_cache(args),
+            )
+            channel_id = _resolve_channel_ref(
+                client=client,
+                data_root=args.data_root,
+                raw_input=args.channelId,
+                max_age=timedelta(days=args.ref_ttl_days),
+                refresh=args.refresh_ref,
+            )
     else:
             logger.error("YouTube API key not found")
             return 2
@@ -62,9 +108,10 @@ def run_discover_vids(args: argparse.Namespace) -> int:
         published_after=args.published_after,
         published_before=args.published_before,
         limit=args.limit,    
+        engine=args.discovery_engine,
     )
     
-    service = ChannelVideoDiscoveryService(client=client, request=request)
+    service = ChannelVideoDiscoveryService(client=client, request=request, shards=args.discovery_shards)
     logger.info("Starting channel video discovery | channel_id=%s", channel_id)
     result = service.run()
     logger.info("Channel video discovery completed | channel_id=%s videos=%s", channel_id, result.video_count)
@@ -77,96 +124,939 @@ def run_discover_vids(args: argparse.Namespace) -> int:
         print(f"{date_str} | {video.video_id} | {video.title}")
 
     print(f"Total videos={result.video_count}")
+    if args.http_cache:
+        _print_cache_stats(client.response_cache)
+    logger.info(
+        "Quota usage | used=%s remaining=%s",
+        sum(quota.used(key) for key in key_pool.keys),
+        client.remaining_quota(),
+    )
+    client.close()
         
     return 0
 
 
-def run_scrape_channel(args: argparse.Namespace) -> int:
-    logger.info("Looking up YouTube API key")
-    api_key = os.getenv("YOUTUBE_API_KEY")
-    
-    channel_id = args.channelId
+@dataclass(slots=True)
+class _ChannelScrape:
+    """Bookkeeping of one channel inside a (multi-)channel scrape run."""
+    channel_id: str
+    started_at_utc: datetime
+    videos: list[ChannelVideo] = field(default_factory=list)
+    planned: list[ChannelVideo] = field(default_factory=list)
+    deferred: list[ChannelVideo] = field(default_factory=list)
+    unchanged: list[ChannelVideo] = field(default_factory=list)
+    current_counts: dict[str, int | None] = field(default_factory=dict)
+    futures: list[Future] = field(default_factory=list)
+    limits: dict[str, int] = field(default_factory=dict) # per-video comment limits with --comment-budget
+    failed: dict[str, FailedVideo] = field(default_factory=dict) # the channel's retry queue
+    video_ids: list[str] = field(default_factory=list)
+    recovered: int = 0 # videos taken off the retry queue by a successful scrape
+    comment_count: int = 0
+    error_count: int = 0
+    summary_path: Path | None = None
 
-    if api_key:
-            logger.info("Using YouTube API client | channel_ref=%s", args.channelId)
-            client = YouTubeApiClient(api_key=api_key)
-            parsed_channel_id = parse_channel_ref(args.channelId)
-            channel_id = client.resolve_channel_id(parsed_channel_id)
-            _save_channel_id_ref_mapping(data_root=args.data_root, raw_input=parsed_channel_id.value, channel_id=channel_id)
-            logger.info("Resolved channel reference | input=%s channel_id=%s", args.channelId, channel_id)
-    else:
-            logger.error("YouTube API key not found")
-            return 2
+
+def _validate_scrape_channel_args(args: argparse.Namespace) -> bool:
+    if args.jobs < 1:
+        logger.error("Invalid argument | --jobs must be >= 1")
+        return False
+    
+    if args.max_in_flight is not None and args.max_in_flight < 1:
+        logger.error("Invalid argument | --max-in-flight must be >= 1")
+        return False
+    
+    if args.pool_size is not None and args.pool_size < 1:
+        logger.error("Invalid argument | --pool-size must be >= 1")
+        return False
+    
+    if args.max_attempts < 1:
+        logger.error("Invalid argument | --max-attempts must be >= 1")
+        return False
+    
+    if args.incremental and args.resume:
+        logger.error("Invalid argument | --incremental and --resume can't be combined")
+        return False
+    
+    if not codec_available(args.bronze_codec):
+        logger.error("Invalid argument | --bronze-codec %s is not available in this pyarrow build", args.bronze_codec)
+        return False
+    
+    if args.daily_quota < 1:
+        logger.error("Invalid argument | --daily-quota must be >= 1")
+        return False
     
+    if args.requests_per_second is not None and args.requests_per_second <= 0:
+        logger.error("Invalid argument | --requests-per-second must be > 0")
+        return False
+    
+    if args.discovery_shards < 1:
+        logger.error("Invalid argument | --discovery-shards must be >= 1")
+        return False
+    
+    if args.prefetch_pages < 0:
+        logger.error("Invalid argument | --prefetch-pages must be >= 0")
+        return False
+    
+    if args.reply_workers < 1:
+        logger.error("Invalid argument | --reply-workers must be >= 1")
+        return False
+    
+    if args.ref_ttl_days < 0:
+        logger.error("Invalid argument | --ref-ttl-days must be >= 0")
+        return False
+    
+    if args.http_cache_ttl_hours < 0 or args.http_cache_max_mb < 1:
+        logger.error("Invalid argument | --http-cache-ttl-hours must be >= 0 and --http-cache-max-mb >= 1")
+        return False
+    
+    if args.comment_budget is not None and args.comment_budget < 1:
+        logger.error("Invalid argument | --comment-budget must be >= 1")
+        return False
+    
+    if args.min_comments_per_video < 0:
+        logger.error("Invalid argument | --min-comments-per-video must be >= 0")
+        return False
+    
+    max_per_video = _max_comments_per_video(args)
+    if max_per_video is not None and max_per_video < args.min_comments_per_video:
+        logger.error("Invalid argument | --max-comments-per-video must be >= --min-comments-per-video")
+        return False
+    
+    if args.retry_failed and args.skip_unchanged:
+        logger.error("Invalid argument | --retry-failed and --skip-unchanged can't be combined")
+        return False
+    
+    return True
+
+
+def _max_comments_per_video(args: argparse.Namespace) -> int | None:
+    """Per-video cap of --comment-budget allocation; --comments-limit unless set explicitly."""
+    if args.max_comments_per_video is not None:
+        return args.max_comments_per_video
+    return args.comments_limit
+
+
+def _default_pool_size(args: argparse.Namespace) -> int:
+    """
+    Connections needed so that no concurrent request waits for the pool.
+
+    Each job either discovers a channel (up to --discovery-shards requests at once) or scrapes a video:
+    one page request (made by the --prefetch-pages producer when pipelined) plus, with --replies,
+    up to --reply-workers reply requests. --max-in-flight caps the total anyway.
+    """
+    per_job = max(args.discovery_shards, 1 + (args.reply_workers if args.replies else 0))
+    pool_size = args.jobs * per_job
+    if args.max_in_flight is not None:
+        pool_size = min(pool_size, args.max_in_flight)
+    return pool_size
+
+
+def _build_scrape_client(args: argparse.Namespace, key_pool: ApiKeyPool) -> tuple[YouTubeApiClient, QuotaLedger]:
+    transport = HttpTransport(
+        HttpTransportConfig(
+            pool_size=args.pool_size or _default_pool_size(args),
+            keep_alive=args.keep_alive,
+            compress=args.compress,
+            connect_timeout=args.connect_timeout,
+            read_timeout=args.read_timeout,
+        )
+    )
+    quota = QuotaLedger(
+        daily_budget=args.daily_quota,
+        repo=JSONQuotaLedgerRepository(data_root=args.data_root),
+    )
+    client = YouTubeApiClient(
+        api_key=key_pool.keys[0],
+        key_pool=key_pool,
+        response_cache=_build_response_cache(args),
+        base_url=os.getenv("YOUTUBE_API_BASE_URL", DEFAULT_BASE_URL),
+        max_in_flight=args.max_in_flight,
+        transport=transport,
+        retry_policy=RetryPolicy(max_attempts=args.max_attempts),
+        quota=quota,
+        rate_limiter=(
+            RateLimiter(args.requests_per_second)
+            if args.requests_per_second is not None
+            else None
+        ),
+    )
+    return client, quota
+
+
+def _discovery_cost(engine: str) -> int:
+    if engine == "uploads":
+        # uploads playlist lookup, first playlist page and its statistics batch
+        return ENDPOINT_COSTS["channels"] + ENDPOINT_COSTS["playlistItems"] + ENDPOINT_COSTS["videos"]
+    return ENDPOINT_COSTS["search"]
+
+
+def _discover_channel_videos(args: argparse.Namespace, client: YouTubeApiClient, channel_id: str) -> list[ChannelVideo]:
     request = ChannelVideoDiscovery(
         channel_id=channel_id,
         published_after=args.published_after,
         published_before=args.published_before,
         limit=args.video_limit,    
+        engine=args.discovery_engine,
     )
-    
-    service = ChannelVideoDiscoveryService(client=client, request=request)
+    service = ChannelVideoDiscoveryService(client=client, request=request, shards=args.discovery_shards)
     logger.info("Starting channel video discovery | channel_id=%s", channel_id)
     videos = service.run()
     logger.info("Channel video discovery completed | channel_id=%s videos=%s", channel_id, videos.video_count)
+    return videos.videos
+
+
+def _queued_failed_videos(failed_repo: JSONFailedVideoRepository, channel_id: str) -> list[ChannelVideo]:
+    return [
+        ChannelVideo(video_id=failed.video_id, channel_id=channel_id, title=failed.title)
+        for failed in failed_repo.load(channel_id).values()
+    ]
+
+
+def _scrape_channels(
+        args: argparse.Namespace,
+        *,
+        client: YouTubeApiClient,
+        quota: QuotaLedger,
+        key_pool: ApiKeyPool,
+        channel_ids: list[str],
+        on_scraped: Callable[[str], None] | None = None,
+) -> list[_ChannelScrape]:
+    """
+    Discover and scrape channels on one shared worker pool and quota budget.
+
+    Discovery of every channel is queued first, then each channel's videos are planned against
+    what is left of the budget (minus units already promised to earlier channels) and queued.
+    Results are consumed channel by channel in discovery order, and one run summary is saved per channel.
+
+    Failed videos go to the channel's retry queue (error and attempt count); a later success takes
+    them off. With --retry-failed the queue replaces discovery and the recovered videos are merged
+    into the channel's latest run summary.
+
+    `on_scraped` is called with the id of every video whose Bronze file is complete: unchanged
+    videos right after planning, scraped ones from the worker as soon as the scrape succeeds.
+    A blocking callback holds that worker, which throttles scraping to the consumer's pace.
+    """
+    repo = JSONLCommentsRepository(data_dir=args.bronze_dir, codec=args.bronze_codec)
+    failed_repo = JSONFailedVideoRepository(data_root=args.data_root)
+    comment_count_repo = JSONCommentCountRepository(data_root=args.data_root)
+    recorded_counts = comment_count_repo.load()
     
-    repo = JSONLCommentsRepository(data_dir=args.bronze_dir)
-    
-    logger.info("Starting channel scrape | channel_id=%s", channel_id)
-    start_at_utc = datetime.now(tz=timezone.utc)
-    comments_count = 0
-    errors = 0
-    video_ids = []
-    for video in videos.videos:
-        try:
-            result = _scrape_video(
-                video_id=video.video_id,
-                client=client,
-                repo=repo,
-                limit=args.comments_limit,
-                overwrite=args.overwrite
+    reserved = 0 # units promised to planned but not yet scraped videos
+    scrapes: list[_ChannelScrape] = []
+    with ThreadPoolExecutor(max_workers=args.jobs, thread_name_prefix="scrape") as pool:
+        discoveries = [
+            (
+                pool.submit(_queued_failed_videos, failed_repo, channel_id)
+                if args.retry_failed
+                else pool.submit(_discover_channel_videos, args, client, channel_id)
             )
-            comments_count += result.saved_count
-            video_ids.append(video.video_id)
-            print(f"{video.video_id} | title={video.title} | comments={result.saved_count} | path={result.path}")
-        except Exception as e:
-             errors += 1
-             logger.exception("Video scrape failed | video_id=%s", video.video_id)
-             print(f"Failed to scrape | video_id={video.video_id} | error={e}")
+            for channel_id in channel_ids
+        ]
+        for channel_id, discovery in zip(channel_ids, discoveries, strict=True):
+            scrape = _ChannelScrape(channel_id=channel_id, started_at_utc=datetime.now(tz=timezone.utc))
+            scrapes.append(scrape)
+            try:
+                scrape.videos = discovery.result()
+            except Exception as e:
+                scrape.error_count += 1
+                logger.exception("Channel discovery failed | channel_id=%s", channel_id)
+                print(f"Failed to discover | channel_id={channel_id} | error={e}")
+                continue
+            scrape.failed = failed_repo.load(channel_id)
+            if args.retry_failed and not scrape.videos:
+                print(f"No failed videos to retry | channel_id={channel_id}")
+            
+            candidates = scrape.videos
+            counts_known = False
+            # counts are recorded after every complete scrape, so later --skip-unchanged runs have a baseline;
+            # the uploads engine already knows commentCount, the rest costs 1 unit per 50 videos
+            scrape.current_counts = {v.video_id: v.comment_count for v in scrape.videos if v.comment_count is not None}
+            missing = [v.video_id for v in scrape.videos if v.comment_count is None]
+            try:
+                if missing:
+                    stats = client.fetch_video_statistics(missing)
+                    scrape.current_counts.update({video_id: s.comment_count for video_id, s in stats.items()})
+                counts_known = True
+            except ValueError as e:
+                logger.warning("Comment count pre-check failed | channel_id=%s error=%s", channel_id, e)
+            
+            if args.skip_unchanged:
+                if counts_known:
+                    candidates, scrape.unchanged = partition_unchanged(
+                        scrape.videos,
+                        current_counts=scrape.current_counts,
+                        recorded_counts=recorded_counts,
+                        has_bronze=repo.exists,
+                    )
+                else:
+                    logger.warning("Comment counts unknown, scraping all videos | channel_id=%s", channel_id)
+                for video in scrape.unchanged:
+                    print(f"Skipped (unchanged) | video_id={video.video_id} | comments={scrape.current_counts[video.video_id]}")
+                    if on_scraped is not None:
+                        on_scraped(video.video_id)
+            
+            unallotted: list[ChannelVideo] = []
+            if args.comment_budget is not None:
+                scrape.limits = allocate_comment_limits(
+                    [
+                        replace(v, comment_count=scrape.current_counts.get(v.video_id, v.comment_count))
+                        for v in candidates
+                    ],
+                    total=args.comment_budget,
+                    weighting=args.allocation,
+                    min_per_video=args.min_comments_per_video,
+                    max_per_video=_max_comments_per_video(args),
+                )
+                unallotted = [v for v in candidates if scrape.limits[v.video_id] == 0]
+                candidates = [v for v in candidates if scrape.limits[v.video_id] > 0]
+                logger.info(
+                    "Comment budget allocated | channel_id=%s budget=%s allocated=%s videos=%s unallotted=%s",
+                    channel_id, args.comment_budget, sum(scrape.limits.values()), len(candidates), len(unallotted),
+                )
+            
+            def video_cost(video: ChannelVideo) -> int:
+                limit = scrape.limits.get(video.video_id, args.comments_limit)
+                count = scrape.current_counts.get(video.video_id)
+                # a video never needs more pages than it has comments; the limit is the fallback when the count is unknown
+                return estimate_comment_units(limit if count is None else min(limit, count))
+            
+            # plan only as many videos as the remaining budget can pay for, instead of failing mid-run
+            scrape.planned, scrape.deferred = plan_within_budget(
+                candidates,
+                remaining=key_pool.remaining(quota) - reserved,
+                unit_cost=video_cost,
+            )
+            reserved += sum(video_cost(video) for video in scrape.planned)
+            for video in unallotted:
+                print(f"Deferred (comment budget) | video_id={video.video_id}")
+            if scrape.deferred:
+                logger.warning(
+                    "Quota budget covers only part of the channel | channel_id=%s planned=%s deferred=%s remaining=%s",
+                    channel_id,
+                    len(scrape.planned),
+                    len(scrape.deferred),
+                    key_pool.remaining(quota),
+                )
+                for video in scrape.deferred:
+                    print(f"Deferred (quota budget) | video_id={video.video_id}")
+            
+            logger.info("Starting channel scrape | channel_id=%s jobs=%s", channel_id, args.jobs)
+            scrape.deferred += unallotted
+            scrape.futures = [
+                pool.submit(
+                    _scrape_video,
+                    video_id=video.video_id,
+                    client=client,
+                    repo=repo,
+                    limit=scrape.limits.get(video.video_id, args.comments_limit),
+                    overwrite=args.overwrite,
+                    resume=args.resume,
+                    incremental=args.incremental,
+                    prefetch_pages=args.prefetch_pages,
+                    include_replies=args.replies,
+                    reply_workers=args.reply_workers,
+                )
+                for video in scrape.planned
+            ]
+            if on_scraped is not None:
+                for video, future in zip(scrape.planned, scrape.futures, strict=True):
+                    future.add_done_callback(_hand_off(video.video_id, on_scraped))
+        
+        for scrape in scrapes:
+            # results are consumed in discovery order, so video_ids stay deterministic regardless of completion order
+            for video, future in zip(scrape.planned, scrape.futures, strict=True):
+                try:
+                    result = future.result()
+                    scrape.comment_count += result.saved_count
+                    scrape.video_ids.append(video.video_id)
+                    if scrape.failed.pop(video.video_id, None) is not None:
+                        scrape.recovered += 1
+                    if result.truncated:
+                        # a partial Bronze file must not look unchanged to --skip-unchanged
+                        recorded_counts.pop(video.video_id, None)
+                    elif scrape.current_counts.get(video.video_id) is not None:
+                        recorded_counts[video.video_id] = scrape.current_counts[video.video_id]
+                    print(f"{video.video_id} | title={video.title} | comments={result.saved_count} | path={result.path}")
+                except Exception as e:
+                     scrape.error_count += 1
+                     logger.exception("Video scrape failed | video_id=%s", video.video_id)
+                     print(f"Failed to scrape | video_id={video.video_id} | error={e}")
+                     previous = scrape.failed.get(video.video_id)
+                     scrape.failed[video.video_id] = FailedVideo(
+                         video_id=video.video_id,
+                         channel_id=scrape.channel_id,
+                         title=video.title,
+                         error=str(e),
+                         attempts=(previous.attempts if previous is not None else 0) + 1,
+                         last_failed_at_utc=datetime.now(tz=timezone.utc),
+                     )
+            if scrape.videos or not scrape.error_count:
+                failed_repo.save(scrape.channel_id, scrape.failed)
+                if args.retry_failed:
+                    if scrape.video_ids:
+                        _merge_retried_into_summary(args, scrape)
+                else:
+                    _save_channel_summary(args, scrape)
+    
+    comment_count_repo.save(recorded_counts)
+    return scrapes
+
+
+def _hand_off(video_id: str, on_scraped: Callable[[str], None]) -> Callable[[Future], None]:
+    def callback(future: Future) -> None:
+        if future.exception() is None:
+            on_scraped(video_id)
+    return callback
+
+
+def _save_channel_summary(args: argparse.Namespace, scrape: _ChannelScrape) -> None:
     finished_at_utc = datetime.now(tz=timezone.utc)
+    if scrape.unchanged:
+        # unchanged videos keep their Bronze data, so later channel steps still include them
+        done = set(scrape.video_ids) | {video.video_id for video in scrape.unchanged}
+        scrape.video_ids = [video.video_id for video in scrape.videos if video.video_id in done]
     logger.info(
-        "Channel scrape completed | channel_id=%s videos=%s comments=%s errors=%s",
-        channel_id,
-        videos.video_count,
-        comments_count,
-        errors,
+        "Channel scrape completed | channel_id=%s videos=%s comments=%s errors=%s skipped_unchanged=%s",
+        scrape.channel_id,
+        len(scrape.videos),
+        scrape.comment_count,
+        scrape.error_count,
+        len(scrape.unchanged),
     )
-    print(f"TOTAL | videos={videos.video_count} | comments={comments_count} | errors={errors}")
-
     try:
         summary = ChannelRunSummary(
-            channel_id=channel_id,
-            started_at_utc=start_at_utc,
+            channel_id=scrape.channel_id,
+            started_at_utc=scrape.started_at_utc,
             finished_at_utc=finished_at_utc,
-            video_ids=tuple(video_ids),
-            video_count=videos.video_count,
-            comment_count=comments_count,
-            error_count=errors,
+            video_ids=tuple(scrape.video_ids),
+            video_count=len(scrape.videos),
+            comment_count=scrape.comment_count,
+            error_count=scrape.error_count,
             video_limit=args.video_limit,
             comment_limit=args.comments_limit,
             published_after=args.published_after,
             published_before=args.published_before,
+            skipped_unchanged_count=len(scrape.unchanged),
         )
         repo = JSONChannelRunSummaryRepository(data_root=args.data_root)
-        path = repo.save(summary)
-        logger.info("Channel run summary saved | channel_id=%s path=%s", channel_id, path)
-        print(f"Metadata saved to: {path}")
+        scrape.summary_path = repo.save(summary)
+        logger.info("Channel run summary saved | channel_id=%s path=%s", scrape.channel_id, scrape.summary_path)
         
     except Exception:
-         logger.exception("Failed to save channel run summary | channel_id=%s", channel_id)
+         logger.exception("Failed to save channel run summary | channel_id=%s", scrape.channel_id)
+
+
+def _merge_retried_into_summary(args: argparse.Namespace, scrape: _ChannelScrape) -> None:
+    """
+    Add videos scraped outside a full channel run (recovered from the retry queue, refreshed by the
+    scheduler) to the channel's latest run summary (saved as a new run file).
+    """
+    repo = JSONChannelRunSummaryRepository(data_root=args.data_root)
+    try:
+        latest = repo.load_latest(scrape.channel_id)
+    except FileNotFoundError:
+        logger.warning("No run summary to merge retried videos into, saving a new one | channel_id=%s", scrape.channel_id)
+        _save_channel_summary(args, scrape)
+        return
     
+    known = set(latest.video_ids)
+    try:
+        summary = replace(
+            latest,
+            finished_at_utc=datetime.now(tz=timezone.utc),
+            video_ids=latest.video_ids + tuple(v for v in scrape.video_ids if v not in known),
+            comment_count=latest.comment_count + scrape.comment_count,
+            error_count=max(0, latest.error_count - scrape.recovered),
+        )
+        scrape.summary_path = repo.save(summary)
+        logger.info(
+            "Retried videos merged into channel run summary | channel_id=%s recovered=%s path=%s",
+            scrape.channel_id, scrape.recovered, scrape.summary_path,
+        )
+    except Exception:
+         logger.exception("Failed to save channel run summary | channel_id=%s", scrape.channel_id)
+
+
+def _print_cache_stats(cache: ResponseCache) -> None:
+    stats = cache.stats()
+    logger.info(
+        "HTTP response cache | hits=%s revalidated=%s misses=%s size_bytes=%s",
+        stats.hits, stats.revalidated, stats.misses, cache.size_bytes(),
+    )
+    print(f"CACHE | hits={stats.hits} | revalidated={stats.revalidated} | misses={stats.misses}")
+
+
+def _print_transport_and_quota(
+        client: YouTubeApiClient, quota: QuotaLedger, key_pool: ApiKeyPool, *, deferred: int, cache: bool = False
+) -> None:
+    http_stats = client.transport.stats()
+    logger.info(
+        "HTTP transport | requests=%s connections=%s reused=%s wire_bytes=%s decoded_bytes=%s",
+        http_stats.request_count,
+        http_stats.connection_count,
+        http_stats.reused_count,
+        http_stats.wire_bytes,
+        http_stats.decoded_bytes,
+    )
+    print(
+        f"HTTP | requests={http_stats.request_count} | "
+        f"connections={http_stats.connection_count} | reused={http_stats.reused_count} | "
+        f"wire_bytes={http_stats.wire_bytes} | decoded_bytes={http_stats.decoded_bytes}"
+    )
+    if cache:
+        _print_cache_stats(client.response_cache)
+    used = sum(quota.used(key) for key in key_pool.keys)
+    print(f"QUOTA | used={used} | remaining={client.remaining_quota()} | deferred={deferred}")
+    if len(key_pool.keys) > 1:
+        retired = key_pool.retired()
+        for key in key_pool.keys:
+            print(
+                f"KEY | key={key_fingerprint(key)} | used={quota.used(key)} | "
+                f"remaining={quota.remaining(key)} | status={retired.get(key, 'active')}"
+            )
+
+
+def run_scrape_channel(args: argparse.Namespace) -> int:
+    if not _validate_scrape_channel_args(args):
+        return 2
+    return _run_single_channel(args)
+
+
+def _run_single_channel(args: argparse.Namespace, preprocess: PreprocessQueue | None = None) -> int:
+    logger.info("Looking up YouTube API key")
+    key_pool = _load_api_key_pool()
+    
+    channel_id = args.channelId
+
+    if key_pool:
+            logger.info("Using YouTube API client | channel_ref=%s keys=%s", args.channelId, len(key_pool.keys))
+            client, quota = _build_scrape_client(args, key_pool)
+            channel_id = _resolve_channel_ref(
+                client=client,
+                data_root=args.data_root,
+                raw_input=args.channelId,
+                max_age=timedelta(days=args.ref_ttl_days),
+                refresh=args.refresh_ref,
+            )
+    else:
+            logger.error("YouTube API key not found")
+            return 2
+    
+    discovery_cost = 0 if args.retry_failed else _discovery_cost(args.discovery_engine)
+    if key_pool.remaining(quota) < discovery_cost:
+        logger.error(
+            "Daily quota budget too low for discovery | remaining=%s needed=%s",
+            key_pool.remaining(quota),
+            discovery_cost,
+        )
+        return 2
+    
+    try:
+        [scrape] = _scrape_channels(
+            args,
+            client=client,
+            quota=quota,
+            key_pool=key_pool,
+            channel_ids=[channel_id],
+            on_scraped=preprocess.submit if preprocess is not None else None,
+        )
+    finally:
+        preprocessed = preprocess.close() if preprocess is not None else {}
+    if not scrape.videos and scrape.error_count:
+        client.close()
+        return 1
+    
+    preprocess_errors = 0
+    for video_id, outcome in preprocessed.items():
+        if isinstance(outcome, Exception):
+            preprocess_errors += 1
+            print(f"Failed to preprocess | video_id={video_id} | error={outcome}")
+        else:
+            print(f"Saved Silver parquet to: {outcome}")
+    
+    total = (
+        f"TOTAL | videos={len(scrape.videos)} | comments={scrape.comment_count} | errors={scrape.error_count} | "
+        f"skipped_unchanged={len(scrape.unchanged)} | recovered={scrape.recovered} | queued_failed={len(scrape.failed)}"
+    )
+    if preprocess is not None:
+        total += f" | preprocessed={len(preprocessed) - preprocess_errors} | preprocess_errors={preprocess_errors}"
+    print(total)
+    _print_transport_and_quota(client, quota, key_pool, deferred=len(scrape.deferred), cache=args.http_cache)
+    client.close()
+    if scrape.summary_path is not None:
+        print(f"Metadata saved to: {scrape.summary_path}")
+    
+    return 1 if preprocess_errors else 0
+
+
+def run_ingest_channel(args: argparse.Namespace) -> int:
+    """
+    scrape-channel and preprocess-channel in one process: every video goes to the preprocessing
+    workers as soon as its Bronze file is written, so Silver files appear while the channel is still
+    being scraped. The queue between the two is bounded (--queue-size); when preprocessing falls
+    behind, scrape workers wait for a free slot.
+    """
+    if not _validate_scrape_channel_args(args):
+        return 2
+    for name in ("batch_size", "preprocess_workers", "queue_size"):
+        if getattr(args, name) < 1:
+            logger.error("Invalid argument | --%s must be >= 1", name.replace("_", "-"))
+            return 2
+    
+    service = PreprocessCommentsService(
+        bronze_repo=JSONLCommentsRepository(args.bronze_dir),
+        silver_repo=ParquetSilverCommentsRepository(args.silver_dir),
+        text_preprocessor=TextPreprocessor(),
+    )
+    preprocess = PreprocessQueue(
+        service,
+        workers=args.preprocess_workers,
+        maxsize=args.queue_size,
+        batch_size=args.batch_size,
+    )
+    try:
+        return _run_single_channel(args, preprocess=preprocess)
+    finally:
+        preprocess.close() # no-op once the run collected the results
+
+
+def _read_channel_refs(path: Path) -> list[str]:
+    """One channel reference per line; blank lines and # comments are ignored."""
+    refs: list[str] = []
+    with path.open("r", encoding="utf-8") as f:
+        for line in f:
+            ref = line.split("#", 1)[0].strip()
+            if ref:
+                refs.append(ref)
+    return refs
+
+
+def run_scrape_channels(args: argparse.Namespace) -> int:
+    if not _validate_scrape_channel_args(args):
+        return 2
+    
+    refs_path = Path(args.refs_file)
+    if not refs_path.exists():
+        logger.error("Channel refs file not found | path=%s", refs_path)
+        return 2
+    refs = _read_channel_refs(refs_path)
+    if not refs:
+        logger.error("Channel refs file is empty | path=%s", refs_path)
+        return 2
+    
+    logger.info("Looking up YouTube API key")
+    key_pool = _load_api_key_pool()
+    if not key_pool:
+        logger.error("YouTube API key not found")
+        return 2
+    
+    client, quota = _build_scrape_client(args, key_pool)
+    
+    channel_ids: list[str] = []
+    failed = 0
+    for ref in refs:
+        try:
+            channel_id = _resolve_channel_ref(
+                client=client,
+                data_root=args.data_root,
+                raw_input=ref,
+                max_age=timedelta(days=args.ref_ttl_days),
+                refresh=args.refresh_ref,
+            )
+        except Exception as e:
+            failed += 1
+            logger.exception("Channel reference resolution failed | channel_ref=%s", ref)
+            print(f"Failed to resolve | channel_ref={ref} | error={e}")
+            continue
+        if channel_id not in channel_ids:
+            channel_ids.append(channel_id)
+    
+    scrapes = _scrape_channels(args, client=client, quota=quota, key_pool=key_pool, channel_ids=channel_ids)
+    
+    for scrape in scrapes:
+        if not scrape.videos and scrape.error_count:
+            failed += 1
+        print(
+            f"CHANNEL | channel_id={scrape.channel_id} | videos={len(scrape.videos)} | "
+            f"comments={scrape.comment_count} | errors={scrape.error_count} | "
+            f"skipped_unchanged={len(scrape.unchanged)} | deferred={len(scrape.deferred)} | "
+            f"summary={scrape.summary_path}"
+        )
+    print(
+        f"TOTAL | channels={len(scrapes)} | failed_channels={failed} | "
+        f"videos={sum(len(s.videos) for s in scrapes)} | comments={sum(s.comment_count for s in scrapes)} | "
+        f"errors={sum(s.error_count for s in scrapes)} | skipped_unchanged={sum(len(s.unchanged) for s in scrapes)} | "
+        f"recovered={sum(s.recovered for s in scrapes)} | queued_failed={sum(len(s.failed) for s in scrapes)}"
+    )
+    _print_transport_and_quota(
+        client, quota, key_pool, deferred=sum(len(s.deferred) for s in scrapes), cache=args.http_cache
+    )
+    client.close()
+    
+    return 1 if failed else 0
+
+def _validate_schedule_args(args: argparse.Namespace) -> bool:
+    if args.retry_failed or args.resume or args.skip_unchanged or args.comment_budget is not None:
+        logger.error(
+            "Invalid argument | schedule always scrapes incrementally and picks videos itself; "
+            "--retry-failed, --resume, --skip-unchanged and --comment-budget don't apply"
+        )
+        return False
+    if args.interval_minutes <= 0 or args.cycles < 0:
+        logger.error("Invalid argument | --interval-minutes must be > 0 and --cycles >= 0")
+        return False
+    if args.min_new_comments < 0 or args.min_interval_hours < 0 or args.rediscover_hours < 0:
+        logger.error("Invalid argument | --min-new-comments, --min-interval-hours and --rediscover-hours must be >= 0")
+        return False
+    if args.units_per_cycle is not None and args.units_per_cycle < 1:
+        logger.error("Invalid argument | --units-per-cycle must be >= 1")
+        return False
+    return True
+
+
+@dataclass(slots=True)
+class _ScheduleCycle:
+    """Outcome of one scheduler cycle."""
+    tracked: int = 0
+    due: int = 0
+    scraped: int = 0
+    comment_count: int = 0
+    error_count: int = 0
+    deferred: int = 0
+
+
+def _observe_channels(
+        args: argparse.Namespace,
+        *,
+        client: YouTubeApiClient,
+        pool: ThreadPoolExecutor,
+        states: dict[str, dict[str, VideoRefreshState]],
+        discovered_at: dict[str, datetime],
+        now: datetime,
+) -> None:
+    """
+    Refresh what the scheduler knows: rediscover channels whose video list is older than
+    --rediscover-hours (new uploads start being tracked) and read the commentCount of every tracked
+    video that discovery didn't report (videos.list, 1 unit per 50 videos).
+    """
+    rediscover = [
+        channel_id for channel_id in states
+        if channel_id not in discovered_at or now - discovered_at[channel_id] >= timedelta(hours=args.rediscover_hours)
+    ]
+    discoveries = [pool.submit(_discover_channel_videos, args, client, channel_id) for channel_id in rediscover]
+    counts: dict[str, int | None] = {}
+    for channel_id, discovery in zip(rediscover, discoveries, strict=True):
+        try:
+            videos = discovery.result()
+        except Exception as e:
+            logger.exception("Channel discovery failed | channel_id=%s", channel_id)
+            print(f"Failed to discover | channel_id={channel_id} | error={e}")
+            continue
+        discovered_at[channel_id] = now
+        for video in videos:
+            if video.video_id not in states[channel_id]:
+                states[channel_id][video.video_id] = VideoRefreshState(
+                    video_id=video.video_id,
+                    channel_id=channel_id,
+                    title=video.title,
+                    published_at=video.published_at,
+                )
+            if video.comment_count is not None:
+                counts[video.video_id] = video.comment_count
+    
+    missing = [video_id for channel in states.values() for video_id in channel if video_id not in counts]
+    if missing:
+        try:
+            stats = client.fetch_video_statistics(missing)
+            # deleted or private videos are missing from videos.list, like videos with comments disabled they have no count
+            counts.update({video_id: stats[video_id].comment_count if video_id in stats else None for video_id in missing})
+        except ValueError as e:
+            logger.warning("Comment count check failed, scheduling from stored state | error=%s", e)
+    
+    for channel in states.values():
+        for video_id, state in channel.items():
+            if video_id in counts:
+                channel[video_id] = observe_comment_count(state, counts[video_id], now)
+
+
+def _run_schedule_cycle(
+        args: argparse.Namespace,
+        *,
+        client: YouTubeApiClient,
+        quota: QuotaLedger,
+        key_pool: ApiKeyPool,
+        pool: ThreadPoolExecutor,
+        states: dict[str, dict[str, VideoRefreshState]],
+        discovered_at: dict[str, datetime],
+) -> _ScheduleCycle:
+    """
+    One pass of the scheduler: observe, rank the due videos of all channels by expected new comments,
+    scrape as many of them as the quota allows (incrementally) and persist the state.
+    """
+    started_at_utc = datetime.now(tz=timezone.utc)
+    cycle = _ScheduleCycle()
+    _observe_channels(args, client=client, pool=pool, states=states, discovered_at=discovered_at, now=started_at_utc)
+    
+    due = due_for_refresh(
+        [state for channel in states.values() for state in channel.values()],
+        now=started_at_utc,
+        min_new_comments=args.min_new_comments,
+        min_interval=timedelta(hours=args.min_interval_hours),
+    )
+    cycle.tracked = sum(len(channel) for channel in states.values())
+    cycle.due = len(due)
+    
+    def refresh_cost(item: tuple[VideoRefreshState, float]) -> int:
+        expected = math.ceil(item[1])
+        return estimate_comment_units(min(expected, args.comments_limit) if args.comments_limit else expected)
+    
+    remaining = key_pool.remaining(quota)
+    if args.units_per_cycle is not None:
+        remaining = min(remaining, args.units_per_cycle)
+    planned, deferred = plan_within_budget(due, remaining=remaining, unit_cost=refresh_cost)
+    cycle.deferred = len(deferred)
+    if deferred:
+        logger.info("Quota budget covers only part of the due videos | planned=%s deferred=%s", len(planned), len(deferred))
+    
+    repo = JSONLCommentsRepository(data_dir=args.bronze_dir, codec=args.bronze_codec)
+    futures = [
+        pool.submit(
+            _scrape_video,
+            video_id=state.video_id,
+            client=client,
+            repo=repo,
+            limit=args.comments_limit,
+            overwrite=True,
+            incremental=True,
+            prefetch_pages=args.prefetch_pages,
+            include_replies=args.replies,
+            reply_workers=args.reply_workers,
+        )
+        for state, _ in planned
+    ]
+    
+    refreshed: dict[str, _ChannelScrape] = {}
+    for (state, expected), future in zip(planned, futures, strict=True):
+        try:
+            result = future.result()
+        except Exception as e:
+            cycle.error_count += 1
+            logger.exception("Video refresh failed | video_id=%s", state.video_id)
+            print(f"Failed to scrape | video_id={state.video_id} | error={e}")
+            continue
+        states[state.channel_id][state.video_id] = mark_scraped(state, datetime.now(tz=timezone.utc))
+        cycle.scraped += 1
+        cycle.comment_count += result.saved_count
+        scrape = refreshed.setdefault(
+            state.channel_id, _ChannelScrape(channel_id=state.channel_id, started_at_utc=started_at_utc)
+        )
+        scrape.videos.append(ChannelVideo(video_id=state.video_id, channel_id=state.channel_id, title=state.title))
+        scrape.video_ids.append(state.video_id)
+        scrape.comment_count += result.saved_count
+        print(
+            f"{state.video_id} | channel_id={state.channel_id} | expected={expected:.0f} | "
+            f"comments={result.saved_count} | path={result.path}"
+        )
+    
+    state_repo = JSONRefreshStateRepository(data_root=args.data_root)
+    for channel_id, channel in states.items():
+        state_repo.save(channel_id, channel, discovered_at_utc=discovered_at.get(channel_id))
+    for scrape in refreshed.values():
+        _merge_retried_into_summary(args, scrape)
+    return cycle
+
+
+def run_schedule(args: argparse.Namespace) -> int:
+    """
+    Long-running refresh loop over the channels of a refs file.
+
+    Every --interval-minutes the scheduler reads the comment counts of all tracked videos, ranks them
+    by the comments expected since their last scrape (count growth, smoothed growth rate, age) and
+    spends the quota on the most active ones first. Per-video state and the last discovery time live in
+    data/state/refresh, so a restarted scheduler picks up where it stopped.
+    """
+    if not _validate_scrape_channel_args(args) or not _validate_schedule_args(args):
+        return 2
+    
+    refs_path = Path(args.refs_file)
+    if not refs_path.exists():
+        logger.error("Channel refs file not found | path=%s", refs_path)
+        return 2
+    refs = _read_channel_refs(refs_path)
+    if not refs:
+        logger.error("Channel refs file is empty | path=%s", refs_path)
+        return 2
+    
+    logger.info("Looking up YouTube API key")
+    key_pool = _load_api_key_pool()
+    if not key_pool:
+        logger.error("YouTube API key not found")
+        return 2
+    
+    client, quota = _build_scrape_client(args, key_pool)
+    state_repo = JSONRefreshStateRepository(data_root=args.data_root)
+    states: dict[str, dict[str, VideoRefreshState]] = {}
+    discovered_at: dict[str, datetime] = {} # persisted, so a restart doesn't rediscover every channel
+    for ref in refs:
+        try:
+            channel_id = _resolve_channel_ref(
+                client=client,
+                data_root=args.data_root,
+                raw_input=ref,
+                max_age=timedelta(days=args.ref_ttl_days),
+                refresh=args.refresh_ref,
+            )
+        except Exception as e:
+            logger.exception("Channel reference resolution failed | channel_ref=%s", ref)
+            print(f"Failed to resolve | channel_ref={ref} | error={e}")
+            continue
+        if channel_id not in states:
+            states[channel_id] = state_repo.load(channel_id)
+            last_discovery = state_repo.load_discovered_at(channel_id)
+            if last_discovery is not None:
+                discovered_at[channel_id] = last_discovery
+    if not states:
+        client.close()
+        return 1
+    
+    totals = _ScheduleCycle()
+    cycles = 0
+    try:
+        with ThreadPoolExecutor(max_workers=args.jobs, thread_name_prefix="schedule") as pool:
+            while True:
+                cycle = _run_schedule_cycle(
+                    args,
+                    client=client,
+                    quota=quota,
+                    key_pool=key_pool,
+                    pool=pool,
+                    states=states,
+                    discovered_at=discovered_at,
+                )
+                cycles += 1
+                totals.scraped += cycle.scraped
+                totals.comment_count += cycle.comment_count
+                totals.error_count += cycle.error_count
+                print(
+                    f"CYCLE | n={cycles} | tracked={cycle.tracked} | due={cycle.due} | scraped={cycle.scraped} | "
+                    f"comments={cycle.comment_count} | errors={cycle.error_count} | deferred={cycle.deferred} | "
+                    f"quota_remaining={client.remaining_quota()}"
+                )
+                if args.cycles and cycles >= args.cycles:
+                    break
+                time.sleep(args.interval_minutes * 60)
+    except KeyboardInterrupt:
+        logger.info("Scheduler stopped | cycles=%s", cycles)
+    
+    print(
+        f"TOTAL | cycles={cycles} | channels={len(states)} | scraped={totals.scraped} | "
+        f"comments={totals.comment_count} | errors={totals.error_count}"
+    )
+    _print_transport_and_quota(client, quota, key_pool, deferred=0, cache=args.http_cache)
+    client.close()
     return 0
 
+
 def run_preprocess_channel(args: argparse.Namespace) -> int:
     logger.info("Loading latest channel run summary | channel_id=%s", args.channelId)
     
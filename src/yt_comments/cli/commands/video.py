@@ -13,39 +13,91 @@ from yt_comments.analysis.corpus.service import CorpusService
 from yt_comments.analysis.tfidf.models import TfidfConfig
 from yt_comments.analysis.tfidf.service import TfidfService
 
-from yt_comments.cli.helpers import _scrape_video, _silver_parquet_path, logger
+from yt_comments.cli.helpers import _load_api_key_pool, _scrape_video, _silver_parquet_path, logger
 
+from yt_comments.ingestion.quota import QuotaLedger
+from yt_comments.ingestion.retry import RetryPolicy
 from yt_comments.ingestion.video_id_extractor import extract_video_id
-from yt_comments.ingestion.youtube_api_client import YouTubeApiClient
+from yt_comments.ingestion.youtube_api_client import DEFAULT_BASE_URL, YouTubeApiClient
 
 from yt_comments.nlp.stopwords import STOPWORDS
 
 from yt_comments.preprocessing.preprocess_service import PreprocessCommentsService
 from yt_comments.preprocessing.text_preprocessor import TextPreprocessor
 
+from yt_comments.storage.bronze_codecs import codec_available
 from yt_comments.storage.bronze_comments_repository import JSONLCommentsRepository
 from yt_comments.storage.gold_basic_stats_parquet_repository import ParquetBasicStatsRepository
 from yt_comments.storage.gold_corpus_df_parquet_repository import ParquetCorpusDfRepository
 from yt_comments.storage.gold_tfidf_keywords_parquet_repository import ParquetTfidfKeywordsRepository
+from yt_comments.storage.quota_ledger_repository import JSONQuotaLedgerRepository
 from yt_comments.storage.silver_comments_repository import ParquetSilverCommentsRepository
 
 
 
 def run_scrape(args: argparse.Namespace) -> int:
     video_id = extract_video_id(args.video)
+    
+    if args.max_attempts < 1:
+        logger.error("Invalid argument | --max-attempts must be >= 1")
+        return 2
+    
+    if args.prefetch_pages < 0:
+        logger.error("Invalid argument | --prefetch-pages must be >= 0")
+        return 2
+    
+    if args.reply_workers < 1:
+        logger.error("Invalid argument | --reply-workers must be >= 1")
+        return 2
+    
+    if args.incremental and args.resume:
+        logger.error("Invalid argument | --incremental and --resume can't be combined")
+        return 2
+    
+    if not codec_available(args.bronze_codec):
+        logger.error("Invalid argument | --bronze-codec %s is not available in this pyarrow build", args.bronze_codec)
+        return 2
+    
+    if args.daily_quota < 1:
+        logger.error("Invalid argument | --daily-quota must be >= 1")
+        return 2
 
     logger.info("Looking up YouTube API key")
-    api_key = os.getenv("YOUTUBE_API_KEY")
-    if api_key: 
-            logger.info("Using YouTube API Client")
-            client = YouTubeApiClient(api_key=api_key) 
+    key_pool = _load_api_key_pool()
+    if key_pool: 
+            logger.info("Using YouTube API Client | keys=%s", len(key_pool.keys))
+            quota = QuotaLedger(
+                daily_budget=args.daily_quota,
+                repo=JSONQuotaLedgerRepository(data_root=args.data_root),
+            )
+            client = YouTubeApiClient(
+                api_key=key_pool.keys[0],
+                key_pool=key_pool,
+                base_url=os.getenv("YOUTUBE_API_BASE_URL", DEFAULT_BASE_URL),
+                retry_policy=RetryPolicy(max_attempts=args.max_attempts),
+                quota=quota,
+            )
     else:
             logger.error("YouTube API key not found")
             return 2
 
-    repo = JSONLCommentsRepository(data_dir=args.bronze_dir)
+    repo = JSONLCommentsRepository(data_dir=args.bronze_dir, codec=args.bronze_codec)
     logger.info("Starting comment scrape | video_id=%s", video_id)
-    result = _scrape_video(video_id=video_id, client=client, repo=repo, limit=args.limit, overwrite=args.overwrite)
+    try:
+        result = _scrape_video(
+            video_id=video_id,
+            client=client,
+            repo=repo,
+            limit=args.limit,
+            overwrite=args.overwrite,
+            resume=args.resume,
+            incremental=args.incremental,
+            prefetch_pages=args.prefetch_pages,
+            include_replies=args.replies,
+            reply_workers=args.reply_workers,
+        )
+    finally:
+        client.close()
     logger.info("Comment scrape completed | video_id=%s saved_count=%s path=%s", video_id, result.saved_count, result.path)
 
     print(f"Saved {result.saved_count} comments to: {result.path}")
@@ -1,9 +1,13 @@
 import argparse
 import logging
+import os
 
-from datetime import datetime, timezone
+from datetime import datetime, timedelta, timezone
 from pathlib import Path
 
+from yt_comments.ingestion.api_key_pool import ApiKeyPool
+from yt_comments.ingestion.channel_ref_parser import parse_channel_ref
+from yt_comments.ingestion.response_cache import ResponseCache
 from yt_comments.ingestion.scrape_service import ScrapeCommentsService
 from yt_comments.ingestion.youtube_api_client import YouTubeApiClient
 from yt_comments.storage.bronze_comments_repository import JSONLCommentsRepository
@@ -38,6 +42,25 @@ def _parse_cli_datetime(value: str) -> datetime:
 
     return dt
 
+def _load_api_key_pool() -> ApiKeyPool | None:
+    """
+    API keys from YOUTUBE_API_KEYS (comma-separated) and YOUTUBE_API_KEY, or None if neither is set.
+    The first key stays the client's primary api_key.
+    """
+    raw_keys = os.getenv("YOUTUBE_API_KEYS", "").split(",") + [os.getenv("YOUTUBE_API_KEY", "")]
+    keys = [key.strip() for key in raw_keys if key.strip()]
+    return ApiKeyPool(keys) if keys else None
+
+def _build_response_cache(args: argparse.Namespace) -> ResponseCache | None:
+    """Disk cache for discovery pages under <data_root>/cache/http, if --http-cache is set."""
+    if not args.http_cache:
+        return None
+    return ResponseCache(
+        Path(args.data_root) / "cache" / "http",
+        ttl=args.http_cache_ttl_hours * 3600,
+        max_bytes=args.http_cache_max_mb * 1024 * 1024,
+    )
+
 def _scrape_video(
           *,
           video_id: str,
@@ -45,13 +68,50 @@ def _scrape_video(
           repo: JSONLCommentsRepository,
           limit: int | None,
           overwrite: bool,
+          resume: bool = False,
+          incremental: bool = False,
+          prefetch_pages: int = 0,
+          include_replies: bool = False,
+          reply_workers: int = 4,
 ):
-     service = ScrapeCommentsService(client=client, repo=repo)
-     return service.run(video_id, overwrite=overwrite, limit=limit)
+     service = ScrapeCommentsService(
+          client=client,
+          repo=repo,
+          prefetch_pages=prefetch_pages,
+          include_replies=include_replies,
+          reply_workers=reply_workers,
+     )
+     return service.run(video_id, overwrite=overwrite, limit=limit, resume=resume, incremental=incremental)
 
 def _save_channel_id_ref_mapping(*, data_root: str, raw_input: str, channel_id: str) -> Path:
      return JSONChannelRefRepository(data_root=Path(data_root)).save(raw_input=raw_input, channel_id=channel_id)
 
+def _resolve_channel_ref(
+        *,
+        client: YouTubeApiClient,
+        data_root: str,
+        raw_input: str,
+        max_age: timedelta | None = None,
+        refresh: bool = False,
+) -> str:
+    """
+    Channel id for a user-provided ref: from the saved ref mapping if it was resolved within `max_age`,
+    otherwise (or with refresh=True) via channels.list, saving the new mapping.
+    """
+    repo = JSONChannelRefRepository(data_root=Path(data_root))
+    if not refresh:
+        try:
+            channel_id = repo.load(raw_input, max_age=max_age)
+            logger.info("Channel reference resolved from mapping | input=%s channel_id=%s", raw_input, channel_id)
+            return channel_id
+        except (FileNotFoundError, KeyError):
+            pass
+    
+    channel_id = client.resolve_channel_id(parse_channel_ref(raw_input))
+    _save_channel_id_ref_mapping(data_root=data_root, raw_input=raw_input, channel_id=channel_id)
+    logger.info("Channel reference resolved via API | input=%s channel_id=%s", raw_input, channel_id)
+    return channel_id
+
 def _load_channel_id_ref_mapping(*, data_root: str, raw_input: str) -> str:
     try: 
         return JSONChannelRefRepository(data_root=Path(data_root)).load(raw_input=raw_input)
@@ -3,10 +3,12 @@ from __future__ import annotations
 import argparse
 
 from yt_comments.cli.helpers import _parse_cli_datetime
+from yt_comments.ingestion.comment_allocation import ALLOCATION_WEIGHTINGS
+from yt_comments.storage.bronze_codecs import BRONZE_CODECS
 
 from yt_comments.cli.commands.channel import (
-    run_channel_stats, run_discover_vids, run_distinctive_keywords, run_preprocess_channel,
-    run_report_channel, run_scrape_channel, run_tfidf_channel
+    run_channel_stats, run_discover_vids, run_distinctive_keywords, run_ingest_channel, run_preprocess_channel,
+    run_report_channel, run_schedule, run_scrape_channel, run_scrape_channels, run_tfidf_channel
 )
 from yt_comments.cli.commands.video import (
     run_corpus, run_preprocess, run_scrape, run_stats, run_tfidf
@@ -51,6 +53,58 @@ def build_parser() -> argparse.ArgumentParser:
         default=True,
         help="Overwrite existing Bronze file if it exists",
     )
+    scrape.add_argument(
+        "--bronze-codec",
+        choices=list(BRONZE_CODECS),
+        default="none",
+        help="Compression of new Bronze files: none (.jsonl), gzip (.jsonl.gz) or zstd (.jsonl.zst); "
+        "reads detect the codec from the file name (default: none)",
+    )
+    scrape.add_argument(
+        "--max-attempts", 
+        type=int, 
+        default=5, 
+        help="Maximum attempts per API request on transient errors (default: 5)"
+    )
+    scrape.add_argument(
+        "--resume",
+        action="store_true",
+        help="Continue unfinished scrapes from their last checkpoint and append to the partial Bronze file",
+    )
+    scrape.add_argument(
+        "--prefetch-pages",
+        type=int,
+        default=0,
+        help="Pipeline pagination: request up to this many pages ahead while the current one "
+        "is parsed and written (default: 0, sequential)",
+    )
+    scrape.add_argument(
+        "--replies",
+        action="store_true",
+        help="Also fetch replies; only threads with more than 5 replies cost extra requests",
+    )
+    scrape.add_argument(
+        "--reply-workers",
+        type=int,
+        default=4,
+        help="Concurrent requests for threads whose replies aren't all inlined (default: 4)",
+    )
+    scrape.add_argument(
+        "--incremental",
+        action="store_true",
+        help="Fetch only comments newer than the newest one already in Bronze and append them",
+    )
+    scrape.add_argument(
+        "--data-root", 
+        default="data", 
+        help="Root directory of the quota ledger state (default: data)"
+    )
+    scrape.add_argument(
+        "--daily-quota", 
+        type=int, 
+        default=10000, 
+        help="Daily YouTube API quota budget in units, tracked under --data-root (default: 10000)"
+    )
     scrape.set_defaults(func=run_scrape)
     
     # PREPROCESS
@@ -322,6 +376,20 @@ def build_parser() -> argparse.ArgumentParser:
         default=100, 
         help="Maximum number of videos to return"
     )
+    discover_vids.add_argument(
+        "--discovery-engine",
+        choices=["search", "uploads"],
+        default="search",
+        help="How to list channel videos: search.list (100 units/page) or the uploads playlist "
+        "(about 2 units per 50 videos, includes view/comment counts) (default: search)",
+    )
+    discover_vids.add_argument(
+        "--discovery-shards",
+        type=int,
+        default=1,
+        help="Split the search window into this many date ranges discovered in parallel; ranges that "
+        "hit the ~500 result cap are bisected. Each range costs at least 100 units (default: 1)",
+    )
     discover_vids.add_argument(
         "--published-after", 
         type=_parse_cli_datetime, 
@@ -337,6 +405,42 @@ def build_parser() -> argparse.ArgumentParser:
         default="data", 
         help="Project data directory (default: data)"
     )
+    discover_vids.add_argument(
+        "--daily-quota", 
+        type=int, 
+        default=10000, 
+        help="Daily YouTube API quota budget in units, tracked under --data-root (default: 10000)"
+    )
+    discover_vids.add_argument(
+        "--http-cache",
+        action="store_true",
+        help="Cache search/playlistItems/channels responses under <data-root>/cache/http and "
+        "revalidate them with ETags once they are older than --http-cache-ttl-hours",
+    )
+    discover_vids.add_argument(
+        "--http-cache-ttl-hours",
+        type=float,
+        default=6.0,
+        help="Serve cached discovery pages without any request for this long (default: 6)",
+    )
+    discover_vids.add_argument(
+        "--http-cache-max-mb",
+        type=int,
+        default=256,
+        help="Size limit of the response cache; least recently used pages are evicted (default: 256)",
+    )
+    discover_vids.add_argument(
+        "--ref-ttl-days",
+        type=float,
+        default=30.0,
+        help="Reuse a saved channel ref -> channel id mapping for this many days before resolving it "
+        "again with channels.list (default: 30)",
+    )
+    discover_vids.add_argument(
+        "--refresh-ref",
+        action="store_true",
+        help="Resolve the channel reference with the API even if a saved mapping exists",
+    )
     discover_vids.set_defaults(func=run_discover_vids)
     
     # SCRAPE-CHANNEL
@@ -348,45 +452,103 @@ def build_parser() -> argparse.ArgumentParser:
         "channelId", 
         help="YouTube channel reference (ID, @handle, or URL)"
     )
-    scrape_channel.add_argument(
-        "--video-limit", 
-        type=int, 
-        default=100, 
-        help="Maximum number of videos to process"
+    _add_channel_scrape_args(scrape_channel)
+    scrape_channel.set_defaults(func=run_scrape_channel)
+
+    # SCRAPE-CHANNELS
+    scrape_channels = subparser.add_parser(
+        "scrape-channels", 
+        help="Fetch comments for videos from several channels on one shared worker pool and quota budget"
     )
-    scrape_channel.add_argument(
-        "--comments-limit", 
-        type=int, 
-        default=5000, 
-        help="Maximum number of comments per video"
+    scrape_channels.add_argument(
+        "refs_file", 
+        help="Text file with one channel reference (ID, @handle, or URL) per line; # starts a comment"
     )
-    scrape_channel.add_argument(
-        "--published-after", 
-        type=_parse_cli_datetime, 
-        help="Include only videos published after this date"
+    _add_channel_scrape_args(scrape_channels)
+    scrape_channels.set_defaults(func=run_scrape_channels)
+
+    # INGEST-CHANNEL
+    ingest_channel = subparser.add_parser(
+        "ingest-channel", 
+        help="Scrape a channel and build Silver parquet per video as soon as its scrape completes"
     )
-    scrape_channel.add_argument(
-        "--published-before", 
-        type=_parse_cli_datetime, 
-        help="Include only videos published before this date"
+    ingest_channel.add_argument(
+        "channelId", 
+        help="YouTube channel reference (ID, @handle, or URL)"
     )
-    scrape_channel.add_argument(
-        "--data-root", 
-        default="data", 
-        help="Project data directory (default: data)"
+    _add_channel_scrape_args(ingest_channel)
+    ingest_channel.add_argument(
+        "--silver-dir", 
+        default="data/silver", 
+        help="Output Silver directory (default: data/silver)"
     )
-    scrape_channel.add_argument(
-        "--bronze-dir", 
-        default="data/bronze", 
-        help="Output directory for Bronze data (default: data/bronze)"
+    ingest_channel.add_argument(
+        "--batch-size", 
+        type=int, 
+        default=5000, 
+        help="Number of rows per parquet write batch"
     )
-    scrape_channel.add_argument(
-        "--overwrite",
-        action=argparse.BooleanOptionalAction,
-        default=True,
-        help="Overwrite existing Bronze files if they exist",
+    ingest_channel.add_argument(
+        "--preprocess-workers",
+        type=int,
+        default=1,
+        help="Threads converting scraped videos to Silver (default: 1)",
     )
-    scrape_channel.set_defaults(func=run_scrape_channel)
+    ingest_channel.add_argument(
+        "--queue-size",
+        type=int,
+        default=8,
+        help="Scraped videos that may wait for preprocessing before scraping pauses (default: 8)",
+    )
+    ingest_channel.set_defaults(func=run_ingest_channel)
+
+    # SCHEDULE
+    schedule = subparser.add_parser(
+        "schedule", 
+        help="Keep channels fresh: repeatedly re-scrape the videos with the most new comments within the quota"
+    )
+    schedule.add_argument(
+        "refs_file", 
+        help="Text file with one channel reference (ID, @handle, or URL) per line; # starts a comment"
+    )
+    _add_channel_scrape_args(schedule)
+    schedule.add_argument(
+        "--interval-minutes",
+        type=float,
+        default=60.0,
+        help="Time between scheduler cycles (default: 60)",
+    )
+    schedule.add_argument(
+        "--cycles",
+        type=int,
+        default=0,
+        help="Stop after this many cycles (default: 0, run until interrupted)",
+    )
+    schedule.add_argument(
+        "--min-new-comments",
+        type=float,
+        default=10.0,
+        help="Re-scrape a video only once this many new comments are expected (default: 10)",
+    )
+    schedule.add_argument(
+        "--min-interval-hours",
+        type=float,
+        default=6.0,
+        help="Minimum time between two scrapes of the same video (default: 6)",
+    )
+    schedule.add_argument(
+        "--rediscover-hours",
+        type=float,
+        default=24.0,
+        help="How often channel video lists are rediscovered to pick up new uploads (default: 24)",
+    )
+    schedule.add_argument(
+        "--units-per-cycle",
+        type=int,
+        default=None,
+        help="Quota units one cycle may spend on scraping, so the daily budget lasts (default: all remaining)",
+    )
+    schedule.set_defaults(func=run_schedule)
 
     # PREPROCESS-CHANNEL
     preprocess_channel = subparser.add_parser(
@@ -644,4 +806,224 @@ def build_parser() -> argparse.ArgumentParser:
     )
     report_channel.set_defaults(func=run_report_channel)
     
-    return parser
\ No newline at end of file
+    return parser
+
+
+def _add_channel_scrape_args(parser: argparse.ArgumentParser) -> None:
+    """Options shared by the commands that scrape channels (scrape-channel(s), ingest-channel, schedule)."""
+    parser.add_argument(
+        "--video-limit", 
+        type=int, 
+        default=100, 
+        help="Maximum number of videos to process per channel"
+    )
+    parser.add_argument(
+        "--comments-limit", 
+        type=int, 
+        default=5000, 
+        help="Maximum number of comments per video"
+    )
+    parser.add_argument(
+        "--discovery-engine",
+        choices=["search", "uploads"],
+        default="search",
+        help="How to list channel videos: search.list (100 units/page) or the uploads playlist "
+        "(about 2 units per 50 videos, includes view/comment counts) (default: search)",
+    )
+    parser.add_argument(
+        "--discovery-shards",
+        type=int,
+        default=1,
+        help="Split the search window into this many date ranges discovered in parallel; ranges that "
+        "hit the ~500 result cap are bisected. Each range costs at least 100 units (default: 1)",
+    )
+    parser.add_argument(
+        "--published-after", 
+        type=_parse_cli_datetime, 
+        help="Include only videos published after this date"
+    )
+    parser.add_argument(
+        "--published-before", 
+        type=_parse_cli_datetime, 
+        help="Include only videos published before this date"
+    )
+    parser.add_argument(
+        "--data-root", 
+        default="data", 
+        help="Project data directory (default: data)"
+    )
+    parser.add_argument(
+        "--bronze-dir", 
+        default="data/bronze", 
+        help="Output directory for Bronze data (default: data/bronze)"
+    )
+    parser.add_argument(
+        "--overwrite",
+        action=argparse.BooleanOptionalAction,
+        default=True,
+        help="Overwrite existing Bronze files if they exist",
+    )
+    parser.add_argument(
+        "--bronze-codec",
+        choices=list(BRONZE_CODECS),
+        default="none",
+        help="Compression of new Bronze files: none (.jsonl), gzip (.jsonl.gz) or zstd (.jsonl.zst); "
+        "reads detect the codec from the file name (default: none)",
+    )
+    parser.add_argument(
+        "--jobs", 
+        type=int, 
+        default=1, 
+        help="Number of videos scraped concurrently (default: 1)"
+    )
+    parser.add_argument(
+        "--max-in-flight", 
+        type=int, 
+        default=None, 
+        help="Global cap on concurrent API requests across all jobs (default: no extra cap)"
+    )
+    parser.add_argument(
+        "--pool-size", 
+        type=int, 
+        default=None, 
+        help="HTTP connection pool size shared by all jobs (default: one connection per concurrent request, "
+        "from --jobs, --replies/--reply-workers and --discovery-shards, capped by --max-in-flight)"
+    )
+    parser.add_argument(
+        "--keep-alive",
+        action=argparse.BooleanOptionalAction,
+        default=True,
+        help="Reuse HTTP connections between requests",
+    )
+    parser.add_argument(
+        "--compress",
+        action=argparse.BooleanOptionalAction,
+        default=True,
+        help="Request gzip-compressed API responses",
+    )
+    parser.add_argument(
+        "--connect-timeout", 
+        type=float, 
+        default=10.0, 
+        help="HTTP connect timeout in seconds (default: 10)"
+    )
+    parser.add_argument(
+        "--read-timeout", 
+        type=float, 
+        default=30.0, 
+        help="HTTP read timeout in seconds (default: 30)"
+    )
+    parser.add_argument(
+        "--max-attempts", 
+        type=int, 
+        default=5, 
+        help="Maximum attempts per API request on transient errors (default: 5)"
+    )
+    parser.add_argument(
+        "--daily-quota", 
+        type=int, 
+        default=10000, 
+        help="Daily YouTube API quota budget in units, tracked under --data-root (default: 10000)"
+    )
+    parser.add_argument(
+        "--requests-per-second", 
+        type=float, 
+        default=None, 
+        help="Upper bound on API requests started per second (default: unlimited)"
+    )
+    parser.add_argument(
+        "--resume",
+        action="store_true",
+        help="Continue unfinished scrapes from their last checkpoint and append to the partial Bronze file",
+    )
+    parser.add_argument(
+        "--prefetch-pages",
+        type=int,
+        default=0,
+        help="Pipeline pagination: request up to this many pages ahead while the current one "
+        "is parsed and written (default: 0, sequential)",
+    )
+    parser.add_argument(
+        "--skip-unchanged",
+        action="store_true",
+        help="Skip videos whose commentCount hasn't changed since their last complete scrape "
+        "(counts come from videos.list, 1 unit per 50 videos, and are recorded on every run)",
+    )
+    parser.add_argument(
+        "--replies",
+        action="store_true",
+        help="Also fetch replies; only threads with more than 5 replies cost extra requests",
+    )
+    parser.add_argument(
+        "--reply-workers",
+        type=int,
+        default=4,
+        help="Concurrent requests for threads whose replies aren't all inlined (default: 4)",
+    )
+    parser.add_argument(
+        "--comment-budget",
+        type=int,
+        default=None,
+        help="Total comments to scrape per channel, split across its videos by --allocation "
+        "instead of the same --comments-limit for each (default: off)",
+    )
+    parser.add_argument(
+        "--allocation",
+        choices=list(ALLOCATION_WEIGHTINGS),
+        default="comment-count",
+        help="How --comment-budget is split: by each video's commentCount, or by recency "
+        "(a video's share halves every 30 days) (default: comment-count)",
+    )
+    parser.add_argument(
+        "--min-comments-per-video",
+        type=int,
+        default=100,
+        help="Smallest share of --comment-budget per video, while the budget lasts (default: 100)",
+    )
+    parser.add_argument(
+        "--max-comments-per-video",
+        type=int,
+        default=None,
+        help="Largest share of --comment-budget per video (default: --comments-limit)",
+    )
+    parser.add_argument(
+        "--http-cache",
+        action="store_true",
+        help="Cache search/playlistItems/channels responses under <data-root>/cache/http and "
+        "revalidate them with ETags once they are older than --http-cache-ttl-hours",
+    )
+    parser.add_argument(
+        "--http-cache-ttl-hours",
+        type=float,
+        default=6.0,
+        help="Serve cached discovery pages without any request for this long (default: 6)",
+    )
+    parser.add_argument(
+        "--http-cache-max-mb",
+        type=int,
+        default=256,
+        help="Size limit of the response cache; least recently used pages are evicted (default: 256)",
+    )
+    parser.add_argument(
+        "--ref-ttl-days",
+        type=float,
+        default=30.0,
+        help="Reuse a saved channel ref -> channel id mapping for this many days before resolving it "
+        "again with channels.list (default: 30)",
+    )
+    parser.add_argument(
+        "--refresh-ref",
+        action="store_true",
+        help="Resolve the channel reference with the API even if a saved mapping exists",
+    )
+    parser.add_argument(
+        "--retry-failed",
+        action="store_true",
+        help="Skip discovery and scrape only the videos in the channel's failed-video queue "
+        "(data/state/failed_videos); successes are merged into the latest run summary",
+    )
+    parser.add_argument(
+        "--incremental",
+        action="store_true",
+        help="Fetch only comments newer than the newest one already in Bronze and append them",
+    )
@@ -0,0 +1,468 @@
+"""
+Local emulator of the YouTube Data API v3 endpoints used by the ingestion layer.
+
+Serves deterministic synthetic channels, videos, comments and replies over HTTP so that YouTubeApiClient
+(retries, quota handling, concurrency, pooling) can be load tested without network or quota:
+
+    python -m yt_comments.ingestion.api_emulator --port 8765 --videos 50 --comments 2000
+    YOUTUBE_API_KEY=any YOUTUBE_API_BASE_URL=http://127.0.0.1:8765/youtube/v3 \\
+        yt_comments scrape-channel @emuchannel0
+
+or in-process:
+
+    with YouTubeApiEmulator(EmulatorConfig(latency=0.05)) as emulator:
+        client = YouTubeApiClient(api_key="any", base_url=emulator.base_url)
+
+`fields=` masks are accepted but ignored (full items are returned).
+"""
+from __future__ import annotations
+
+import argparse
+import gzip
+import hashlib
+import json
+import random
+import threading
+import time
+from collections import Counter
+from dataclasses import dataclass
+from datetime import datetime, timedelta, timezone
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlsplit
+
+from yt_comments.ingestion.quota import ENDPOINT_COSTS
+
+
+
+_EPOCH = datetime(2026, 1, 1, tzinfo=timezone.utc) # publish time of the newest emulated video
+_WORDS = (
+    "great", "video", "love", "this", "music", "thanks", "awesome", "why", "tutorial", "python",
+    "data", "really", "helpful", "first", "camera", "sound", "explained", "wow", "again", "part",
+)
+
+
+@dataclass(frozen=True, slots=True)
+class EmulatorConfig:
+    channel_count: int = 1
+    videos_per_channel: int = 20
+    comments_per_video: int = 250
+    max_replies_per_thread: int = 0 # each thread gets a deterministic 0..max replies
+    seed: int = 0
+    search_result_cap: int = 500 # search.list stops paging after this many results, like the real API
+    latency: float = 0.0 # seconds added to every response
+    latency_jitter: float = 0.0 # extra random latency in [0, latency_jitter]
+    rate_limit_rate: float = 0.0 # share of requests answered with 429 + Retry-After
+    server_error_rate: float = 0.0 # share of requests answered with 503
+    retry_after: int = 0 # Retry-After header (seconds) sent with injected 429s
+    quota_per_key: int | None = None # units per API key before 403 quotaExceeded; None = unlimited
+    invalid_keys: frozenset[str] = frozenset() # keys answered with 400 keyInvalid
+
+
+def channel_id(channel: int) -> str:
+    return f"UC{channel:022d}"
+
+
+def video_id(channel: int, video: int) -> str:
+    return f"v{channel:03d}{video:07d}" # 11 characters, like real video ids
+
+
+class _Dataset:
+    """Deterministic synthetic data derived from the config; nothing is stored up front."""
+
+    def __init__(self, config: EmulatorConfig) -> None:
+        self.config = config
+
+    def channel_index(self, value: str) -> int | None:
+        for prefix in ("UC", "UU"):
+            if value.startswith(prefix) and value[2:].isdigit():
+                index = int(value[2:])
+                return index if index < self.config.channel_count else None
+        return None
+
+    def handle_index(self, handle: str) -> int | None:
+        handle = handle.lstrip("@")
+        if handle.startswith("emuchannel") and handle[len("emuchannel"):].isdigit():
+            index = int(handle[len("emuchannel"):])
+            return index if index < self.config.channel_count else None
+        return None
+
+    def video_index(self, value: str) -> tuple[int, int] | None:
+        if len(value) != 11 or not value.startswith("v") or not value[1:].isdigit():
+            return None
+        channel, video = int(value[1:4]), int(value[4:])
+        if channel >= self.config.channel_count or video >= self.config.videos_per_channel:
+            return None
+        return channel, video
+
+    def video_published_at(self, video: int) -> datetime:
+        return _EPOCH - timedelta(days=video) # video 0 is the newest
+
+    def video_resource(self, channel: int, video: int) -> dict:
+        return {
+            "id": video_id(channel, video),
+            "snippet": {
+                "title": f"Emulated video {video} of channel {channel}",
+                "channelId": channel_id(channel),
+                "publishedAt": _iso(self.video_published_at(video)),
+            },
+        }
+
+    def thread_index(self, value: str) -> tuple[int, int, int] | None:
+        if len(value) != 21 or not value.startswith("Ug") or not value[13:].isdigit():
+            return None
+        found = self.video_index(value[2:13])
+        index = int(value[13:])
+        if found is None or index >= self.config.comments_per_video:
+            return None
+        return found[0], found[1], index
+
+    def reply_count(self, vid: str, index: int) -> int:
+        if self.config.max_replies_per_thread <= 0:
+            return 0
+        return random.Random(f"{self.config.seed}:{vid}:{index}:replies").randint(0, self.config.max_replies_per_thread)
+
+    def comment_thread(self, channel: int, video: int, index: int, *, inline_replies: bool = False) -> dict:
+        vid = video_id(channel, video)
+        # newest first: comment 0 was posted last
+        published_at = self.video_published_at(video) + timedelta(minutes=self.config.comments_per_video - index)
+        comment_id = f"Ug{vid}{index:08d}"
+        reply_count = self.reply_count(vid, index)
+        thread = {
+            "id": comment_id,
+            "snippet": {
+                "videoId": vid,
+                "topLevelComment": self._comment(f"{self.config.seed}:{vid}:{index}", comment_id, published_at),
+                "totalReplyCount": reply_count,
+            },
+        }
+        if inline_replies and reply_count:
+            thread["replies"] = {"comments": [self.reply(channel, video, index, j) for j in range(min(5, reply_count))]}
+        return thread
+
+    def reply(self, channel: int, video: int, index: int, reply: int) -> dict:
+        vid = video_id(channel, video)
+        parent_id = f"Ug{vid}{index:08d}"
+        published_at = self.video_published_at(video) + timedelta(days=1, minutes=reply)
+        resource = self._comment(f"{self.config.seed}:{parent_id}:{reply}", f"{parent_id}.{reply}", published_at)
+        resource["snippet"]["parentId"] = parent_id
+        return resource
+
+    def _comment(self, seed: str, comment_id: str, published_at: datetime) -> dict:
+        rng = random.Random(seed)
+        words = " ".join(rng.choice(_WORDS) for _ in range(rng.randint(3, 25)))
+        return {
+            "id": comment_id,
+            "snippet": {
+                "textOriginal": words,
+                "textDisplay": words,
+                "authorDisplayName": f"@user{rng.randint(0, 9999)}",
+                "likeCount": rng.randint(0, 500),
+                "publishedAt": _iso(published_at),
+            },
+        }
+
+
+class _ApiError(Exception):
+    def __init__(self, status: int, reason: str, message: str, headers: dict[str, str] | None = None) -> None:
+        super().__init__(message)
+        self.status = status
+        self.reason = reason
+        self.message = message
+        self.headers = headers or {}
+
+
+class YouTubeApiEmulator:
+    """Threaded HTTP server serving the emulated API under {base_url}/<endpoint>."""
+
+    def __init__(self, config: EmulatorConfig | None = None, *, host: str = "127.0.0.1", port: int = 0) -> None:
+        self.config = config or EmulatorConfig()
+        self._data = _Dataset(self.config)
+        self._rng = random.Random(self.config.seed)
+        self._lock = threading.Lock()
+        self._units: Counter[str] = Counter()
+        self.requests: Counter[str] = Counter() # served requests per endpoint, errors included
+
+        emulator = self
+
+        class _Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1" # keep-alive, like googleapis.com
+
+            def do_GET(self) -> None:
+                emulator._handle(self)
+
+            def log_message(self, format, *args) -> None:
+                pass
+
+        self._server = ThreadingHTTPServer((host, port), _Handler)
+        self._server.daemon_threads = True
+        self._thread: threading.Thread | None = None
+
+    @property
+    def base_url(self) -> str:
+        host, port = self._server.server_address[:2]
+        return f"http://{host}:{port}/youtube/v3"
+
+    def start(self) -> str:
+        self._thread = threading.Thread(target=self._server.serve_forever, name="api-emulator", daemon=True)
+        self._thread.start()
+        return self.base_url
+
+    def serve_forever(self) -> None:
+        """Serve on the calling thread until interrupted (standalone mode)."""
+        try:
+            self._server.serve_forever()
+        except KeyboardInterrupt:
+            pass
+        finally:
+            self._server.server_close()
+
+    def stop(self) -> None:
+        self._server.shutdown()
+        self._server.server_close()
+
+    def units_used(self, api_key: str) -> int:
+        with self._lock:
+            return self._units[api_key]
+
+    def __enter__(self) -> YouTubeApiEmulator:
+        self.start()
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        self.stop()
+
+    def _handle(self, request: BaseHTTPRequestHandler) -> None:
+        url = urlsplit(request.path)
+        endpoint = url.path.rsplit("/", 1)[-1]
+        params = {k: v[-1] for k, v in parse_qs(url.query).items()}
+
+        with self._lock:
+            self.requests[endpoint] += 1
+            delay = self.config.latency + self._rng.uniform(0.0, self.config.latency_jitter)
+            roll = self._rng.random()
+        if delay > 0:
+            time.sleep(delay)
+
+        try:
+            handler = getattr(self, f"_{endpoint}", None)
+            if handler is None or endpoint not in ENDPOINT_COSTS:
+                raise _ApiError(404, "notFound", f"Unknown endpoint: {endpoint}")
+            self._check_key(params.get("key"), endpoint, roll)
+            status, payload = 200, handler(params)
+            # ETags let clients revalidate cached pages; 304 still costs quota, like the real API
+            etag = '"' + hashlib.sha1(json.dumps(payload, sort_keys=True).encode("utf-8")).hexdigest()[:16] + '"'
+            headers = {"ETag": etag}
+            if request.headers.get("If-None-Match") == etag:
+                status = 304
+        except _ApiError as e:
+            status, headers = e.status, e.headers
+            payload = {
+                "error": {
+                    "code": e.status,
+                    "message": e.message,
+                    "errors": [{"reason": e.reason, "message": e.message}],
+                }
+            }
+        self._send(request, status, payload, headers)
+
+    def _check_key(self, api_key: str | None, endpoint: str, roll: float) -> None:
+        if not api_key or api_key in self.config.invalid_keys:
+            raise _ApiError(400, "keyInvalid", "API key not valid. Please pass a valid API key.")
+
+        if roll < self.config.rate_limit_rate:
+            raise _ApiError(
+                429, "rateLimitExceeded", "Too many requests.", {"Retry-After": str(self.config.retry_after)}
+            )
+        if roll < self.config.rate_limit_rate + self.config.server_error_rate:
+            raise _ApiError(503, "backendError", "Backend Error")
+
+        with self._lock:
+            cost = ENDPOINT_COSTS[endpoint]
+            if self.config.quota_per_key is not None and self._units[api_key] + cost > self.config.quota_per_key:
+                raise _ApiError(403, "quotaExceeded", "The request cannot be completed because you have exceeded your quota.")
+            self._units[api_key] += cost
+
+    def _send(self, request: BaseHTTPRequestHandler, status: int, payload: dict, headers: dict[str, str]) -> None:
+        body = json.dumps(payload).encode("utf-8") if status != 304 else b""
+        gzip_ok = (
+            "gzip" in request.headers.get("Accept-Encoding", "")
+            and "gzip" in request.headers.get("User-Agent", "")
+        )
+        request.send_response(status)
+        if gzip_ok and body:
+            body = gzip.compress(body)
+            request.send_header("Content-Encoding", "gzip")
+        request.send_header("Content-Type", "application/json; charset=UTF-8")
+        request.send_header("Content-Length", str(len(body)))
+        for name, value in headers.items():
+            request.send_header(name, value)
+        request.end_headers()
+        request.wfile.write(body)
+
+    # endpoints
+
+    def _channels(self, params: dict[str, str]) -> dict:
+        if "id" in params:
+            index = self._data.channel_index(params["id"])
+        elif "forHandle" in params:
+            index = self._data.handle_index(params["forHandle"])
+        elif "forUsername" in params:
+            index = self._data.handle_index(params["forUsername"])
+        else:
+            raise _ApiError(400, "missingRequiredParameter", "No filter selected.")
+
+        if index is None:
+            return {"items": []}
+        return {
+            "items": [
+                {
+                    "id": channel_id(index),
+                    "contentDetails": {"relatedPlaylists": {"uploads": f"UU{index:022d}"}},
+                }
+            ]
+        }
+
+    def _search(self, params: dict[str, str]) -> dict:
+        index = self._data.channel_index(params.get("channelId", ""))
+        if index is None:
+            return {"items": []}
+
+        after = _parse_time(params.get("publishedAfter"))
+        before = _parse_time(params.get("publishedBefore"))
+        videos = [
+            v for v in range(self.config.videos_per_channel)
+            if (after is None or self._data.video_published_at(v) >= after)
+            and (before is None or self._data.video_published_at(v) <= before)
+        ][: self.config.search_result_cap]
+
+        page, next_token = _paginate(videos, params, max_results=50)
+        items = []
+        for v in page:
+            resource = self._data.video_resource(index, v)
+            items.append({"id": {"kind": "youtube#video", "videoId": resource["id"]}, "snippet": resource["snippet"]})
+        return _page_payload(items, next_token, total=len(videos))
+
+    def _playlistItems(self, params: dict[str, str]) -> dict:
+        index = self._data.channel_index(params.get("playlistId", ""))
+        if index is None:
+            raise _ApiError(404, "playlistNotFound", "The playlist identified with the request's playlistId parameter cannot be found.")
+
+        page, next_token = _paginate(list(range(self.config.videos_per_channel)), params, max_results=50)
+        items = []
+        for v in page:
+            resource = self._data.video_resource(index, v)
+            items.append(
+                {
+                    "snippet": {"title": resource["snippet"]["title"], "channelId": channel_id(index)},
+                    "contentDetails": {"videoId": resource["id"], "videoPublishedAt": resource["snippet"]["publishedAt"]},
+                }
+            )
+        return _page_payload(items, next_token, total=self.config.videos_per_channel)
+
+    def _videos(self, params: dict[str, str]) -> dict:
+        ids = [i for i in params.get("id", "").split(",") if i]
+        if len(ids) > 50:
+            raise _ApiError(400, "invalidFilters", "Too many ids.")
+
+        items = []
+        for vid in ids:
+            found = self._data.video_index(vid)
+            if found is None:
+                continue
+            channel, video = found
+            resource = self._data.video_resource(channel, video)
+            resource["statistics"] = {
+                "viewCount": str(1000 * (video + 1)),
+                "commentCount": str(self.config.comments_per_video),
+            }
+            items.append(resource)
+        return {"items": items}
+
+    def _commentThreads(self, params: dict[str, str]) -> dict:
+        found = self._data.video_index(params.get("videoId", ""))
+        if found is None:
+            raise _ApiError(404, "videoNotFound", "The video identified by the videoId parameter could not be found.")
+        channel, video = found
+
+        inline_replies = "replies" in params.get("part", "").split(",")
+        page, next_token = _paginate(list(range(self.config.comments_per_video)), params, max_results=100)
+        items = [self._data.comment_thread(channel, video, i, inline_replies=inline_replies) for i in page]
+        return _page_payload(items, next_token, total=self.config.comments_per_video)
+
+    def _comments(self, params: dict[str, str]) -> dict:
+        found = self._data.thread_index(params.get("parentId", ""))
+        if found is None:
+            raise _ApiError(404, "commentNotFound", "The comment identified by the parentId parameter could not be found.")
+        channel, video, index = found
+
+        replies = list(range(self._data.reply_count(video_id(channel, video), index)))
+        page, next_token = _paginate(replies, params, max_results=100)
+        items = [self._data.reply(channel, video, index, j) for j in page]
+        return _page_payload(items, next_token, total=len(replies))
+
+
+def _iso(value: datetime) -> str:
+    return value.isoformat().replace("+00:00", "Z")
+
+
+def _parse_time(value: str | None) -> datetime | None:
+    if not value:
+        return None
+    return datetime.fromisoformat(value.replace("Z", "+00:00"))
+
+
+def _paginate(items: list, params: dict[str, str], *, max_results: int) -> tuple[list, str | None]:
+    token = params.get("pageToken")
+    try:
+        offset = int(token.removeprefix("o")) if token else 0
+    except ValueError:
+        raise _ApiError(400, "invalidPageToken", "The request specifies an invalid page token.") from None
+    size = max(1, min(max_results, int(params.get("maxResults", max_results))))
+    end = offset + size
+    return items[offset:end], (f"o{end}" if end < len(items) else None)
+
+
+def _page_payload(items: list, next_token: str | None, *, total: int) -> dict:
+    payload: dict = {"items": items, "pageInfo": {"totalResults": total, "resultsPerPage": len(items)}}
+    if next_token:
+        payload["nextPageToken"] = next_token
+    return payload
+
+
+def main(argv: list[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(prog="python -m yt_comments.ingestion.api_emulator")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--channels", type=int, default=1, help="Emulated channels (@emuchannel0, @emuchannel1, ...)")
+    parser.add_argument("--videos", type=int, default=20, help="Videos per channel")
+    parser.add_argument("--comments", type=int, default=250, help="Comments per video")
+    parser.add_argument("--max-replies", type=int, default=0, help="Maximum replies per comment thread")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--latency", type=float, default=0.0, help="Seconds added to every response")
+    parser.add_argument("--latency-jitter", type=float, default=0.0)
+    parser.add_argument("--rate-limit-rate", type=float, default=0.0, help="Share of requests answered with 429")
+    parser.add_argument("--server-error-rate", type=float, default=0.0, help="Share of requests answered with 503")
+    parser.add_argument("--retry-after", type=int, default=0)
+    parser.add_argument("--quota-per-key", type=int, default=None)
+    args = parser.parse_args(argv)
+
+    config = EmulatorConfig(
+        channel_count=args.channels,
+        videos_per_channel=args.videos,
+        comments_per_video=args.comments,
+        max_replies_per_thread=args.max_replies,
+        seed=args.seed,
+        latency=args.latency,
+        latency_jitter=args.latency_jitter,
+        rate_limit_rate=args.rate_limit_rate,
+        server_error_rate=args.server_error_rate,
+        retry_after=args.retry_after,
+        quota_per_key=args.quota_per_key,
+    )
+    emulator = YouTubeApiEmulator(config, host=args.host, port=args.port)
+    print(f"YouTube API emulator | base_url={emulator.base_url}")
+    emulator.serve_forever()
+
+
+if __name__ == "__main__":
+    main()
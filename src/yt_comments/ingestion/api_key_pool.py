@@ -0,0 +1,95 @@
+from __future__ import annotations
+
+import logging
+import threading
+from typing import Sequence
+
+from yt_comments.ingestion.quota import QuotaLedger, key_fingerprint
+
+
+
+logger = logging.getLogger(__name__)
+
+
+class NoUsableApiKeyError(ValueError):
+    """Raised when every key of the pool was taken out of rotation."""
+
+
+class ApiKeyPool:
+    """
+    Thread-safe set of YouTube API keys that requests are spread across.
+
+    With a quota ledger every request goes to the key with the most units left today (so keys
+    drain evenly), otherwise keys are used round-robin. A key that the API rejects for good
+    (keyInvalid, or quotaExceeded when no ledger tracks it) is retired and not handed out again
+    during this run.
+    """
+
+    def __init__(self, keys: Sequence[str]) -> None:
+        self._keys = tuple(dict.fromkeys(k for k in keys if k)) # deduplicated, order kept
+        if not self._keys:
+            raise ValueError("ApiKeyPool needs at least one API key")
+        self._lock = threading.Lock()
+        self._retired: dict[str, str] = {} # key -> reason
+        self._cursor = 0
+
+    @property
+    def keys(self) -> tuple[str, ...]:
+        return self._keys
+
+    def active(self) -> list[str]:
+        with self._lock:
+            return self._active()
+
+    def retired(self) -> dict[str, str]:
+        with self._lock:
+            return dict(self._retired)
+
+    def acquire(self, endpoint: str, *, quota: QuotaLedger | None = None) -> str:
+        """
+        Pick the key for one request to `endpoint` and, with a ledger, charge its units.
+
+        Picking and charging happen under one lock, so concurrent workers never overdraw a key.
+        Raises NoUsableApiKeyError if all keys are retired and QuotaBudgetExceededError
+        if even the fullest key can't pay for the request.
+        """
+        with self._lock:
+            active = self._active()
+            if not active:
+                raise NoUsableApiKeyError(
+                    "All YouTube API keys are out of rotation (quota exceeded or invalid)."
+                )
+            if quota is None:
+                key = active[self._cursor % len(active)]
+                self._cursor += 1
+                return key
+            key = max(active, key=quota.remaining) # first key wins ties, so equal keys alternate
+            quota.charge(key, endpoint)
+            return key
+
+    def retire(self, key: str, reason: str) -> bool:
+        """Take `key` out of rotation. Returns False if it already was."""
+        with self._lock:
+            if key in self._retired:
+                return False
+            self._retired[key] = reason
+            remaining = len(self._active())
+        logger.warning(
+            "API key taken out of rotation | key=%s reason=%s active_keys=%s",
+            key_fingerprint(key), reason, remaining,
+        )
+        return True
+
+    def has_capacity(self, quota: QuotaLedger | None = None) -> bool:
+        """Whether any key in rotation can still send a request."""
+        active = self.active()
+        if quota is None:
+            return bool(active)
+        return any(quota.remaining(key) > 0 for key in active)
+
+    def remaining(self, quota: QuotaLedger) -> int:
+        """Units left today across all keys still in rotation."""
+        return sum(quota.remaining(key) for key in self.active())
+
+    def _active(self) -> list[str]:
+        return [key for key in self._keys if key not in self._retired]
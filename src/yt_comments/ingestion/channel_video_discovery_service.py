@@ -1,25 +1,116 @@
 from __future__ import annotations
 
-from dataclasses import dataclass
+import logging
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from dataclasses import dataclass, replace
+from datetime import datetime, timedelta, timezone
+from typing import Callable
 
 from yt_comments.ingestion.channel_video_discovery_client import ChannelVideoDiscoveryClient
 from yt_comments.ingestion.models import ChannelVideo, ChannelVideoDiscovery
 
 
+
+logger = logging.getLogger(__name__)
+
+SEARCH_RESULT_CAP = 500 # search.list stops paging after roughly this many results per query
+YOUTUBE_EPOCH = datetime(2005, 4, 23, tzinfo=timezone.utc) # first public upload; lower bound of open windows
+
+
 @dataclass(slots=True)
 class ChannelVideoDiscoveryResult:
     video_count: int
     videos: list[ChannelVideo]
-    
+
 
 @dataclass(slots=True)
 class ChannelVideoDiscoveryService:
     client: ChannelVideoDiscoveryClient
     request: ChannelVideoDiscovery
-    
+    shards: int = 1 # >1 splits the search window into date shards discovered concurrently
+    result_cap: int = SEARCH_RESULT_CAP
+    min_shard_span: timedelta = timedelta(hours=1) # shards this short are never bisected further
+    clock: Callable[[], datetime] = lambda: datetime.now(tz=timezone.utc)
+
     def run(self) -> ChannelVideoDiscoveryResult:
-        videos: list[ChannelVideo] = []
-        for video in self.client.discover_videos(request=self.request):           
-            videos.append(video)      
+        if self.shards > 1 and self.request.engine == "search":
+            videos = self._run_sharded()
+        else:
+            videos = list(self.client.discover_videos(request=self.request))
         video_count = len(videos)
-        return ChannelVideoDiscoveryResult(video_count=video_count, videos=videos)
\ No newline at end of file
+        return ChannelVideoDiscoveryResult(video_count=video_count, videos=videos)
+
+    def _run_sharded(self) -> list[ChannelVideo]:
+        """
+        Discover the [published_after, published_before] window as `shards` date ranges in parallel.
+
+        A shard that comes back with `result_cap` videos was probably truncated by search.list,
+        so it is bisected and both halves are queued again (down to `min_shard_span`). Results are
+        merged, deduplicated by video_id (shard bounds are inclusive) and sorted newest first,
+        like a single search.list walk.
+
+        An open window ends at the next full hour rather than at now, so shard URLs (and their
+        response cache keys) stay the same between runs within that hour.
+        """
+        after = self.request.published_after or YOUTUBE_EPOCH
+        before = self.request.published_before or _ceil_to_hour(self.clock())
+        if before <= after:
+            return []
+
+        # a shard never needs more than `limit` videos: the overall newest `limit` are its newest ones
+        shard_limit = self.result_cap if self.request.limit is None else min(self.request.limit, self.result_cap)
+        can_truncate = self.request.limit is None or self.request.limit > self.result_cap
+
+        by_id: dict[str, ChannelVideo] = {}
+        with ThreadPoolExecutor(max_workers=self.shards, thread_name_prefix="discover") as pool:
+            pending: dict[Future, tuple[datetime, datetime]] = {}
+
+            def submit(shard_after: datetime, shard_before: datetime) -> None:
+                shard = replace(
+                    self.request,
+                    published_after=shard_after,
+                    published_before=shard_before,
+                    limit=shard_limit,
+                )
+                future = pool.submit(lambda: list(self.client.discover_videos(request=shard)))
+                pending[future] = (shard_after, shard_before)
+
+            for shard_after, shard_before in _split_window(after, before, self.shards):
+                submit(shard_after, shard_before)
+
+            while pending:
+                done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    shard_after, shard_before = pending.pop(future)
+                    videos = future.result()
+                    for video in videos:
+                        by_id.setdefault(video.video_id, video)
+
+                    if can_truncate and len(videos) >= self.result_cap and shard_before - shard_after > self.min_shard_span:
+                        logger.info(
+                            "Discovery shard hit the result cap, bisecting | after=%s before=%s videos=%s",
+                            shard_after.isoformat(), shard_before.isoformat(), len(videos),
+                        )
+                        middle = shard_after + (shard_before - shard_after) / 2
+                        submit(shard_after, middle)
+                        submit(middle, shard_before)
+
+        videos = sorted(
+            by_id.values(),
+            key=lambda v: v.published_at or YOUTUBE_EPOCH,
+            reverse=True,
+        )
+        if self.request.limit is not None:
+            videos = videos[: self.request.limit]
+        return videos
+
+
+def _ceil_to_hour(moment: datetime) -> datetime:
+    floor = moment.replace(minute=0, second=0, microsecond=0)
+    return floor if floor == moment else floor + timedelta(hours=1)
+
+
+def _split_window(after: datetime, before: datetime, shards: int) -> list[tuple[datetime, datetime]]:
+    step = (before - after) / shards
+    bounds = [after + step * i for i in range(shards)] + [before]
+    return list(zip(bounds[:-1], bounds[1:], strict=True))
@@ -0,0 +1,86 @@
+from __future__ import annotations
+
+from datetime import datetime, timezone
+from typing import Sequence
+
+from yt_comments.ingestion.models import ChannelVideo
+
+
+
+ALLOCATION_WEIGHTINGS = ("comment-count", "recency")
+RECENCY_HALF_LIFE_DAYS = 30.0 # with recency weighting a video's share halves every 30 days of age
+
+
+def _weight(video: ChannelVideo, weighting: str, now: datetime) -> float:
+    if weighting == "comment-count":
+        return float(video.comment_count or 0)
+    if video.published_at is None:
+        return 0.0
+    age_days = max(0.0, (now - video.published_at).total_seconds() / 86400)
+    return 0.5 ** (age_days / RECENCY_HALF_LIFE_DAYS)
+
+
+def allocate_comment_limits(
+        videos: Sequence[ChannelVideo],
+        *,
+        total: int,
+        weighting: str = "comment-count",
+        min_per_video: int = 0,
+        max_per_video: int | None = None,
+        now: datetime | None = None,
+) -> dict[str, int]:
+    """
+    Split a total comment budget into per-video limits.
+
+    No video is given more than it has (its commentCount, when known) or more than `max_per_video`.
+    Every video first gets up to `min_per_video` (in the given order, while the budget lasts); the rest
+    is shared out in proportion to the weights ("comment-count": reported commentCount, "recency":
+    halves every RECENCY_HALF_LIFE_DAYS), and whatever a capped video can't take goes to the others.
+    Videos allotted 0 don't fit the budget. Unused budget (all videos at their cap) is left unallocated.
+    """
+    if weighting not in ALLOCATION_WEIGHTINGS:
+        raise ValueError(f"Unknown allocation weighting: {weighting}")
+    if total < 0 or min_per_video < 0:
+        raise ValueError("total and min_per_video must be >= 0")
+    if max_per_video is not None and max_per_video < min_per_video:
+        raise ValueError("max_per_video must be >= min_per_video")
+
+    now = now or datetime.now(tz=timezone.utc)
+    caps: dict[str, int] = {}
+    for video in videos:
+        cap = video.comment_count if video.comment_count is not None else max_per_video
+        if cap is None:
+            cap = total # unknown size and no cap: bounded by the budget only
+        caps[video.video_id] = min(cap, max_per_video) if max_per_video is not None else cap
+
+    limits = {video_id: 0 for video_id in caps}
+    remaining = total
+    for video_id, cap in caps.items():
+        floor = min(min_per_video, cap, remaining)
+        limits[video_id] = floor
+        remaining -= floor
+
+    weights = {video.video_id: _weight(video, weighting, now) for video in videos}
+    open_ids = [video_id for video_id in caps if limits[video_id] < caps[video_id]]
+    while remaining > 0 and open_ids:
+        weight_sum = sum(weights[video_id] for video_id in open_ids)
+        shares = {
+            video_id: (weights[video_id] / weight_sum if weight_sum > 0 else 1 / len(open_ids))
+            for video_id in open_ids
+        }
+        given = 0
+        for video_id in open_ids:
+            grant = min(int(remaining * shares[video_id]), caps[video_id] - limits[video_id])
+            limits[video_id] += grant
+            given += grant
+        if given == 0:
+            # shares rounded down to nothing: hand out the rest one by one, heaviest first
+            for video_id in sorted(open_ids, key=lambda v: shares[v], reverse=True):
+                if given == remaining:
+                    break
+                limits[video_id] += 1
+                given += 1
+        remaining -= given
+        open_ids = [video_id for video_id in open_ids if limits[video_id] < caps[video_id]]
+
+    return limits
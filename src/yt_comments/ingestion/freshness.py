@@ -0,0 +1,32 @@
+from __future__ import annotations
+
+from typing import Callable, Sequence
+
+from yt_comments.ingestion.models import ChannelVideo
+
+
+
+def partition_unchanged(
+        videos: Sequence[ChannelVideo],
+        *,
+        current_counts: dict[str, int | None],
+        recorded_counts: dict[str, int],
+        has_bronze: Callable[[str], bool],
+) -> tuple[list[ChannelVideo], list[ChannelVideo]]:
+    """
+    Split videos (in their given order) into those to scrape and those unchanged since the last scrape.
+
+    A video is unchanged if its current commentCount equals the one recorded at its last successful
+    Bronze write and that Bronze file still exists. Unknown counts (e.g. comments disabled, video
+    missing from videos.list) never count as unchanged.
+    """
+    changed: list[ChannelVideo] = []
+    unchanged: list[ChannelVideo] = []
+    for video in videos:
+        current = current_counts.get(video.video_id)
+        recorded = recorded_counts.get(video.video_id)
+        if current is not None and current == recorded and has_bronze(video.video_id):
+            unchanged.append(video)
+        else:
+            changed.append(video)
+    return changed, unchanged
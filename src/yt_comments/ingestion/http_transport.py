@@ -0,0 +1,168 @@
+from __future__ import annotations
+
+import logging
+import threading
+from dataclasses import dataclass
+from typing import Callable
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.connectionpool import HTTPConnectionPool, HTTPSConnectionPool
+
+
+
+logger = logging.getLogger(__name__)
+
+# Google APIs only gzip responses for clients whose User-Agent contains "gzip"
+GZIP_USER_AGENT = "yt-comments (gzip)"
+
+
+def _wire_bytes(resp: requests.Response) -> int:
+    """Bytes of the response body as received over the wire, i.e. before gzip decoding."""
+    try:
+        read = resp.raw.tell() # urllib3 counts the raw (still encoded) bytes it pulled from the socket
+    except Exception:
+        read = None
+    if isinstance(read, int) and read > 0:
+        return read
+    content = getattr(resp, "content", None)
+    return len(content) if isinstance(content, bytes) else 0
+
+
+@dataclass(frozen=True, slots=True)
+class HttpTransportConfig:
+    pool_size: int = 10 # max open connections per host; should be >= number of concurrent workers
+    keep_alive: bool = True
+    connect_timeout: float = 10.0
+    read_timeout: float = 30.0
+    compress: bool = True # ask for gzip-encoded responses
+
+
+@dataclass(frozen=True, slots=True)
+class HttpTransportStats:
+    request_count: int
+    connection_count: int # new TCP/TLS connections opened
+    wire_bytes: int = 0 # response bodies as transferred (compressed)
+    decoded_bytes: int = 0 # response bodies after decoding
+
+    @property
+    def reused_count(self) -> int:
+        """Requests served over an already open (keep-alive) connection."""
+        return max(0, self.request_count - self.connection_count)
+
+
+class _CountingHTTPAdapter(HTTPAdapter):
+    """HTTPAdapter whose connection pools report every (re)opened connection."""
+
+    def __init__(self, on_new_connection: Callable[[], None], **kwargs) -> None:
+        self._on_new_connection = on_new_connection
+        super().__init__(**kwargs)
+
+    def init_poolmanager(self, *args, **kwargs) -> None:
+        super().init_poolmanager(*args, **kwargs)
+        on_new_connection = self._on_new_connection
+
+        def counting(connection_cls: type) -> type:
+            # urllib3 reconnects dropped connections in place, so count connect() rather than new objects
+            class _CountingConnection(connection_cls):
+                def connect(self):
+                    on_new_connection()
+                    return super().connect()
+
+            return _CountingConnection
+
+        class _CountingHTTPConnectionPool(HTTPConnectionPool):
+            ConnectionCls = counting(HTTPConnectionPool.ConnectionCls)
+
+        class _CountingHTTPSConnectionPool(HTTPSConnectionPool):
+            ConnectionCls = counting(HTTPSConnectionPool.ConnectionCls)
+
+        self.poolmanager.pool_classes_by_scheme = {
+            "http": _CountingHTTPConnectionPool,
+            "https": _CountingHTTPSConnectionPool,
+        }
+
+
+class HttpTransport:
+    """
+    Pooled HTTP transport shared by all endpoints and workers of an API client.
+
+    The underlying requests.Session is created lazily on the first request and then reused,
+    so every call after the first one can ride on an open keep-alive connection.
+    """
+
+    def __init__(self, config: HttpTransportConfig | None = None) -> None:
+        self.config = config or HttpTransportConfig()
+        if self.config.pool_size < 1:
+            raise ValueError("pool_size must be >= 1")
+
+        self._session: requests.Session | None = None
+        self._lock = threading.Lock()
+        self._request_count = 0
+        self._connection_count = 0
+        self._wire_bytes = 0
+        self._decoded_bytes = 0
+
+    @property
+    def timeout(self) -> tuple[float, float]:
+        return (self.config.connect_timeout, self.config.read_timeout)
+
+    def get(self, url: str, *, params: dict, headers: dict[str, str] | None = None) -> requests.Response:
+        session = self._get_session()
+        if headers:
+            resp = session.get(url, params=params, headers=headers, timeout=self.timeout)
+        else:
+            resp = session.get(url, params=params, timeout=self.timeout)
+        wire_bytes = _wire_bytes(resp)
+        content = getattr(resp, "content", None)
+        decoded_bytes = len(content) if isinstance(content, bytes) else 0
+        with self._lock:
+            self._request_count += 1
+            self._wire_bytes += wire_bytes
+            self._decoded_bytes += decoded_bytes
+        logger.debug(
+            "HTTP response | url=%s status=%s wire_bytes=%s decoded_bytes=%s",
+            url, resp.status_code, wire_bytes, decoded_bytes,
+        )
+        return resp
+
+    def stats(self) -> HttpTransportStats:
+        with self._lock:
+            return HttpTransportStats(
+                request_count=self._request_count,
+                connection_count=self._connection_count,
+                wire_bytes=self._wire_bytes,
+                decoded_bytes=self._decoded_bytes,
+            )
+
+    def close(self) -> None:
+        with self._lock:
+            if self._session is not None:
+                self._session.close()
+                self._session = None
+
+    def _get_session(self) -> requests.Session:
+        with self._lock:
+            if self._session is None:
+                self._session = self._build_session()
+            return self._session
+
+    def _build_session(self) -> requests.Session:
+        session = requests.Session()
+        adapter = _CountingHTTPAdapter(
+            on_new_connection=self._count_connection,
+            pool_connections=self.config.pool_size,
+            pool_maxsize=self.config.pool_size,
+            pool_block=True, # wait for a free connection instead of opening throwaway ones
+        )
+        session.mount("https://", adapter)
+        session.mount("http://", adapter)
+        if not self.config.keep_alive:
+            session.headers["Connection"] = "close"
+        if self.config.compress:
+            session.headers.update({"Accept-Encoding": "gzip", "User-Agent": GZIP_USER_AGENT})
+        return session
+
+    def _count_connection(self) -> None:
+        with self._lock:
+            self._connection_count += 1
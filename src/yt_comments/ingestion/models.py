@@ -14,6 +14,45 @@ class Comment:
     like_count: int | None = None
     published_at: datetime | None = None
     is_reply: bool = False
+    parent_id: str | None = None # top-level comment a reply belongs to
+
+@dataclass(frozen=True, slots=True)
+class CommentPage:
+    video_id: str
+    comments: list[Comment]
+    next_page_token: str | None = None # None on the last page
+
+@dataclass(frozen=True, slots=True)
+class ScrapeCheckpoint:
+    """Last page of a video that was fully written to Bronze."""
+    video_id: str
+    next_page_token: str
+    row_count: int # rows committed to the Bronze file so far
+    updated_at_utc: datetime
+    base_rows: int = 0 # rows of the existing Bronze file the scrape appends to (overwrite=False)
+
+@dataclass(frozen=True, slots=True)
+class FailedVideo:
+    """A channel video whose last scrape attempt failed, waiting in the retry queue."""
+    video_id: str
+    channel_id: str
+    title: str
+    error: str
+    attempts: int # failed scrape attempts so far
+    last_failed_at_utc: datetime
+
+@dataclass(frozen=True, slots=True)
+class VideoRefreshState:
+    """What the refresh scheduler knows about one tracked video, kept between runs."""
+    video_id: str
+    channel_id: str
+    title: str
+    published_at: datetime | None = None
+    observed_comment_count: int | None = None # latest commentCount reading, None when comments are disabled
+    observed_at_utc: datetime | None = None
+    scraped_comment_count: int | None = None # commentCount when the video was last scraped
+    last_scraped_at_utc: datetime | None = None # None until the scheduler scraped it
+    comments_per_day: float | None = None # smoothed comment growth rate
 
 @dataclass(frozen=True, slots=True)
 class ChannelVideo:
@@ -21,7 +60,8 @@ class ChannelVideo:
     channel_id: str
     title: str
     published_at: datetime | None = None
-    view_count: str | None = None
+    view_count: int | None = None
+    comment_count: int | None = None
     
 @dataclass(frozen=True, slots=True)
 class ChannelVideoDiscovery:
@@ -29,4 +69,11 @@ class ChannelVideoDiscovery:
     published_after: datetime | None = None
     published_before: datetime | None = None
     limit: int | None = None
+    engine: str = "search" # "search" (search.list, 100 units/page) or "uploads" (uploads playlist, 1 unit/page)
+
+@dataclass(frozen=True, slots=True)
+class VideoStatistics:
+    video_id: str
+    view_count: int | None = None
+    comment_count: int | None = None # None when comments are disabled
     
\ No newline at end of file
@@ -0,0 +1,65 @@
+from __future__ import annotations
+
+import queue
+import threading
+from typing import Iterable, Iterator, TypeVar
+
+
+
+T = TypeVar("T")
+
+_DONE = object()
+
+
+class _Failure:
+    __slots__ = ("error",)
+
+    def __init__(self, error: BaseException) -> None:
+        self.error = error
+
+
+def prefetch(items: Iterable[T], depth: int, *, name: str = "prefetch") -> Iterator[T]:
+    """
+    Iterate `items` on a background thread, keeping up to `depth` items ready ahead of the consumer.
+
+    The producer never runs more than `depth` items ahead, so memory stays bounded. Items and the
+    producer's exception (if any) reach the consumer in their original order. When the consumer stops
+    early, the producer stops at its next item (one item already being produced is finished first).
+    """
+    if depth < 1:
+        raise ValueError("depth must be >= 1")
+
+    buffer: queue.Queue = queue.Queue(maxsize=depth)
+    stop = threading.Event()
+
+    def put(item: object) -> bool:
+        while not stop.is_set():
+            try:
+                buffer.put(item, timeout=0.1)
+                return True
+            except queue.Full:
+                continue
+        return False
+
+    def produce() -> None:
+        try:
+            for item in items:
+                if not put(item):
+                    return
+        except BaseException as e:
+            put(_Failure(e))
+            return
+        put(_DONE)
+
+    thread = threading.Thread(target=produce, name=name, daemon=True)
+    thread.start()
+    try:
+        while True:
+            item = buffer.get()
+            if item is _DONE:
+                return
+            if isinstance(item, _Failure):
+                raise item.error
+            yield item
+    finally:
+        stop.set()
@@ -0,0 +1,198 @@
+from __future__ import annotations
+
+import hashlib
+import math
+import threading
+import time
+from datetime import date, datetime, timezone
+from typing import Callable, Sequence, TypeVar
+from zoneinfo import ZoneInfo
+
+from yt_comments.storage.quota_ledger_repository import JSONQuotaLedgerRepository
+
+
+
+# unit costs per endpoint, see https://developers.google.com/youtube/v3/determine_quota_cost
+ENDPOINT_COSTS: dict[str, int] = {
+    "commentThreads": 1,
+    "comments": 1,
+    "channels": 1,
+    "playlistItems": 1,
+    "videos": 1,
+    "search": 100,
+}
+DEFAULT_DAILY_BUDGET = 10_000 # default quota of a fresh Google Cloud project
+COMMENTS_PER_PAGE = 100
+
+_QUOTA_TZ = ZoneInfo("America/Los_Angeles") # YouTube resets quotas at midnight Pacific Time
+
+T = TypeVar("T")
+
+
+class QuotaBudgetExceededError(ValueError):
+    """Raised before sending a request that would exceed the configured daily budget."""
+
+
+def key_fingerprint(api_key: str) -> str:
+    """Stable, non-reversible id of an API key; raw keys are never written to disk."""
+    return hashlib.sha256(api_key.encode("utf-8")).hexdigest()[:12]
+
+
+def quota_day(now: datetime | None = None) -> date:
+    now = now or datetime.now(tz=timezone.utc)
+    return now.astimezone(_QUOTA_TZ).date()
+
+
+def endpoint_cost(endpoint: str) -> int:
+    try:
+        return ENDPOINT_COSTS[endpoint]
+    except KeyError:
+        raise ValueError(f"Unknown YouTube API endpoint: {endpoint}") from None
+
+
+def estimate_comment_units(comment_limit: int | None) -> int:
+    """Units needed to scrape one video with commentThreads.list (one unit per 100-comment page)."""
+    if comment_limit is None:
+        return 1 # unknown size; at least the first page
+    return max(1, math.ceil(comment_limit / COMMENTS_PER_PAGE))
+
+
+def plan_within_budget(
+        items: Sequence[T], *, remaining: int, unit_cost: int | Callable[[T], int]
+) -> tuple[list[T], list[T]]:
+    """
+    Split items (in their given order) into those that fit the remaining budget and the rest.
+    unit_cost is either the same for every item or a function of the item.
+    """
+    if not callable(unit_cost):
+        if unit_cost <= 0:
+            return list(items), []
+        fit = max(0, remaining // unit_cost)
+        return list(items[:fit]), list(items[fit:])
+    
+    fit = 0
+    for item in items:
+        cost = unit_cost(item)
+        if cost > remaining:
+            break
+        remaining -= cost
+        fit += 1
+    return list(items[:fit]), list(items[fit:])
+
+
+class QuotaLedger:
+    """
+    Thread-safe daily quota accounting per API key, persisted through a repository.
+
+    Every request is charged before it is sent, so a run stops cleanly at the budget
+    instead of failing mid-run on quotaExceeded.
+
+    Charges are written at most once per `flush_interval` seconds (and on flush()/close of the client).
+    Each write adds this ledger's unwritten units to the file under a lock and reads back what other
+    processes (a `schedule` next to a `scrape-channel`) spent, so their usage adds up.
+    """
+
+    def __init__(
+            self,
+            *,
+            daily_budget: int = DEFAULT_DAILY_BUDGET,
+            repo: JSONQuotaLedgerRepository | None = None,
+            clock: Callable[[], datetime] = lambda: datetime.now(tz=timezone.utc),
+            flush_interval: float = 1.0,
+            monotonic: Callable[[], float] = time.monotonic,
+    ) -> None:
+        if daily_budget < 1:
+            raise ValueError("daily_budget must be >= 1")
+        if flush_interval < 0:
+            raise ValueError("flush_interval must be >= 0")
+        self.daily_budget = daily_budget
+        self._repo = repo
+        self._clock = clock
+        self._flush_interval = flush_interval
+        self._monotonic = monotonic
+        self._lock = threading.Lock()
+        self._usage: dict[str, dict[str, int]] = repo.load() if repo is not None else {}
+        self._pending: dict[str, dict[str, int]] = {} # units charged here but not yet written
+        self._floors: dict[str, dict[str, int]] = {} # exhausted keys not yet written
+        self._last_flush = monotonic()
+
+    def used(self, api_key: str) -> int:
+        with self._lock:
+            return self._day_usage().get(key_fingerprint(api_key), 0)
+
+    def remaining(self, api_key: str) -> int:
+        return max(0, self.daily_budget - self.used(api_key))
+
+    def charge(self, api_key: str, endpoint: str) -> int:
+        """Reserve the units of one request. Returns the units charged."""
+        cost = endpoint_cost(endpoint)
+        fingerprint = key_fingerprint(api_key)
+        with self._lock:
+            day_usage = self._day_usage()
+            used = day_usage.get(fingerprint, 0)
+            if used + cost > self.daily_budget:
+                raise QuotaBudgetExceededError(
+                    f"Daily quota budget exhausted ({used}/{self.daily_budget} units used); "
+                    f"{endpoint}.list needs {cost} units."
+                )
+            day_usage[fingerprint] = used + cost
+            pending = self._pending.setdefault(self._day(), {})
+            pending[fingerprint] = pending.get(fingerprint, 0) + cost
+            if self._monotonic() - self._last_flush >= self._flush_interval:
+                self._flush_locked()
+        return cost
+
+    def mark_exhausted(self, api_key: str) -> None:
+        """Record that the API itself reported quotaExceeded for this key today."""
+        fingerprint = key_fingerprint(api_key)
+        with self._lock:
+            day_usage = self._day_usage()
+            day_usage[fingerprint] = max(day_usage.get(fingerprint, 0), self.daily_budget)
+            self._floors.setdefault(self._day(), {})[fingerprint] = self.daily_budget
+            self._flush_locked()
+
+    def flush(self) -> None:
+        """Write the unwritten charges now."""
+        with self._lock:
+            self._flush_locked()
+
+    def _day(self) -> str:
+        return quota_day(self._clock()).isoformat()
+
+    def _day_usage(self) -> dict[str, int]:
+        return self._usage.setdefault(self._day(), {})
+
+    def _flush_locked(self) -> None:
+        self._last_flush = self._monotonic()
+        if self._repo is None or not (self._pending or self._floors):
+            return
+        self._usage = self._repo.add(self._pending, floors=self._floors)
+        self._pending = {}
+        self._floors = {}
+
+
+class RateLimiter:
+    """Spaces out requests so that no more than `rate` start per second, across all threads."""
+
+    def __init__(
+            self,
+            rate: float,
+            *,
+            monotonic: Callable[[], float] = time.monotonic,
+            sleep: Callable[[float], None] = time.sleep,
+    ) -> None:
+        if rate <= 0:
+            raise ValueError("rate must be > 0")
+        self._interval = 1.0 / rate
+        self._monotonic = monotonic
+        self._sleep = sleep
+        self._lock = threading.Lock()
+        self._next_slot = 0.0
+
+    def acquire(self) -> None:
+        with self._lock:
+            now = self._monotonic()
+            slot = max(now, self._next_slot)
+            self._next_slot = slot + self._interval
+        if slot > now:
+            self._sleep(slot - now)
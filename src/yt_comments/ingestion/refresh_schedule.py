@@ -0,0 +1,93 @@
+from __future__ import annotations
+
+from dataclasses import replace
+from datetime import datetime, timedelta
+from typing import Sequence
+
+from yt_comments.ingestion.models import VideoRefreshState
+
+
+
+VELOCITY_SMOOTHING = 0.5 # weight of the newest reading in comments_per_day
+AGE_HALF_LIFE_DAYS = 30.0 # prior for videos without any count: expected activity halves every 30 days of age
+
+
+def _days(delta: timedelta) -> float:
+    return max(0.0, delta.total_seconds() / 86400)
+
+
+def observe_comment_count(state: VideoRefreshState, comment_count: int | None, now: datetime) -> VideoRefreshState:
+    """
+    Record a commentCount reading and update the growth rate.
+
+    The rate is the growth since the previous reading, smoothed with VELOCITY_SMOOTHING. The first
+    reading of a video seeds it with the lifetime average (count / age since published_at).
+    """
+    if comment_count is None:
+        return replace(state, observed_comment_count=None, observed_at_utc=now)
+    
+    velocity = state.comments_per_day
+    if state.observed_comment_count is not None and state.observed_at_utc is not None:
+        elapsed = _days(now - state.observed_at_utc)
+        if elapsed > 0:
+            rate = max(0, comment_count - state.observed_comment_count) / elapsed
+            velocity = rate if velocity is None else VELOCITY_SMOOTHING * rate + (1 - VELOCITY_SMOOTHING) * velocity
+    elif velocity is None and state.published_at is not None:
+        velocity = comment_count / max(1.0, _days(now - state.published_at))
+    return replace(state, observed_comment_count=comment_count, observed_at_utc=now, comments_per_day=velocity)
+
+
+def mark_scraped(state: VideoRefreshState, now: datetime) -> VideoRefreshState:
+    return replace(state, last_scraped_at_utc=now, scraped_comment_count=state.observed_comment_count)
+
+
+def comments_disabled(state: VideoRefreshState) -> bool:
+    return state.observed_at_utc is not None and state.observed_comment_count is None
+
+
+def expected_new_comments(state: VideoRefreshState, now: datetime) -> float:
+    """
+    Comments posted since the video was last scraped, as far as the state can tell.
+
+    With a count reading: the growth since the last scrape (the whole count for a video never scraped)
+    plus what the growth rate adds since that reading. Without one: the growth rate since the last
+    scrape, or for a video nothing is known about, a prior that halves every AGE_HALF_LIFE_DAYS of age.
+    """
+    if comments_disabled(state):
+        return 0.0
+    velocity = state.comments_per_day or 0.0
+    if state.observed_comment_count is not None and state.observed_at_utc is not None:
+        scraped = state.scraped_comment_count if state.last_scraped_at_utc is not None else None
+        pending = max(0, state.observed_comment_count - (scraped or 0))
+        return pending + velocity * _days(now - state.observed_at_utc)
+    if state.last_scraped_at_utc is not None:
+        return velocity * _days(now - state.last_scraped_at_utc)
+    if state.published_at is None:
+        return 1.0
+    return 0.5 ** (_days(now - state.published_at) / AGE_HALF_LIFE_DAYS)
+
+
+def due_for_refresh(
+        states: Sequence[VideoRefreshState],
+        *,
+        now: datetime,
+        min_new_comments: float = 1.0,
+        min_interval: timedelta = timedelta(0),
+) -> list[tuple[VideoRefreshState, float]]:
+    """
+    Videos worth scraping now with their expected new comments, highest first.
+
+    Videos never scraped are always due (unless their comments are disabled); the others once
+    `min_interval` has passed since their last scrape and at least `min_new_comments` are expected.
+    """
+    due: list[tuple[VideoRefreshState, float]] = []
+    for state in states:
+        if comments_disabled(state):
+            continue
+        expected = expected_new_comments(state, now)
+        if state.last_scraped_at_utc is not None:
+            if now - state.last_scraped_at_utc < min_interval or expected < min_new_comments:
+                continue
+        due.append((state, expected))
+    due.sort(key=lambda item: item[1], reverse=True)
+    return due
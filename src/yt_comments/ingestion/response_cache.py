@@ -0,0 +1,169 @@
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+import os
+import threading
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Callable
+
+
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_TTL = 6 * 3600.0 # seconds a cached page is served without asking the API
+DEFAULT_MAX_BYTES = 256 * 1024 * 1024
+
+# parameters that don't change the response; the API key must never reach the disk
+_IGNORED_PARAMS = frozenset({"key"})
+
+
+@dataclass(frozen=True, slots=True)
+class CachedResponse:
+    body: bytes
+    etag: str | None
+    stored_at: float # unix time of the last 200 or 304 for this request
+
+
+@dataclass(frozen=True, slots=True)
+class ResponseCacheStats:
+    hits: int # served from disk without a request
+    revalidated: int # 304 Not Modified, served from disk
+    misses: int # no usable entry, full response fetched
+
+
+class ResponseCache:
+    """
+    On-disk cache of successful API GET responses, one JSON file per distinct request.
+
+    Entries are keyed by URL and parameters (without the API key). Within `ttl` an entry is
+    served without a request; after that it is revalidated with If-None-Match, and a
+    304 Not Modified keeps serving the stored body. The directory is kept under `max_bytes`
+    by evicting the least recently used entries (file mtime is the last use, so recency
+    survives between runs).
+
+    Layout:
+      <cache_dir>/<sha256 of request>.json
+    """
+
+    def __init__(
+            self,
+            cache_dir: Path | str,
+            *,
+            ttl: float = DEFAULT_TTL,
+            max_bytes: int = DEFAULT_MAX_BYTES,
+            clock: Callable[[], float] = time.time,
+    ) -> None:
+        if ttl < 0:
+            raise ValueError("ttl must be >= 0")
+        if max_bytes < 1:
+            raise ValueError("max_bytes must be >= 1")
+        self.cache_dir = Path(cache_dir)
+        self.ttl = ttl
+        self.max_bytes = max_bytes
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._revalidated = 0
+        self._misses = 0
+
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        self._index: dict[str, tuple[int, float]] = {} # key -> (size, last used)
+        for path in self.cache_dir.glob("*.json"):
+            stat = path.stat()
+            self._index[path.stem] = (stat.st_size, stat.st_mtime)
+        self._total = sum(size for size, _ in self._index.values())
+
+    @staticmethod
+    def key(url: str, params: dict) -> str:
+        relevant = {k: str(v) for k, v in params.items() if k not in _IGNORED_PARAMS}
+        raw = json.dumps([url, sorted(relevant.items())], ensure_ascii=False)
+        return hashlib.sha256(raw.encode("utf-8")).hexdigest()
+
+    def get(self, url: str, params: dict) -> CachedResponse | None:
+        key = self.key(url, params)
+        path = self._path(key)
+        try:
+            with path.open("r", encoding="utf-8") as f:
+                record = json.load(f)
+        except (FileNotFoundError, ValueError):
+            return None
+        self._touch(key)
+        return CachedResponse(
+            body=record["body"].encode("utf-8"),
+            etag=record.get("etag"),
+            stored_at=record["stored_at"],
+        )
+
+    def is_fresh(self, entry: CachedResponse) -> bool:
+        return self._clock() - entry.stored_at <= self.ttl
+
+    def put(self, url: str, params: dict, body: bytes, etag: str | None) -> CachedResponse:
+        entry = CachedResponse(body=body, etag=etag, stored_at=self._clock())
+        key = self.key(url, params)
+        record = {
+            "url": url,
+            "params": {k: v for k, v in params.items() if k not in _IGNORED_PARAMS},
+            "etag": etag,
+            "stored_at": entry.stored_at,
+            "body": body.decode("utf-8"),
+        }
+        path = self._path(key)
+        tmp_path = path.with_name(f"{path.name}.{threading.get_ident()}.tmp")
+        with tmp_path.open("w", encoding="utf-8") as f:
+            json.dump(record, f, ensure_ascii=False)
+        os.replace(tmp_path, path) # atomic, concurrent readers see the old or the new entry
+
+        size = path.stat().st_size
+        with self._lock:
+            old_size, _ = self._index.get(key, (0, 0.0))
+            self._index[key] = (size, self._clock())
+            self._total += size - old_size
+            self._evict()
+        return entry
+
+    def refresh(self, url: str, params: dict, entry: CachedResponse) -> CachedResponse:
+        """Restart the TTL of an entry the API confirmed with 304 Not Modified."""
+        return self.put(url, params, entry.body, entry.etag)
+
+    def record(self, *, hit: bool = False, revalidated: bool = False) -> None:
+        with self._lock:
+            if hit:
+                self._hits += 1
+            elif revalidated:
+                self._revalidated += 1
+            else:
+                self._misses += 1
+
+    def stats(self) -> ResponseCacheStats:
+        with self._lock:
+            return ResponseCacheStats(hits=self._hits, revalidated=self._revalidated, misses=self._misses)
+
+    def size_bytes(self) -> int:
+        with self._lock:
+            return self._total
+
+    def _touch(self, key: str) -> None:
+        now = self._clock()
+        try:
+            os.utime(self._path(key), (now, now))
+        except FileNotFoundError:
+            return
+        with self._lock:
+            if key in self._index:
+                self._index[key] = (self._index[key][0], now)
+
+    def _evict(self) -> None:
+        # caller holds the lock
+        while self._total > self.max_bytes and self._index:
+            key = min(self._index, key=lambda k: self._index[k][1])
+            size, _ = self._index.pop(key)
+            self._total -= size
+            self._path(key).unlink(missing_ok=True)
+            logger.debug("Response cache entry evicted | key=%s size=%s", key, size)
+
+    def _path(self, key: str) -> Path:
+        return self.cache_dir / f"{key}.json"
@@ -0,0 +1,78 @@
+from __future__ import annotations
+
+import random
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+
+
+
+# reasons that will fail the same way no matter how often they are retried
+TERMINAL_REASONS = frozenset(
+    {
+        "commentsDisabled",
+        "videoNotFound",
+        "notFound",
+        "quotaExceeded",
+        "dailyLimitExceeded",
+        "keyInvalid",
+        "forbidden",
+    }
+)
+
+QUOTA_REASONS = frozenset({"quotaExceeded", "dailyLimitExceeded"})
+
+# failures tied to the API key rather than the request; another key may still succeed
+KEY_ROTATION_REASONS = QUOTA_REASONS | {"keyInvalid"}
+
+# short-term throttling reported by YouTube as 403 instead of 429
+RATE_LIMIT_REASONS = frozenset({"rateLimitExceeded", "userRateLimitExceeded"})
+
+
+@dataclass(frozen=True, slots=True)
+class RetryPolicy:
+    """
+    Exponential backoff with jitter for transient API failures.
+
+    Attempt n (1-based) waits base_delay * 2**(n-1), capped at max_delay, and then
+    shortened by a random fraction of up to `jitter` so concurrent workers don't retry in lockstep.
+    """
+    max_attempts: int = 5 # total attempts per request, including the first one
+    base_delay: float = 1.0
+    max_delay: float = 60.0
+    jitter: float = 0.5
+    retry_statuses: frozenset[int] = field(default_factory=lambda: frozenset({429, 500, 502, 503, 504}))
+
+    def __post_init__(self) -> None:
+        if self.max_attempts < 1:
+            raise ValueError("max_attempts must be >= 1")
+        if not 0.0 <= self.jitter <= 1.0:
+            raise ValueError("jitter must be in [0, 1]")
+
+    def backoff_delay(self, attempt: int, rng: random.Random | None = None) -> float:
+        delay = min(self.max_delay, self.base_delay * (2 ** (attempt - 1)))
+        r = (rng or random).random()
+        return delay * (1.0 - self.jitter * r)
+
+
+def parse_retry_after(value: str | None, *, now: datetime | None = None) -> float | None:
+    """
+    Parse a Retry-After header (delay in seconds or an HTTP date) into seconds to wait.
+    Returns None if the header is missing or malformed.
+    """
+    if not value:
+        return None
+
+    value = value.strip()
+    if value.isdigit():
+        return float(value)
+
+    try:
+        retry_at = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if retry_at.tzinfo is None:
+        retry_at = retry_at.replace(tzinfo=timezone.utc)
+
+    now = now or datetime.now(tz=timezone.utc)
+    return max(0.0, (retry_at - now).total_seconds())
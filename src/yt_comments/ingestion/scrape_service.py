@@ -1,30 +1,189 @@
 from __future__ import annotations
 
+import logging
 from dataclasses import dataclass
+from datetime import datetime, timezone
 from pathlib import Path
 
-from yt_comments.ingestion.models import Comment
+from yt_comments.ingestion.models import Comment, ScrapeCheckpoint
 from yt_comments.ingestion.youtube_api_client import YouTubeApiClient
-from yt_comments.storage.bronze_comments_repository import JSONLCommentsRepository
+from yt_comments.storage.bronze_comments_repository import JSONLCommentsRepository, JSONLCommentsWriter
 
 
 
+logger = logging.getLogger(__name__)
+
+
 @dataclass(slots=True)
 class ScrapeResult:
     video_id: str
     saved_count: int
     path: Path
-    
+    truncated: bool = False # the scrape stopped on `limit` before the video's last comment
+
 @dataclass(slots=True)
 class ScrapeCommentsService:
     client: YouTubeApiClient
     repo: JSONLCommentsRepository
+    flush_every_pages: int = 10
+    prefetch_pages: int = 0 # >0 pipelines pagination: next pages are requested while the current one is written
+    include_replies: bool = False # store replies (is_reply=True) right after their top-level comment
+    reply_workers: int = 4 # concurrent comments.list calls for threads with more than the inlined replies
+
+    def run(
+            self,
+            video_id: str,
+            *,
+            overwrite: bool = True,
+            limit: int | None = None,
+            resume: bool = False,
+            incremental: bool = False,
+        ) -> ScrapeResult:
+        """
+        Stream comments of a video into Bronze, one page at a time (memory is bounded by a page).
+
+        Pages go to a .part file that replaces the Bronze file atomically once the video is done.
+        Every `flush_every_pages` pages (and when the scrape fails) the file is flushed and a
+        checkpoint (next page token + rows written) is stored, so with resume=True an interrupted
+        scrape continues from its last committed page and appends to the partial file.
+
+        With incremental=True only comments newer than the newest stored one are fetched and appended
+        (see _run_incremental); if more than `limit` are new, the video is rescraped instead.
+
+        The result is marked truncated when the scrape stopped on `limit` with comments left unfetched.
+        """
+        if incremental:
+            return self._run_incremental(video_id, limit=limit)
+        
+        page_token: str | None = None
+        writer: JSONLCommentsWriter | None = None
+        base_rows = 0 # rows kept from the existing file when appending; they don't count toward `limit`
+
+        checkpoint = self.repo.load_checkpoint(video_id) if resume else None
+        if checkpoint is not None:
+            # rows written after the checkpoint (crash between flush and checkpoint save) are dropped
+            writer = self.repo.open_writer(video_id, resume_rows=checkpoint.row_count)
+            if writer.row_count == checkpoint.row_count:
+                page_token = checkpoint.next_page_token
+                base_rows = checkpoint.base_rows
+                logger.info(
+                    "Resuming scrape from checkpoint | video_id=%s rows=%s", video_id, writer.row_count
+                )
+            else:
+                logger.warning(
+                    "Partial Bronze file shorter than checkpoint, restarting | video_id=%s expected=%s found=%s",
+                    video_id, checkpoint.row_count, writer.row_count,
+                )
+                writer.close()
+                writer = None
+
+        if writer is None:
+            writer = self.repo.open_writer(video_id, overwrite=overwrite)
+            base_rows = writer.row_count
+
+        truncated = False
+        with writer:
+            pages_since_flush = 0
+            last_checkpoint_rows = writer.row_count
+            try:
+                pages = self.client.fetch_comment_pages(
+                    video_id,
+                    page_token=page_token,
+                    prefetch=self.prefetch_pages,
+                    include_replies=self.include_replies,
+                    reply_workers=self.reply_workers,
+                )
+                for page in pages:
+                    comments = page.comments
+                    if limit is not None:
+                        comments = comments[: max(0, limit - (writer.row_count - base_rows))]
+                        truncated = len(comments) < len(page.comments)
+                    writer.write(comments)
+                    page_token = page.next_page_token
+                    pages_since_flush += 1
 
-    def run(self, video_id: str, *, overwrite: bool = True, limit: int | None = None) -> ScrapeResult:
-        comments: list[Comment] = []
-        for c in self.client.fetch_comments(video_id):
-            comments.append(c)
-            if limit is not None and len(comments) >= limit:
+                    if page_token is None:
+                        break
+                    if limit is not None and writer.row_count - base_rows >= limit:
+                        truncated = True
+                        break
+
+                    if pages_since_flush >= self.flush_every_pages:
+                        self._checkpoint(writer, video_id, page_token, base_rows)
+                        last_checkpoint_rows = writer.row_count
+                        pages_since_flush = 0
+            except Exception:
+                # keep every page fetched so far resumable, not only the ones before the last periodic flush
+                if page_token is not None and writer.row_count > last_checkpoint_rows:
+                    self._checkpoint(writer, video_id, page_token, base_rows)
+                raise
+
+            path = writer.commit()
+
+        self.repo.clear_checkpoint(video_id)
+        return ScrapeResult(
+            video_id=video_id, saved_count=writer.row_count - base_rows, path=path, truncated=truncated
+        )
+
+    def _checkpoint(self, writer: JSONLCommentsWriter, video_id: str, next_page_token: str, base_rows: int) -> None:
+        writer.flush()
+        self.repo.save_checkpoint(
+            ScrapeCheckpoint(
+                video_id=video_id,
+                next_page_token=next_page_token,
+                row_count=writer.row_count,
+                updated_at_utc=datetime.now(tz=timezone.utc),
+                base_rows=base_rows,
+            )
+        )
+
+    def _run_incremental(self, video_id: str, *, limit: int | None) -> ScrapeResult:
+        """
+        Fetch newest-first and stop paginating at the first already stored comment.
+
+        New comments are buffered and appended in one go at the end: a crash must not leave new rows
+        in Bronze while older unseen ones are still missing, or the next run would stop too early.
+        The buffer is bounded by the number of comments posted since the last scrape.
+        With replies, only new threads (and their replies) are picked up, not new replies on old threads.
+
+        If more than `limit` comments are new, appending the newest `limit` would leave a gap that
+        later runs never fill (they stop at the newest stored comment), so a full scrape with `limit`
+        replaces the file instead.
+        """
+        marker = self.repo.newest_marker(video_id)
+        if marker is None:
+            logger.info("No stored comments, running full scrape | video_id=%s", video_id)
+            return self.run(video_id, overwrite=True, limit=limit)
+        newest_at, newest_ids = marker
+
+        new_comments: list[Comment] = []
+        done = False
+        pages = self.client.fetch_comment_pages(
+            video_id,
+            order="time",
+            include_replies=self.include_replies,
+            reply_workers=self.reply_workers,
+        )
+        for page in pages:
+            for comment in page.comments:
+                if comment.published_at is not None and not comment.is_reply:
+                    if comment.published_at < newest_at or comment.comment_id in newest_ids:
+                        done = True
+                        break
+                new_comments.append(comment)
+                if limit is not None and len(new_comments) > limit:
+                    logger.warning(
+                        "More new comments than the limit, rescraping instead of appending | video_id=%s limit=%s",
+                        video_id, limit,
+                    )
+                    pages.close()
+                    return self.run(video_id, overwrite=True, limit=limit)
+            if done or page.next_page_token is None:
                 break
-        path = self.repo.save(video_id, comments, overwrite=overwrite)
-        return ScrapeResult(video_id=video_id, saved_count=len(comments), path=path)
\ No newline at end of file
+
+        path = self.repo.save(video_id, new_comments, overwrite=False)
+        logger.info(
+            "Incremental scrape completed | video_id=%s new=%s since=%s",
+            video_id, len(new_comments), newest_at.isoformat(),
+        )
+        return ScrapeResult(video_id=video_id, saved_count=len(new_comments), path=path)
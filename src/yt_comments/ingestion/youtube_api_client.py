@@ -1,42 +1,383 @@
 from __future__ import annotations
 
-from dataclasses import dataclass
+import logging
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from contextlib import AbstractContextManager, nullcontext
+from dataclasses import dataclass, field
 from datetime import datetime
-from typing import Iterable
+from typing import Callable, Iterable, Iterator, Sequence
 
 import requests
 
+from yt_comments.ingestion.api_key_pool import ApiKeyPool
 from yt_comments.ingestion.channel_ref_parser import ParsedChannelRef
-from yt_comments.ingestion.models import Comment, ChannelVideo, ChannelVideoDiscovery
+from yt_comments.ingestion.http_transport import HttpTransport
+from yt_comments.ingestion.prefetch import prefetch as prefetch_items
+from yt_comments.ingestion.models import (
+    Comment, CommentPage, ChannelVideo, ChannelVideoDiscovery, VideoStatistics
+)
+from yt_comments.ingestion.quota import QuotaLedger, RateLimiter, key_fingerprint
+from yt_comments.ingestion.response_cache import CachedResponse, ResponseCache
+from yt_comments.ingestion.retry import (
+    KEY_ROTATION_REASONS, QUOTA_REASONS, RATE_LIMIT_REASONS, TERMINAL_REASONS, RetryPolicy, parse_retry_after
+)
 
 
 
+logger = logging.getLogger(__name__)
+
+DEFAULT_BASE_URL = "https://www.googleapis.com/youtube/v3"
+MAX_IDS_PER_CALL = 50 # videos.list accepts at most 50 ids per request
+# discovery endpoints whose pages are worth caching; comments and video statistics must stay live
+CACHEABLE_ENDPOINTS = frozenset({"search", "playlistItems", "channels"})
+
+# partial responses: only the fields the parsers below read are sent over the wire
+FIELD_MASKS: dict[str, str] = {
+    "commentThreads": (
+        "nextPageToken,"
+        "items(snippet/topLevelComment(id,snippet(textOriginal,textDisplay,authorDisplayName,likeCount,publishedAt)))"
+    ),
+    "commentThreads+replies": (
+        "nextPageToken,"
+        "items(snippet(topLevelComment(id,snippet(textOriginal,textDisplay,authorDisplayName,likeCount,publishedAt)),"
+        "totalReplyCount),"
+        "replies/comments(id,snippet(parentId,textOriginal,textDisplay,authorDisplayName,likeCount,publishedAt)))"
+    ),
+    "comments": (
+        "nextPageToken,"
+        "items(id,snippet(parentId,textOriginal,textDisplay,authorDisplayName,likeCount,publishedAt))"
+    ),
+    "search": "nextPageToken,items(id/videoId,snippet(title,publishedAt,channelId))",
+    "channels": "items(id,contentDetails/relatedPlaylists/uploads)",
+    "playlistItems": "nextPageToken,items(snippet/title,contentDetails(videoId,videoPublishedAt))",
+    "videos": "items(id,statistics(viewCount,commentCount))",
+}
+
+
+def _error_reason(resp: requests.Response) -> str | None:
+    """Extract the first error reason from a YouTube API error payload, if any."""
+    try:
+        errors = resp.json().get("error", {}).get("errors") or []
+        return errors[0].get("reason") if errors else None
+    except Exception:
+        return None
+
+
+def _raise_for_api_error(resp: requests.Response) -> None:
+    """raise_for_status, with quota/key errors and Google error messages turned into readable ValueErrors."""
+    try:
+        resp.raise_for_status() # for 4xx and 5xx it returns HTTPError
+    except requests.HTTPError as e:
+        try:
+            message = resp.json().get("error", {}).get("message") or "Unknown YouTube API error"
+        except Exception:
+            message = None
+        reason = _error_reason(resp)
+        
+        if reason in QUOTA_REASONS:
+            raise ValueError(
+                "YouTube API quota exceeded for this project/API key. "
+                "Try again later or use a different API key/project."
+            ) from e
+        
+        if reason in {"keyInvalid", "forbidden"}:
+            raise ValueError(
+                "YouTube API key is invalid or lacks permission for this request."
+            ) from e
+        
+        if message:
+            raise ValueError(f"YouTube API error: {message}") from e
+        raise
+
+
+def _parse_api_datetime(value: str) -> datetime:
+    return datetime.fromisoformat(value.replace("Z", "+00:00"))
+
+
+def _parse_comment(video_id: str, resource: dict, *, parent_id: str | None = None) -> Comment:
+    """Comment from a comment resource: a thread's topLevelComment or a reply (parent_id set)."""
+    snippet = resource.get("snippet", {})
+    comment_id = resource.get("id")
+    text = snippet.get("textOriginal") or snippet.get("textDisplay") or ""
+    published_at_raw = snippet.get("publishedAt")
+    
+    published_at : datetime | None = None
+    if published_at_raw:
+        published_at = _parse_api_datetime(published_at_raw)
+        
+    if not comment_id:
+        # defensive approach; if there is a schema drift or unexpected response
+        raise ValueError("YouTube API returned a comment without an id")
+    
+    return Comment(
+        video_id=video_id,
+        comment_id=comment_id,
+        text=text,
+        author=snippet.get("authorDisplayName"),
+        like_count=snippet.get("likeCount"),
+        published_at=published_at,
+        is_reply=parent_id is not None,
+        parent_id=parent_id,
+    )
+
+
+def _cached_response(url: str, entry: CachedResponse) -> requests.Response:
+    """Rebuild a 200 response from a cache entry, so callers handle it like a live one."""
+    resp = requests.Response()
+    resp.status_code = 200
+    resp.url = url
+    resp._content = entry.body
+    resp.encoding = "utf-8"
+    resp.headers["Content-Type"] = "application/json; charset=UTF-8"
+    if entry.etag:
+        resp.headers["ETag"] = entry.etag
+    return resp
+
+
+def _parse_count(value: str | None) -> int | None:
+    # the API sends counts as strings and omits them when hidden (e.g. comments disabled)
+    return int(value) if value is not None else None
+
 @dataclass(slots=True)
 class YouTubeApiClient:
     api_key: str
+    base_url: str = DEFAULT_BASE_URL # overridable, e.g. to point the client at the local API emulator
+    max_in_flight: int | None = None # global cap on concurrent HTTP requests shared by all workers using this client
+    transport: HttpTransport = field(default_factory=HttpTransport) # one pooled session for all endpoints and workers
+    retry_policy: RetryPolicy = field(default_factory=RetryPolicy)
+    quota: QuotaLedger | None = None # charges unit costs per request against a daily budget
+    rate_limiter: RateLimiter | None = None
+    sleep: Callable[[float], None] = time.sleep # injectable for tests
+    key_pool: ApiKeyPool | None = None # spreads requests over several keys; defaults to a pool of api_key alone
+    response_cache: ResponseCache | None = None # opt-in disk cache for discovery pages (CACHEABLE_ENDPOINTS)
+    _in_flight: AbstractContextManager = field(init=False, repr=False)
+    
+    def __post_init__(self) -> None:
+        if self.max_in_flight is not None and self.max_in_flight < 1:
+            raise ValueError("max_in_flight must be >= 1")
+        self.base_url = self.base_url.rstrip("/")
+        if self.key_pool is None:
+            self.key_pool = ApiKeyPool([self.api_key])
+        self._in_flight = (
+            threading.BoundedSemaphore(self.max_in_flight)
+            if self.max_in_flight is not None
+            else nullcontext()
+        )
+    
+    def _get(self, url: str, params: dict) -> requests.Response:
+        """
+        Send a GET request over the shared transport, waiting for a free slot if max_in_flight is set.
+
+        Every attempt is signed with a key from the pool. If the API rejects that key for good
+        (quotaExceeded, keyInvalid), the key is retired and the same request is sent again right away
+        with another one, so a page in flight is never lost to a key running dry.
+
+        Transient failures (connection errors, timeouts, 429/5xx and rate-limit 403s) are retried
+        with exponential backoff, honoring Retry-After. Each call covers a single page, so a retry
+        resumes from the failing page. The last response is returned as is for the caller to handle.
+
+        With a response cache, discovery pages cached within its TTL are returned without a request
+        (and without quota); older ones are revalidated with If-None-Match.
+        """
+        endpoint = url.rsplit("/", 1)[-1]
+        cache = self.response_cache if endpoint in CACHEABLE_ENDPOINTS else None
+        cached = cache.get(url, params) if cache is not None else None
+        if cached is not None and cache.is_fresh(cached):
+            cache.record(hit=True)
+            return _cached_response(url, cached)
+        headers = {"If-None-Match": cached.etag} if cached is not None and cached.etag else None
+        
+        attempt = 1
+        while True:
+            # every attempt costs quota, retries included
+            key = self.key_pool.acquire(endpoint, quota=self.quota)
+            if self.rate_limiter is not None:
+                self.rate_limiter.acquire()
+            try:
+                with self._in_flight:
+                    resp = self.transport.get(url, params={**params, "key": key}, headers=headers)
+            except (requests.ConnectionError, requests.Timeout, requests.exceptions.ChunkedEncodingError) as e:
+                if attempt >= self.retry_policy.max_attempts:
+                    raise
+                delay = self.retry_policy.backoff_delay(attempt)
+                logger.warning(
+                    "Request failed, retrying | url=%s attempt=%s delay=%.2fs error=%s",
+                    url, attempt, delay, e,
+                )
+            else:
+                reason = _error_reason(resp) if resp.status_code in (400, 403) else None
+                if reason in KEY_ROTATION_REASONS:
+                    if self.quota is not None and reason in QUOTA_REASONS:
+                        self.quota.mark_exhausted(key) # the ledger steers requests away from it from now on
+                    else:
+                        self.key_pool.retire(key, reason)
+                    if self.key_pool.has_capacity(self.quota):
+                        logger.warning(
+                            "API key rejected, retrying on another key | url=%s key=%s reason=%s",
+                            url, key_fingerprint(key), reason,
+                        )
+                        continue
+                    return resp
+                if cached is not None and resp.status_code == 304:
+                    cache.record(revalidated=True)
+                    return _cached_response(url, cache.refresh(url, params, cached))
+                delay = self._retry_delay(resp, attempt)
+                if delay is None:
+                    if cache is not None:
+                        cache.record()
+                        if resp.status_code == 200:
+                            cache.put(url, params, resp.content, resp.headers.get("ETag"))
+                    return resp
+                logger.warning(
+                    "Transient API error, retrying | url=%s status=%s attempt=%s delay=%.2fs",
+                    url, resp.status_code, attempt, delay,
+                )
+            self.sleep(delay)
+            attempt += 1
+    
+    def _retry_delay(self, resp: requests.Response, attempt: int) -> float | None:
+        """Return how long to wait before retrying `resp`, or None if it must not be retried."""
+        status = resp.status_code
+        if status not in self.retry_policy.retry_statuses and status != 403:
+            return None
+        
+        reason = _error_reason(resp)
+        if reason in TERMINAL_REASONS:
+            return None
+        if status == 403 and reason not in RATE_LIMIT_REASONS:
+            return None
+        if attempt >= self.retry_policy.max_attempts:
+            return None
+        
+        retry_after = parse_retry_after(resp.headers.get("Retry-After"))
+        if retry_after is None:
+            return self.retry_policy.backoff_delay(attempt)
+        if retry_after > self.retry_policy.max_delay:
+            return None # server asks for a longer pause than we are willing to block for
+        return retry_after
+    
+    def remaining_quota(self) -> int | None:
+        """Units left in today's budget over all keys in rotation, or None if no quota ledger is configured."""
+        if self.quota is None:
+            return None
+        return self.key_pool.remaining(self.quota)
+    
+    def close(self) -> None:
+        if self.quota is not None:
+            self.quota.flush()
+        self.transport.close()
     
     def fetch_comments(self, video_id: str) -> Iterable[Comment]:
         """
         Fetch top-level comments for a video using YouTube Data API v3
         Note: top-level comments only, pagination supported
         """
-        base_url = "https://www.googleapis.com/youtube/v3/commentThreads" # commentThreads returns top-level comments + metadata (2think about comments endpoint which returns replies and ind comments)        
-        session = requests.Session()
+        for page in self.fetch_comment_pages(video_id):
+            yield from page.comments # generator is created to not store everything in a list at a time. (to avoid RAM leak)
+    
+    def fetch_comment_pages(
+            self,
+            video_id: str,
+            *,
+            page_token: str | None = None,
+            order: str | None = None,
+            prefetch: int = 0,
+            include_replies: bool = False,
+            reply_workers: int = 4,
+        ) -> Iterator[CommentPage]:
+        """
+        Fetch top-level comments page by page, starting at `page_token` (None = first page).
+        Each page carries the token of the page after it, which makes it a resumable checkpoint.
+        order="time" asks for newest threads first (used by incremental scrapes).
+
+        With include_replies=True threads are requested with part=snippet,replies and every top-level
+        comment is followed by its replies on the same page. The API inlines up to 5 replies per thread;
+        only threads with more (totalReplyCount) cost extra comments.list calls, which run concurrently
+        on up to `reply_workers` threads.
+
+        With prefetch > 0 pagination is pipelined: a background thread sends the next request as soon
+        as nextPageToken is known and keeps up to `prefetch` raw pages ready, while parsing (and whatever
+        the caller does with a page, e.g. writing it) happens on the calling thread. If the caller stops
+        early, up to prefetch + 1 pages were already requested.
+        """
+        payloads = self._comment_thread_payloads(
+            video_id, page_token=page_token, order=order, include_replies=include_replies
+        )
+        if prefetch > 0:
+            payloads = prefetch_items(payloads, prefetch, name=f"prefetch-{video_id}")
+        
+        if not include_replies:
+            for data in payloads:
+                yield self._parse_comment_threads(video_id, data)
+            return
+        
+        if reply_workers < 1:
+            raise ValueError("reply_workers must be >= 1")
+        with ThreadPoolExecutor(max_workers=reply_workers, thread_name_prefix=f"replies-{video_id}") as pool:
+            for data in payloads:
+                yield self._parse_comment_threads(video_id, data, reply_pool=pool)
+    
+    def fetch_replies(self, video_id: str, parent_id: str) -> list[Comment] | None:
+        """
+        All replies of one comment thread via comments.list?parentId=.
+        Returns None if the thread is gone (deleted between the two requests).
+        """
+        base_url = f"{self.base_url}/comments"
         
+        replies: list[Comment] = []
         page_token: str | None = None
+        while True:
+            params = {
+                "parentId": parent_id,
+                "part": "snippet",
+                "maxResults": 100,
+                "textFormat": "plainText",
+                "fields": FIELD_MASKS["comments"],
+            }
+            if page_token:
+                params["pageToken"] = page_token
+            
+            resp = self._get(base_url, params)
+            if resp.status_code == 404:
+                logger.warning("Comment thread not found, keeping inline replies | parent_id=%s", parent_id)
+                return None
+            _raise_for_api_error(resp)
+            
+            data = resp.json()
+            for item in data.get("items", []):
+                replies.append(_parse_comment(video_id, item, parent_id=parent_id))
+            
+            page_token = data.get("nextPageToken")
+            if not page_token:
+                return replies
+    
+    def _comment_thread_payloads(
+            self,
+            video_id: str,
+            *,
+            page_token: str | None,
+            order: str | None,
+            include_replies: bool = False,
+        ) -> Iterator[dict]:
+        """Raw commentThreads.list pages; only pulls the next page token before requesting the next page."""
+        base_url = f"{self.base_url}/commentThreads" # commentThreads returns top-level comments + metadata (2think about comments endpoint which returns replies and ind comments)        
         
         while True:
             params = {
-                "key": self.api_key,
                 "videoId": video_id,
-                "part": "snippet",
+                "part": "snippet,replies" if include_replies else "snippet",
                 "maxResults": 100,
                 "textFormat": "plainText",
+                "fields": FIELD_MASKS["commentThreads+replies" if include_replies else "commentThreads"],
             }
+            if order:
+                params["order"] = order
             if page_token:
                 params["pageToken"] = page_token # not relevant for the 1. page, for the rest ensures we send the correct page
                 
-            resp = session.get(base_url, params=params, timeout=30)
+            resp = self._get(base_url, params)
             
             try:
                 resp.raise_for_status() # for 4xx and 5xx it returns HTTPError
@@ -81,44 +422,43 @@ class YouTubeApiClient:
                 raise
             
             data = resp.json()
+            yield data
             
-            items = data.get("items", [])
-            for item in items:
-                snippet = (
-                    item.get("snippet", {})
-                    .get("topLevelComment", {})
-                    .get("snippet", {})
-                ) # youtube returns nested json 
-                
-                comment_id = item.get("snippet", {}).get("topLevelComment", {}).get("id")
-                text = snippet.get("textOriginal") or snippet.get("textDisplay") or ""
-                author = snippet.get("authorDisplayName")
-                like_count = snippet.get("likeCount")
-                published_at_raw = snippet.get("publishedAt")
-                
-                published_at : datetime | None = None
-                if published_at_raw:
-                    published_at = datetime.fromisoformat(
-                        published_at_raw.replace("Z", "+00:00") # no need to replace Z in python >v3.11 but still keep it if anyone would like to run it on older versions
-                    )
-                    
-                if not comment_id:
-                    # defensive approach; if there is a schema drift or unexpected response
-                    raise ValueError("YouTube API returned a comment without an id")
-                
-                yield Comment(
-                    video_id=video_id,
-                    comment_id=comment_id,
-                    text=text,
-                    author=author,
-                    like_count=like_count,
-                    published_at=published_at,
-                    is_reply=False,
-                ) # generator is created to not store everything in a list at a time. (to avoid RAM leak)
-                
             page_token = data.get("nextPageToken")
             if not page_token:
                 break
+    
+    def _parse_comment_threads(
+            self,
+            video_id: str,
+            data: dict,
+            *,
+            reply_pool: ThreadPoolExecutor | None = None,
+        ) -> CommentPage:
+        threads: list[tuple[Comment, list[Comment], Future | None]] = []
+        for item in data.get("items", []):
+            snippet = item.get("snippet", {}) # youtube returns nested json 
+            top_level = _parse_comment(video_id, snippet.get("topLevelComment", {}))
+            
+            replies: list[Comment] = []
+            follow_up: Future | None = None
+            if reply_pool is not None:
+                inline = (item.get("replies") or {}).get("comments") or []
+                replies = [_parse_comment(video_id, r, parent_id=top_level.comment_id) for r in inline]
+                if (snippet.get("totalReplyCount") or 0) > len(inline):
+                    follow_up = reply_pool.submit(self.fetch_replies, video_id, top_level.comment_id)
+            threads.append((top_level, replies, follow_up))
+        
+        comments: list[Comment] = []
+        for top_level, replies, follow_up in threads:
+            comments.append(top_level)
+            if follow_up is not None:
+                fetched = follow_up.result()
+                if fetched is not None:
+                    replies = fetched
+            comments.extend(replies)
+            
+        return CommentPage(video_id=video_id, comments=comments, next_page_token=data.get("nextPageToken"))
             
     def discover_videos(self, request: ChannelVideoDiscovery) -> Iterable[ChannelVideo]:
         """
@@ -128,9 +468,16 @@ class YouTubeApiClient:
         - filters by channel_id
         - returns only videos
         - supports published_after / published_before
+
+        request.engine="uploads" pages the uploads playlist instead (see discover_uploads).
         """
-        base_url = "https://www.googleapis.com/youtube/v3/search" # commentSearch returns search results, not full results    
-        session = requests.Session()
+        if request.engine == "uploads":
+            yield from self.discover_uploads(request)
+            return
+        if request.engine != "search":
+            raise ValueError(f"Unsupported discovery engine: {request.engine}")
+        
+        base_url = f"{self.base_url}/search" # commentSearch returns search results, not full results    
         
         page_token: str | None = None
         yielded = 0
@@ -143,12 +490,12 @@ class YouTubeApiClient:
             max_results = 50 if remaining is None else min(50, remaining)
             
             params = {
-                "key": self.api_key,
                 "channelId": request.channel_id,
                 "part": "snippet",
                 "type": "video",
                 "order": "date",
                 "maxResults": max_results,
+                "fields": FIELD_MASKS["search"],
             }
             
             if request.published_after:
@@ -158,7 +505,7 @@ class YouTubeApiClient:
             if page_token:
                 params["pageToken"] = page_token # not relevant for the 1. page, for the rest ensures we send the correct page
                 
-            resp = session.get(base_url, params=params, timeout=30)
+            resp = self._get(base_url, params)
             
             try:
                 resp.raise_for_status() # for 4xx and 5xx it returns HTTPError
@@ -232,17 +579,146 @@ class YouTubeApiClient:
             page_token = data.get("nextPageToken")
             if not page_token:
                 break
+    
+    def discover_uploads(self, request: ChannelVideoDiscovery) -> Iterator[ChannelVideo]:
+        """
+        Discover videos through the channel's uploads playlist (playlistItems.list).
+
+        Costs 1 unit per 50 videos instead of 100 for search.list and is not capped at ~500 results,
+        so the full history of large channels can be listed. The playlist is ordered newest first:
+        the date window is applied on the client side and paging stops at the first page that lies
+        entirely before published_after. Views and comment counts are filled in with one batched
+        videos.list call per page.
+        """
+        base_url = f"{self.base_url}/playlistItems"
+        playlist_id = self.resolve_uploads_playlist_id(request.channel_id)
+        
+        page_token: str | None = None
+        yielded = 0
+        
+        while True:
+            params = {
+                "playlistId": playlist_id,
+                "part": "snippet,contentDetails",
+                "maxResults": 50, # same cost for any page size, and the date filter may drop items
+                "fields": FIELD_MASKS["playlistItems"],
+            }
+            if page_token:
+                params["pageToken"] = page_token
+            
+            resp = self._get(base_url, params)
+            if resp.status_code == 404 and _error_reason(resp) == "playlistNotFound":
+                logger.info("Channel has no uploads playlist | channel_id=%s", request.channel_id)
+                return
+            _raise_for_api_error(resp)
+            
+            data = resp.json()
+            
+            in_window: list[tuple[str, str, datetime]] = []
+            dated = 0
+            older = 0
+            for item in data.get("items", []):
+                details = item.get("contentDetails", {})
+                video_id = details.get("videoId")
+                published_at_raw = details.get("videoPublishedAt") # missing for private/deleted videos
+                
+                if not video_id:
+                    raise ValueError("YouTube API returned a playlist item without videoId")
+                if not published_at_raw:
+                    continue
+                
+                dated += 1
+                published_at = _parse_api_datetime(published_at_raw)
+                if request.published_after and published_at < request.published_after:
+                    older += 1
+                    continue
+                if request.published_before and published_at > request.published_before:
+                    continue
+                in_window.append((video_id, item.get("snippet", {}).get("title") or "", published_at))
+            
+            if request.limit is not None:
+                in_window = in_window[: request.limit - yielded] # don't pay for statistics we won't return
+            
+            stats = self.fetch_video_statistics([video_id for video_id, _, _ in in_window])
+            for video_id, title, published_at in in_window:
+                video_stats = stats.get(video_id)
+                yield ChannelVideo(
+                    video_id=video_id,
+                    channel_id=request.channel_id,
+                    title=title,
+                    published_at=published_at,
+                    view_count=video_stats.view_count if video_stats else None,
+                    comment_count=video_stats.comment_count if video_stats else None,
+                )
+                yielded += 1
+            
+            if request.limit is not None and yielded >= request.limit:
+                return
+            
+            page_token = data.get("nextPageToken")
+            if not page_token or (dated and older == dated):
+                break
+    
+    def fetch_video_statistics(self, video_ids: Sequence[str]) -> dict[str, VideoStatistics]:
+        """
+        Fetch view/comment counts with videos.list, batching up to 50 ids per request (1 unit each).
+        Videos the API doesn't return (deleted, private) are missing from the result.
+        """
+        base_url = f"{self.base_url}/videos"
+        
+        stats: dict[str, VideoStatistics] = {}
+        for start in range(0, len(video_ids), MAX_IDS_PER_CALL):
+            batch = video_ids[start:start + MAX_IDS_PER_CALL]
+            params = {
+                "id": ",".join(batch),
+                "part": "statistics",
+                "maxResults": MAX_IDS_PER_CALL,
+                "fields": FIELD_MASKS["videos"],
+            }
+            resp = self._get(base_url, params)
+            _raise_for_api_error(resp)
+            
+            for item in resp.json().get("items", []):
+                video_id = item.get("id")
+                if not video_id:
+                    raise ValueError("YouTube API returned a video without id")
+                statistics = item.get("statistics", {})
+                stats[video_id] = VideoStatistics(
+                    video_id=video_id,
+                    view_count=_parse_count(statistics.get("viewCount")),
+                    comment_count=_parse_count(statistics.get("commentCount")),
+                )
+        return stats
+    
+    def resolve_uploads_playlist_id(self, channel_id: str) -> str:
+        base_url = f"{self.base_url}/channels"
+        
+        params = {
+            "id": channel_id,
+            "part": "contentDetails",
+            "fields": FIELD_MASKS["channels"],
+        }
+        resp = self._get(base_url, params)
+        _raise_for_api_error(resp)
+        
+        items = resp.json().get("items", [])
+        if not items:
+            raise ValueError(f"Channel not found for: {channel_id}")
+        
+        playlist_id = items[0].get("contentDetails", {}).get("relatedPlaylists", {}).get("uploads")
+        if not playlist_id:
+            raise ValueError(f"YouTube API returned no uploads playlist for channel: {channel_id}")
+        return playlist_id
             
     def resolve_channel_id(self, ref: ParsedChannelRef) -> str:
-        base_url = "https://www.googleapis.com/youtube/v3/channels"
-        session = requests.Session()
+        base_url = f"{self.base_url}/channels"
         
         if ref.kind == "channel_id":
             return ref.value
         
         params = {
-            "key": self.api_key,
             "part": "id",
+            "fields": FIELD_MASKS["channels"],
         }
         
         if ref.kind == "handle":
@@ -255,7 +731,7 @@ class YouTubeApiClient:
         else:
             raise ValueError(f"Unsupported channel ref kind: {ref.kind}")
         
-        resp = session.get(base_url, params=params, timeout=30)
+        resp = self._get(base_url, params)
         
         try:
             resp.raise_for_status() # for 4xx and 5xx it returns HTTPError
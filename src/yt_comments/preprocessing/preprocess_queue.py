@@ -0,0 +1,79 @@
+from __future__ import annotations
+
+import logging
+import queue
+import threading
+
+from yt_comments.preprocessing.preprocess_service import PreprocessCommentsService
+
+
+
+logger = logging.getLogger(__name__)
+
+_STOP = object()
+
+
+class PreprocessQueue:
+    """
+    Background Silver builder fed with video ids while their scrapes are still running.
+
+    `submit` hands a video whose Bronze file is complete to one of `workers` threads running
+    PreprocessCommentsService. The queue holds at most `maxsize` waiting videos; when it is full,
+    `submit` blocks, so scraping slows down to the pace of preprocessing instead of piling up work.
+    """
+
+    def __init__(
+            self,
+            service: PreprocessCommentsService,
+            *,
+            workers: int = 1,
+            maxsize: int = 8,
+            overwrite: bool = True,
+            batch_size: int = 5000,
+    ) -> None:
+        if workers < 1:
+            raise ValueError("workers must be >= 1")
+        if maxsize < 1:
+            raise ValueError("maxsize must be >= 1")
+        self._service = service
+        self._overwrite = overwrite
+        self._batch_size = batch_size
+        self._queue: queue.Queue = queue.Queue(maxsize=maxsize)
+        self._lock = threading.Lock()
+        self._results: dict[str, str | Exception] = {}
+        self._closed = False
+        self._threads = [
+            threading.Thread(target=self._work, name=f"preprocess-{i}", daemon=True)
+            for i in range(workers)
+        ]
+        for thread in self._threads:
+            thread.start()
+
+    def submit(self, video_id: str) -> None:
+        self._queue.put(video_id)
+
+    def close(self) -> dict[str, str | Exception]:
+        """Wait for every submitted video; returns the Silver path or the error per video id."""
+        if not self._closed:
+            self._closed = True
+            for _ in self._threads:
+                self._queue.put(_STOP)
+        for thread in self._threads:
+            thread.join()
+        with self._lock:
+            return dict(self._results)
+
+    def _work(self) -> None:
+        while True:
+            video_id = self._queue.get()
+            if video_id is _STOP:
+                return
+            try:
+                out_path = self._service.run(video_id, overwrite=self._overwrite, batch_size=self._batch_size)
+                logger.info("Preprocessing completed | video_id=%s out_path=%s", video_id, out_path)
+                result: str | Exception = out_path
+            except Exception as e:
+                logger.warning("Preprocessing failed | video_id=%s error=%s", video_id, e)
+                result = e
+            with self._lock:
+                self._results[video_id] = result
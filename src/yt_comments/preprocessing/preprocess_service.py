@@ -1,9 +1,10 @@
 from __future__ import annotations
 
 from datetime import datetime, timezone
-from typing import Iterable
+from typing import Iterable, Iterator
 
 import pyarrow as pa
+import pyarrow.compute as pc
 
 from yt_comments.ingestion.models import Comment
 from yt_comments.preprocessing.contract import PREPROCESS_VERSION
@@ -17,8 +18,13 @@ class PreprocessCommentsService:
     """
     Silver-layer builder:
       Bronze (JSONL) -> deterministic transform -> Silver (Parquet)
+
+    Two engines produce the same Silver rows: "arrow" parses Bronze into Arrow tables and
+    transforms whole columns, "rows" goes through one Comment and one dict per comment.
     """
     
+    ENGINES = ("arrow", "rows")
+    
     SILVER_SCHEMA = pa.schema(
         [
             ("video_id", pa.string()),
@@ -44,7 +50,7 @@ class PreprocessCommentsService:
         self._silver_repo = silver_repo
         self._tp = text_preprocessor
         
-    def run(self, video_id: str, *, overwrite: bool = True, batch_size: int = 5000) -> str:
+    def run(self, video_id: str, *, overwrite: bool = True, batch_size: int = 5000, engine: str = "arrow") -> str:
         """
         Run preprocessing for a single video and persist results to the Silver layer.
 
@@ -52,13 +58,32 @@ class PreprocessCommentsService:
             video_id: Target video identifier.
             overwrite: Whether to overwrite existing Silver data.
             batch_size: Number of rows per parquet write batch.
+            engine: "arrow" (columnar) or "rows" (per comment).
 
         Returns:
             Path to the written Silver parquet file.
+        
+        Both engines stream Bronze, so memory use doesn't grow with the size of the video: "rows"
+        holds at most `batch_size` rows, "arrow" one Bronze chunk (see iter_comment_tables).
         """
-        bronze_comments = self._bronze_repo.load(video_id)
+        if engine not in self.ENGINES:
+            raise ValueError(f"Unknown preprocessing engine: {engine}")
         processed_at = datetime.now(timezone.utc)
         
+        if engine == "arrow":
+            out_path = self._silver_repo.save_tables(
+                video_id,
+                tables = (
+                    self._bronze_table_to_silver(table, processed_at=processed_at)
+                    for table in self._bronze_repo.iter_comment_tables(video_id)
+                ),
+                schema = self.SILVER_SCHEMA,
+                overwrite = overwrite,
+                batch_size = batch_size,
+            )
+            return str(out_path)
+        
+        bronze_comments = self._bronze_repo.iter_comments(video_id)
         out_path = self._silver_repo.save(
             video_id,
             rows = self._iter_silver_rows(bronze_comments, processed_at=processed_at),
@@ -69,7 +94,28 @@ class PreprocessCommentsService:
         return str(out_path)
         
             
-    def _iter_silver_rows(self, comments: Iterable[Comment], *, processed_at: datetime) -> Iterable[dict]:
+    def _bronze_table_to_silver(self, bronze: pa.Table, *, processed_at: datetime) -> pa.Table:
+        """Column version of _comment_to_silver_row: the same defaults for missing values, no per-row objects."""
+        n = bronze.num_rows
+        ts_type = self.SILVER_SCHEMA.field("published_at").type
+        epoch = pa.scalar(datetime.fromtimestamp(0, tz=timezone.utc), type=ts_type)
+        return pa.Table.from_arrays(
+            [
+                bronze["video_id"],
+                bronze["comment_id"],
+                pc.fill_null(bronze["author"], ""),
+                pc.fill_null(bronze["published_at"], epoch),
+                pc.fill_null(bronze["like_count"], 0),
+                pc.fill_null(bronze["is_reply"], False),
+                bronze["text"],
+                self._tp.clean_array(bronze["text"]),
+                pa.repeat(pa.scalar(PREPROCESS_VERSION, type=pa.string()), n),
+                pa.repeat(pa.scalar(processed_at, type=ts_type), n),
+            ],
+            schema=self.SILVER_SCHEMA,
+        )
+    
+    def _iter_silver_rows(self, comments: Iterable[Comment], *, processed_at: datetime) -> Iterator[dict]:
         """Yield Silver-formatted rows from raw Bronze comments."""
         for c in comments:
             yield self._comment_to_silver_row(c, processed_at=processed_at)
@@ -3,12 +3,23 @@ from __future__ import annotations
 import re
 import unicodedata
 
+import pyarrow as pa
+import pyarrow.compute as pc
+
 
 
 # compiling just once outside of the main class
 _URL_RE = re.compile(r"https?://\S+|www\.\S+", flags=re.IGNORECASE) # if people send url in comms; found during testing some videos
 _WS_RE = re.compile(r"\s+")
 
+# RE2 (Arrow) versions of the patterns above. RE2's \s is ASCII-only, so the class spells out
+# every character str.isspace() accepts
+_WS_CLASS = r"\t\n\x0b\x0c\r\x1c-\x1f \x85\xa0\x{1680}\x{2000}-\x{200a}\x{2028}\x{2029}\x{202f}\x{205f}\x{3000}"
+_URL_RE2 = rf"(?i)https?://[^{_WS_CLASS}]+|www\.[^{_WS_CLASS}]+"
+_WS_RE2 = rf"[{_WS_CLASS}]+"
+# str.lower() applies special casing that Arrow's utf8_lower doesn't (U+0130, final sigma)
+_SPECIAL_CASING_RE2 = r"[\x{130}\x{3a3}]"
+
 class TextPreprocessor:
     """
     General text normalization for silver layer
@@ -23,4 +34,31 @@ class TextPreprocessor:
         text = text.lower()
         text = _WS_RE.sub(" ", text).strip()
         
+        return text
+    
+    def clean_array(self, texts: pa.Array | pa.ChunkedArray) -> pa.Array:
+        """
+        clean() for a whole column, with Arrow compute kernels instead of a Python call per row.
+
+        Rows containing characters whose lowercase needs special casing are cleaned with clean(),
+        so the output matches it row for row. Nulls stay null.
+        """
+        if isinstance(texts, pa.ChunkedArray):
+            texts = texts.combine_chunks()
+        # Arrow's utf8_normalize leaves composed characters decomposed (NFC/NFKC included), so NFKC
+        # stays in Python, for non-ASCII rows only: ASCII text is already NFKC
+        text = texts
+        non_ascii = pc.invert(pc.fill_null(pc.string_is_ascii(texts), True))
+        if pc.any(non_ascii).as_py():
+            normalized = [unicodedata.normalize("NFKC", t) for t in pc.filter(texts, non_ascii).to_pylist()]
+            text = pc.replace_with_mask(texts, non_ascii, pa.array(normalized, type=pa.string()))
+        text = pc.replace_substring_regex(text, pattern=_URL_RE2, replacement=self._replace_urls_with)
+        special = pc.fill_null(pc.match_substring_regex(text, _SPECIAL_CASING_RE2), False)
+        text = pc.utf8_lower(text)
+        text = pc.replace_substring_regex(text, pattern=_WS_RE2, replacement=" ")
+        text = pc.utf8_trim(text, characters=" ")
+        
+        if pc.any(special).as_py():
+            fixed = [self.clean(t) for t in pc.filter(texts, special).to_pylist()]
+            text = pc.replace_with_mask(text, special, pa.array(fixed, type=pa.string()))
         return text
\ No newline at end of file
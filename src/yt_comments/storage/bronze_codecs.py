@@ -0,0 +1,67 @@
+from __future__ import annotations
+
+import gzip
+import io
+from pathlib import Path
+from typing import IO
+
+import pyarrow as pa
+
+
+
+BRONZE_CODECS = ("none", "gzip", "zstd")
+
+# committed Bronze file suffix per codec; the codec of a file is read back from its name
+CODEC_SUFFIXES = {
+    "none": ".jsonl",
+    "gzip": ".jsonl.gz",
+    "zstd": ".jsonl.zst",
+}
+
+GZIP_LEVEL = 6 # zlib's default: close to the best ratio on comment text at a fraction of level 9's cost
+
+
+def codec_available(codec: str) -> bool:
+    """gzip comes with Python; zstd is used through pyarrow when its build includes the codec."""
+    if codec == "zstd":
+        return pa.Codec.is_available("zstd")
+    return codec in CODEC_SUFFIXES
+
+
+def check_codec(codec: str) -> None:
+    if codec not in CODEC_SUFFIXES:
+        raise ValueError(f"Unknown Bronze codec: {codec} (expected one of {', '.join(BRONZE_CODECS)})")
+    if not codec_available(codec):
+        raise ValueError(f"Bronze codec {codec} is not available in this pyarrow build")
+
+
+def codec_for_path(path: Path) -> str:
+    for codec in ("gzip", "zstd"):
+        if path.name.endswith(CODEC_SUFFIXES[codec]):
+            return codec
+    return "none"
+
+
+def open_binary(path: Path) -> pa.NativeFile:
+    """Open a Bronze file for reading as decompressed bytes, through the codec given by its suffix."""
+    codec = codec_for_path(path)
+    check_codec(codec)
+    return pa.input_stream(str(path), compression=None if codec == "none" else codec)
+
+
+def open_text(path: Path, mode: str = "r", *, codec: str | None = None) -> IO[str]:
+    """
+    Open a Bronze file as UTF-8 text, streaming through `codec` (default: the one given by its suffix).
+
+    mode is "r", "w" or "a"; appending to a compressed file adds a new gzip member / zstd frame,
+    which readers decode as one continuous stream.
+    """
+    codec = codec or codec_for_path(path)
+    if codec == "gzip":
+        return gzip.open(path, f"{mode}t", encoding="utf-8", compresslevel=GZIP_LEVEL)
+    if codec == "zstd":
+        check_codec(codec)
+        raw = path.open(f"{mode}b")
+        stream = pa.CompressedInputStream(raw, "zstd") if mode == "r" else pa.CompressedOutputStream(raw, "zstd")
+        return io.TextIOWrapper(stream, encoding="utf-8") # closing it closes the stream and the file
+    return path.open(mode, encoding="utf-8")
@@ -1,57 +1,200 @@
 from __future__ import annotations
 
 import json
+import os
+import shutil
 from dataclasses import asdict
-from datetime import datetime
+from datetime import datetime, timezone
 from pathlib import Path
-from typing import Iterable
+from typing import IO, Iterable, Iterator, Sequence
 
-from yt_comments.ingestion.models import Comment 
+import pyarrow as pa
+import pyarrow.json as pa_json
 
+from yt_comments.ingestion.models import Comment, ScrapeCheckpoint
+from yt_comments.storage.bronze_codecs import CODEC_SUFFIXES, check_codec, codec_for_path, open_binary, open_text
+from yt_comments.storage.json_state import _atomic_write_json
+
+
+
+class JSONLCommentsWriter:
+    """
+    Streaming writer for one video's Bronze file.
+
+    Rows go to the plain <video_id>.jsonl.part and become the Bronze file only on commit(): renamed
+    over <video_id>.jsonl, or compressed into <video_id>.jsonl.gz / .jsonl.zst. Readers never see a
+    half-written file, and a failed run keeps everything written so far in a form resume can truncate.
+    """
+    
+    def __init__(
+            self,
+            part_path: Path,
+            final_path: Path,
+            f: IO[str],
+            *,
+            row_count: int = 0,
+            replaces: Sequence[Path] = (),
+    ) -> None:
+        self.part_path = part_path
+        self.final_path = final_path
+        self._f = f
+        self.row_count = row_count # rows in the .part file, including resumed / appended ones
+        self._replaces = replaces # the video's Bronze files in other codecs, removed on commit
+        
+    def write(self, comments: Iterable[Comment]) -> int:
+        written = 0
+        for c in comments:
+            self._f.write(json.dumps(JSONLCommentsRepository._comment_to_record(c), ensure_ascii=False))
+            self._f.write("\n")
+            written += 1
+        self.row_count += written
+        return written
+    
+    def flush(self) -> None:
+        """Make every row written so far durable (safe to checkpoint)."""
+        self._f.flush()
+        os.fsync(self._f.fileno())
+        
+    def commit(self) -> Path:
+        self.flush()
+        self._f.close()
+        if codec_for_path(self.final_path) == "none":
+            os.replace(self.part_path, self.final_path) # atomic on the same filesystem
+        else:
+            tmp_path = self.final_path.with_name(f"{self.final_path.name}.tmp")
+            with self.part_path.open("r", encoding="utf-8") as src:
+                with open_text(tmp_path, "w", codec=codec_for_path(self.final_path)) as dst:
+                    shutil.copyfileobj(src, dst, length=1 << 20)
+            with tmp_path.open("rb") as f:
+                os.fsync(f.fileno())
+            os.replace(tmp_path, self.final_path)
+            self.part_path.unlink()
+        for path in self._replaces:
+            path.unlink(missing_ok=True)
+        return self.final_path
+    
+    def close(self) -> None:
+        """Close without committing; the .part file stays for a later resume."""
+        if not self._f.closed:
+            self._f.flush()
+            self._f.close()
+            
+    def __enter__(self) -> JSONLCommentsWriter:
+        return self
+    
+    def __exit__(self, *exc) -> None:
+        self.close()
 
 
 class JSONLCommentsRepository:
     """
     Stores one JSON object per line (JSONL), one file per video_id:
-      data/bronze/<video_id>.jsonl
+      data/bronze/<video_id>.jsonl       (codec="none")
+      data/bronze/<video_id>.jsonl.gz    (codec="gzip")
+      data/bronze/<video_id>.jsonl.zst   (codec="zstd")
+
+    Files are written with the repository's codec and read with whatever codec their suffix names,
+    so plain and compressed videos can share a directory. Rewriting a video replaces its file in
+    any other codec.
+
+    While a scrape is running or after it failed, rows are in the plain <video_id>.jsonl.part,
+    and its checkpoint lives next to it:
+      data/bronze/_checkpoints/<video_id>.json
     """
     
-    def __init__(self, data_dir: Path | str = "data/bronze") -> None:
+    # Comment fields as Arrow columns; published_at strings (with or without offset, naive = UTC)
+    # are parsed by the JSON reader itself
+    BRONZE_SCHEMA = pa.schema(
+        [
+            ("video_id", pa.string()),
+            ("comment_id", pa.string()),
+            ("text", pa.string()),
+            ("author", pa.string()),
+            ("like_count", pa.int64()),
+            ("published_at", pa.timestamp("us", tz="UTC")),
+            ("is_reply", pa.bool_()),
+            ("parent_id", pa.string()),
+        ]
+    )
+    TABLE_CHUNK_BYTES = 64 * 1024 * 1024 # decompressed JSONL handed to one multithreaded read_json call
+    
+    def __init__(self, data_dir: Path | str = "data/bronze", *, codec: str = "none") -> None:
+        check_codec(codec)
         self.data_dir = Path(data_dir)
         self.data_dir.mkdir(parents=True, exist_ok=True)
+        self.codec = codec
         
     def _path_for_video(self, video_id: str) -> Path:
-        return self.data_dir / f"{video_id}.jsonl"
+        return self.data_dir / f"{video_id}{CODEC_SUFFIXES[self.codec]}"
+    
+    def _paths_for_video(self, video_id: str) -> list[Path]:
+        """Candidate Bronze files of a video, the repository's own codec first."""
+        suffixes = [CODEC_SUFFIXES[self.codec]] + [s for s in CODEC_SUFFIXES.values() if s != CODEC_SUFFIXES[self.codec]]
+        return [self.data_dir / f"{video_id}{suffix}" for suffix in suffixes]
+    
+    def _existing_path(self, video_id: str) -> Path | None:
+        for path in self._paths_for_video(video_id):
+            if path.exists():
+                return path
+        return None
+    
+    def _other_codec_paths(self, video_id: str) -> list[Path]:
+        return self._paths_for_video(video_id)[1:]
+    
+    def _path_for_partial(self, video_id: str) -> Path:
+        return self.data_dir / f"{video_id}.jsonl.part"
+    
+    def _path_for_checkpoint(self, video_id: str) -> Path:
+        return self.data_dir / "_checkpoints" / f"{video_id}.json"
+    
+    def exists(self, video_id: str) -> bool:
+        """True if a committed Bronze file exists for the video."""
+        return self._existing_path(video_id) is not None
     
     def save(self, video_id: str, comments: Iterable[Comment], *, overwrite: bool = True) -> Path:
         """
         Save comments for a video_id to JSONL.
 
-        overwrite=True means writing a fresh file each time.
+        overwrite=True means writing a fresh file each time. Appending to a file written with
+        another codec re-encodes it with the repository's codec.
         """
         # 2DO: add append too
         path = self._path_for_video(video_id)
-        mode = "w" if overwrite else "a"
+        existing = self._existing_path(video_id)
+        convert = not overwrite and existing is not None and existing != path
+        mode = "w" if overwrite or convert else "a"
         
-        with path.open(mode, encoding="utf-8") as f:
+        with open_text(path, mode) as f:
+            if convert:
+                with open_text(existing) as src:
+                    shutil.copyfileobj(src, f, length=1 << 20)
             for c in comments:
                 record = self._comment_to_record(c)
                 f.write(json.dumps(record, ensure_ascii=False))
                 f.write("\n")
-                
+        
+        if overwrite or convert:
+            for other in self._other_codec_paths(video_id):
+                other.unlink(missing_ok=True)
         return path
     
     def load(self, video_id: str) -> list[Comment]:
         """
-        Load comments for a video_id from JSONL.
+        Load comments for a video_id from JSONL, decompressing on the fly.
         Returns [] if the file does not exist.
         """
-        path = self._path_for_video(video_id)
-        if not path.exists():
-            return []
+        return list(self.iter_comments(video_id))
+    
+    def iter_comments(self, video_id: str) -> Iterator[Comment]:
+        """
+        Stream a video's comments one by one; only the current line is held in memory.
+        Yields nothing if the file does not exist.
+        """
+        path = self._existing_path(video_id)
+        if path is None:
+            return
         
-        comments: list[Comment] = []
-        with path.open("r", encoding="utf-8") as f:
+        with open_text(path) as f:
             for line_no, line in enumerate(f, start=1):
                 line = line.strip()
                 if not line:
@@ -61,11 +204,159 @@ class JSONLCommentsRepository:
                 except json.JSONDecodeError as e:
                     raise ValueError(f"Invalid JSON in {path} at line {line_no}") from e
                 try:
-                    comments.append(self._record_to_comment(record))
+                    yield self._record_to_comment(record)
                 except (TypeError, ValueError, KeyError) as e:
                     raise ValueError(f"Invalid comment record in {path} at line {line_no}") from e
+    
+    def iter_comment_tables(self, video_id: str, *, chunk_bytes: int | None = None) -> Iterator[pa.Table]:
+        """
+        Stream a video's comments as Arrow tables with BRONZE_SCHEMA, no Python object per row.
+
+        The file is cut at line boundaries into chunks of about `chunk_bytes` (default TABLE_CHUNK_BYTES),
+        each parsed by Arrow's multithreaded JSON reader, so memory is bounded by the chunk and not by
+        the video. Fields missing from older rows are null, unknown fields are ignored.
+        Yields nothing if the file does not exist.
+        """
+        path = self._existing_path(video_id)
+        if path is None:
+            return
+        chunk_bytes = chunk_bytes or self.TABLE_CHUNK_BYTES
+        parse_options = pa_json.ParseOptions(explicit_schema=self.BRONZE_SCHEMA, unexpected_field_behavior="ignore")
+        
+        with open_binary(path) as f:
+            rest = b""
+            while True:
+                data = f.read(chunk_bytes)
+                chunk = rest + data
+                if data:
+                    cut = chunk.rfind(b"\n") + 1
+                    chunk, rest = chunk[:cut], chunk[cut:]
+                if chunk.strip():
+                    try:
+                        yield pa_json.read_json(pa.BufferReader(chunk), parse_options=parse_options)
+                    except pa.ArrowInvalid as e:
+                        raise ValueError(f"Invalid comment records in {path}: {e}") from e
+                if not data:
+                    break
+    
+    def read_table(self, video_id: str) -> pa.Table:
+        """All of a video's comments as one Arrow table (empty if the file does not exist)."""
+        tables = list(self.iter_comment_tables(video_id))
+        if not tables:
+            return self.BRONZE_SCHEMA.empty_table()
+        return pa.concat_tables(tables)
+    
+    def newest_marker(self, video_id: str) -> tuple[datetime, frozenset[str]] | None:
+        """
+        Newest stored published_at of a video's top-level comments and the comment ids published
+        at exactly that time. Replies are ignored: a new reply can land on an old thread.
+        Returns None if nothing with a timestamp is stored yet.
+        """
+        newest: datetime | None = None
+        ids: set[str] = set()
+        for comment in self.iter_comments(video_id):
+            published_at = comment.published_at
+            if published_at is None or comment.is_reply:
+                continue
+            if published_at.tzinfo is None:
+                published_at = published_at.replace(tzinfo=timezone.utc) # naive timestamps are stored as UTC
+            if newest is None or published_at > newest:
+                newest = published_at
+                ids = {comment.comment_id}
+            elif published_at == newest:
+                ids.add(comment.comment_id)
+        
+        if newest is None:
+            return None
+        return newest, frozenset(ids)
+    
+    def open_writer(
+            self,
+            video_id: str,
+            *,
+            overwrite: bool = True,
+            resume_rows: int | None = None,
+        ) -> JSONLCommentsWriter:
+        """
+        Open a streaming writer for a video; commit() stores it with the repository's codec.
+
+        resume_rows=N continues the existing .part file after its first N rows (rows past N were
+        written after the last checkpoint and are dropped). Otherwise a new .part file is started,
+        empty if overwrite=True or as a copy of the current Bronze file to append to it.
+        Check writer.row_count: it is lower than resume_rows if the .part file was shorter.
+        """
+        part_path = self._path_for_partial(video_id)
+        final_path = self._path_for_video(video_id)
+        
+        replaces = self._other_codec_paths(video_id)
+        
+        if resume_rows is not None:
+            if not part_path.exists():
+                part_path.touch()
+            row_count = self._truncate_rows(part_path, resume_rows)
+            return JSONLCommentsWriter(
+                part_path, final_path, part_path.open("a", encoding="utf-8"), row_count=row_count, replaces=replaces
+            )
         
-        return comments
+        row_count = 0
+        existing = self._existing_path(video_id)
+        if not overwrite and existing is not None:
+            if codec_for_path(existing) == "none":
+                shutil.copyfile(existing, part_path)
+            else:
+                with open_text(existing) as src, part_path.open("w", encoding="utf-8") as dst:
+                    shutil.copyfileobj(src, dst, length=1 << 20)
+            row_count = self._truncate_rows(part_path, None) # only counts (and drops a partial last line)
+        else:
+            part_path.write_text("", encoding="utf-8")
+        return JSONLCommentsWriter(
+            part_path, final_path, part_path.open("a", encoding="utf-8"), row_count=row_count, replaces=replaces
+        )
+    
+    @staticmethod
+    def _truncate_rows(path: Path, row_count: int | None) -> int:
+        """
+        Keep only the first `row_count` complete rows of a JSONL file (None = all), dropping any
+        partial last line from an interrupted write. Returns the number of rows actually kept.
+        """
+        kept = 0
+        with path.open("r+b") as f:
+            while row_count is None or kept < row_count:
+                line = f.readline()
+                if not line:
+                    break
+                if line.endswith(b"\n"):
+                    kept += 1
+                else:
+                    f.seek(-len(line), os.SEEK_CUR)
+                    break
+            f.truncate()
+        return kept
+    
+    def save_checkpoint(self, checkpoint: ScrapeCheckpoint) -> Path:
+        path = self._path_for_checkpoint(checkpoint.video_id)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        
+        record = asdict(checkpoint)
+        record["updated_at_utc"] = checkpoint.updated_at_utc.isoformat()
+        
+        _atomic_write_json(path, record, indent=None)
+        
+        return path
+    
+    def load_checkpoint(self, video_id: str) -> ScrapeCheckpoint | None:
+        """Returns None if the video has no unfinished scrape."""
+        path = self._path_for_checkpoint(video_id)
+        if not path.exists():
+            return None
+        
+        with path.open("r", encoding="utf-8") as f:
+            record = json.load(f)
+        record["updated_at_utc"] = datetime.fromisoformat(record["updated_at_utc"])
+        return ScrapeCheckpoint(**record)
+    
+    def clear_checkpoint(self, video_id: str) -> None:
+        self._path_for_checkpoint(video_id).unlink(missing_ok=True)
     
     @staticmethod
     def _comment_to_record(comment: Comment) -> dict:
@@ -0,0 +1,39 @@
+from __future__ import annotations
+
+import json
+from pathlib import Path
+
+from yt_comments.storage.json_state import _atomic_write_json
+
+
+
+class JSONCommentCountRepository:
+    """
+    JSON repository for the API commentCount of each video at its last successful Bronze write.
+
+    Layout:
+      data/state/comment_counts.json
+
+    Payload: {"<video_id>": comment_count}
+    """
+    def __init__(self, data_root: Path | str = "data") -> None:
+        self.data_root = Path(data_root)
+
+    def load(self) -> dict[str, int]:
+        path = self._counts_path()
+        if not path.exists():
+            return {}
+
+        with path.open("r", encoding="utf-8") as f:
+            return json.load(f)
+
+    def save(self, counts: dict[str, int]) -> Path:
+        path = self._counts_path()
+        path.parent.mkdir(parents=True, exist_ok=True)
+
+        _atomic_write_json(path, counts, sort_keys=True)
+
+        return path
+
+    def _counts_path(self) -> Path:
+        return self.data_root / "state" / "comment_counts.json"
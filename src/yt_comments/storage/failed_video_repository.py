@@ -0,0 +1,58 @@
+from __future__ import annotations
+
+import json
+from dataclasses import asdict
+from datetime import datetime
+from pathlib import Path
+
+from yt_comments.ingestion.models import FailedVideo
+from yt_comments.storage.json_state import _atomic_write_json
+
+
+
+class JSONFailedVideoRepository:
+    """
+    JSON repository for the retry queue of videos that failed during a channel scrape.
+
+    Layout:
+      data/state/failed_videos/<channel_id>.json
+
+    Payload: {"<video_id>": FailedVideo fields}, in the order the videos were discovered.
+    """
+    def __init__(self, data_root: Path | str = "data") -> None:
+        self.data_root = Path(data_root)
+
+    def load(self, channel_id: str) -> dict[str, FailedVideo]:
+        path = self._queue_path(channel_id)
+        if not path.exists():
+            return {}
+
+        with path.open("r", encoding="utf-8") as f:
+            payload = json.load(f)
+
+        failed: dict[str, FailedVideo] = {}
+        for video_id, record in payload.items():
+            record["last_failed_at_utc"] = datetime.fromisoformat(record["last_failed_at_utc"])
+            failed[video_id] = FailedVideo(**record)
+        return failed
+
+    def save(self, channel_id: str, failed: dict[str, FailedVideo]) -> Path:
+        """Replace the channel's queue; an empty queue removes the file."""
+        path = self._queue_path(channel_id)
+        if not failed:
+            path.unlink(missing_ok=True)
+            return path
+        path.parent.mkdir(parents=True, exist_ok=True)
+
+        payload = {}
+        for video_id, video in failed.items():
+            record = asdict(video)
+            record["last_failed_at_utc"] = video.last_failed_at_utc.isoformat()
+            payload[video_id] = record
+
+        _atomic_write_json(path, payload)
+
+        return path
+
+    def _queue_path(self, channel_id: str) -> Path:
+        return self.data_root / "state" / "failed_videos" / f"{channel_id}.json"
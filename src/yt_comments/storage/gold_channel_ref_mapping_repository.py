@@ -1,7 +1,7 @@
 from __future__ import annotations
 
 import json
-from datetime import datetime, timezone
+from datetime import datetime, timedelta, timezone
 from pathlib import Path
 
 from yt_comments.ingestion.channel_ref_parser import parse_channel_ref
@@ -34,7 +34,11 @@ class JSONChannelRefRepository:
         return path
     
     
-    def load(self, raw_input: str) -> str:
+    def load(self, raw_input: str, *, max_age: timedelta | None = None) -> str:
+        """
+        Channel id saved for `raw_input`. With max_age, a mapping resolved longer ago than that
+        counts as missing (KeyError), so the caller resolves it again.
+        """
         normalized_ref = self._normalize_input_ref(raw_input)
         path = self._ref_path()
         
@@ -46,6 +50,15 @@ class JSONChannelRefRepository:
         if entry is None:
             raise KeyError(f"Channel reference not found in mapping: {raw_input}")
         
+        if max_age is not None:
+            resolved_at_raw = entry.get("resolved_at_utc")
+            resolved_at = (
+                datetime.fromisoformat(resolved_at_raw.replace("Z", "+00:00"))
+                if resolved_at_raw else None
+            )
+            if resolved_at is None or datetime.now(tz=timezone.utc) - resolved_at > max_age:
+                raise KeyError(f"Channel reference mapping is older than {max_age}: {raw_input}")
+        
         return entry["channel_id"]
         
 
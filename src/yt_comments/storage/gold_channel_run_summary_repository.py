@@ -64,6 +64,7 @@ class JSONChannelRunSummaryRepository:
                 datetime.fromisoformat(data["published_before"])
                 if data["published_before"] else None
             ),
+            skipped_unchanged_count=data.get("skipped_unchanged_count", 0), # missing in older summaries
         )
     
     def _dir_for_channel(self, channel_id: str) -> Path:
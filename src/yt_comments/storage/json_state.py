@@ -0,0 +1,44 @@
+from __future__ import annotations
+
+import json
+import os
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Any, Iterator
+
+try:
+    import fcntl
+except ImportError: # Windows
+    fcntl = None
+    import msvcrt
+
+
+
+def _atomic_write_json(path: Path, payload: Any, *, indent: int | None = 2, sort_keys: bool = False) -> None:
+    """
+    Write `payload` as JSON to a .tmp sibling and move it over `path`.
+
+    os.replace is atomic on the same filesystem, so readers and restarts see either the old
+    file or the new one, never a half-written state file.
+    """
+    tmp_path = path.with_suffix(".json.tmp")
+    with tmp_path.open("w", encoding="utf-8") as f:
+        json.dump(payload, f, ensure_ascii=False, indent=indent, sort_keys=sort_keys)
+    os.replace(tmp_path, path)
+
+
+@contextmanager
+def _file_lock(path: Path) -> Iterator[None]:
+    """
+    Hold an exclusive lock on a `<path>.lock` sibling, shared by every process using `path`.
+
+    Blocks until the lock is free; it is released when the block exits (closing the lock file).
+    """
+    lock_path = path.with_name(f"{path.name}.lock")
+    with lock_path.open("a+b") as f:
+        if fcntl is not None:
+            fcntl.flock(f.fileno(), fcntl.LOCK_EX)
+        else:
+            f.seek(0)
+            msvcrt.locking(f.fileno(), msvcrt.LK_LOCK, 1)
+        yield
@@ -0,0 +1,73 @@
+from __future__ import annotations
+
+import json
+from pathlib import Path
+
+from yt_comments.storage.json_state import _atomic_write_json, _file_lock
+
+
+
+class JSONQuotaLedgerRepository:
+    """
+    JSON repository for YouTube API quota usage, kept across runs.
+
+    Layout:
+      data/state/quota_ledger.json
+
+    Payload: {"<quota_day>": {"<key_fingerprint>": used_units}}
+    """
+    def __init__(self, data_root: Path | str = "data", *, keep_days: int = 7) -> None:
+        self.data_root = Path(data_root)
+        self.keep_days = keep_days
+
+    def load(self) -> dict[str, dict[str, int]]:
+        path = self._ledger_path()
+        if not path.exists():
+            return {}
+
+        with path.open("r", encoding="utf-8") as f:
+            return json.load(f)
+
+    def save(self, usage: dict[str, dict[str, int]]) -> Path:
+        path = self._ledger_path()
+        path.parent.mkdir(parents=True, exist_ok=True)
+
+        _atomic_write_json(path, self._recent_days(usage), sort_keys=True)
+
+        return path
+
+    def add(
+            self,
+            increments: dict[str, dict[str, int]],
+            *,
+            floors: dict[str, dict[str, int]] | None = None,
+    ) -> dict[str, dict[str, int]]:
+        """
+        Add `increments` to the usage on disk and raise entries to at least their `floors`.
+
+        The read-merge-write runs under a file lock, so processes sharing the ledger add up their
+        usage instead of overwriting each other's. Returns the merged usage, including other processes'.
+        """
+        path = self._ledger_path()
+        path.parent.mkdir(parents=True, exist_ok=True)
+
+        with _file_lock(path):
+            usage = self.load()
+            for day, units_by_key in increments.items():
+                day_usage = usage.setdefault(day, {})
+                for fingerprint, units in units_by_key.items():
+                    day_usage[fingerprint] = day_usage.get(fingerprint, 0) + units
+            for day, units_by_key in (floors or {}).items():
+                day_usage = usage.setdefault(day, {})
+                for fingerprint, units in units_by_key.items():
+                    day_usage[fingerprint] = max(day_usage.get(fingerprint, 0), units)
+            self.save(usage)
+
+        return self._recent_days(usage)
+
+    def _recent_days(self, usage: dict[str, dict[str, int]]) -> dict[str, dict[str, int]]:
+        # quota days are ISO dates, so the lexical order is chronological
+        return {day: usage[day] for day in sorted(usage)[-self.keep_days:]}
+
+    def _ledger_path(self) -> Path:
+        return self.data_root / "state" / "quota_ledger.json"
@@ -0,0 +1,81 @@
+from __future__ import annotations
+
+import json
+from dataclasses import asdict
+from datetime import datetime
+from pathlib import Path
+
+from yt_comments.ingestion.models import VideoRefreshState
+from yt_comments.storage.json_state import _atomic_write_json
+
+
+
+_DATETIME_FIELDS = ("published_at", "observed_at_utc", "last_scraped_at_utc")
+
+
+class JSONRefreshStateRepository:
+    """
+    JSON repository for the per-video state of the refresh scheduler.
+
+    Layout:
+      data/state/refresh/<channel_id>.json
+
+    Payload: {"discovered_at_utc": <last video list discovery>, "videos": {"<video_id>": VideoRefreshState fields}},
+    datetimes as ISO strings.
+    """
+    def __init__(self, data_root: Path | str = "data") -> None:
+        self.data_root = Path(data_root)
+
+    def load(self, channel_id: str) -> dict[str, VideoRefreshState]:
+        states: dict[str, VideoRefreshState] = {}
+        for video_id, record in self._load_payload(channel_id).get("videos", {}).items():
+            for name in _DATETIME_FIELDS:
+                if record.get(name) is not None:
+                    record[name] = datetime.fromisoformat(record[name])
+            states[video_id] = VideoRefreshState(**record)
+        return states
+
+    def load_discovered_at(self, channel_id: str) -> datetime | None:
+        """When the channel's video list was last discovered, None if never."""
+        discovered_at = self._load_payload(channel_id).get("discovered_at_utc")
+        return datetime.fromisoformat(discovered_at) if discovered_at is not None else None
+
+    def save(
+            self,
+            channel_id: str,
+            states: dict[str, VideoRefreshState],
+            *,
+            discovered_at_utc: datetime | None = None,
+    ) -> Path:
+        path = self._state_path(channel_id)
+        path.parent.mkdir(parents=True, exist_ok=True)
+
+        videos = {}
+        for video_id, state in states.items():
+            record = asdict(state)
+            for name in _DATETIME_FIELDS:
+                if record[name] is not None:
+                    record[name] = record[name].isoformat()
+            videos[video_id] = record
+        payload = {
+            "discovered_at_utc": discovered_at_utc.isoformat() if discovered_at_utc is not None else None,
+            "videos": videos,
+        }
+
+        _atomic_write_json(path, payload)
+
+        return path
+
+    def _load_payload(self, channel_id: str) -> dict:
+        path = self._state_path(channel_id)
+        if not path.exists():
+            return {}
+
+        with path.open("r", encoding="utf-8") as f:
+            payload = json.load(f)
+        if "videos" not in payload: # files written before discovered_at_utc was kept hold only the videos
+            payload = {"discovered_at_utc": None, "videos": payload}
+        return payload
+
+    def _state_path(self, channel_id: str) -> Path:
+        return self.data_root / "state" / "refresh" / f"{channel_id}.json"
@@ -26,16 +26,7 @@ class ParquetSilverCommentsRepository:
     def _path_for_comments(self, video_id: str) -> Path:
         return self._dir_for_video(video_id) / f"comments.parquet"
     
-    def save(
-            self, 
-            video_id: str, 
-            rows: Iterable[dict], 
-            *, 
-            schema: pa.Schema,
-            overwrite: bool = True,
-            batch_size: int = 5000,
-        ) -> Path:
-        
+    def _prepare_path(self, video_id: str, *, overwrite: bool) -> Path:
         out_dir = self._dir_for_video(video_id)
         out_dir.mkdir(parents=True, exist_ok=True)
         
@@ -46,6 +37,19 @@ class ParquetSilverCommentsRepository:
         # delete old files
         if path.exists() and overwrite:
             path.unlink()
+        return path
+    
+    def save(
+            self, 
+            video_id: str, 
+            rows: Iterable[dict], 
+            *, 
+            schema: pa.Schema,
+            overwrite: bool = True,
+            batch_size: int = 5000,
+        ) -> Path:
+        
+        path = self._prepare_path(video_id, overwrite=overwrite)
             
         with pq.ParquetWriter(path, schema=schema) as w:
             buffer: list[dict] = []
@@ -60,6 +64,22 @@ class ParquetSilverCommentsRepository:
         
         return path
     
+    def save_tables(
+            self,
+            video_id: str,
+            tables: Iterable[pa.Table],
+            *,
+            schema: pa.Schema,
+            overwrite: bool = True,
+            batch_size: int = 5000,
+        ) -> Path:
+        """Columnar save(): writes already built tables, in row groups of at most `batch_size` rows."""
+        path = self._prepare_path(video_id, overwrite=overwrite)
+        with pq.ParquetWriter(path, schema=schema) as w:
+            for table in tables:
+                w.write_table(table, row_group_size=batch_size)
+        return path
+    
     def load(self, video_id: str) -> pa.Table:
         path = self._path_for_comments(video_id)
         
@@ -4,12 +4,15 @@ import pytest
 
 from datetime import datetime
 from pathlib import Path
+from unittest.mock import Mock, patch
 
 import pyarrow as pa
 import pyarrow.parquet as pq
 
 from yt_comments.cli.main import main
 from yt_comments.ingestion.models import Comment
+from yt_comments.ingestion.quota import QuotaLedger
+from yt_comments.ingestion.scrape_service import ScrapeResult
 from yt_comments.storage.bronze_comments_repository import JSONLCommentsRepository
 from yt_comments.storage.gold_basic_stats_parquet_repository import ParquetBasicStatsRepository
 
@@ -28,6 +31,35 @@ def test_cli_scrape_prints_video_id(capsys) -> None:
     assert ".jsonl" in output # check that the file was created
 
 
+def test_cli_scrape_charges_quota_ledger(tmp_path: Path, capsys) -> None:
+    key_pool = Mock(keys=["key-1"])
+    result = ScrapeResult(video_id="dQw4w9WgXcQ", saved_count=3, path=tmp_path / "bronze" / "dQw4w9WgXcQ.jsonl")
+
+    with patch("yt_comments.cli.commands.video._load_api_key_pool", return_value=key_pool), \
+         patch("yt_comments.cli.commands.video.YouTubeApiClient") as client_cls, \
+         patch("yt_comments.cli.commands.video._scrape_video", return_value=result):
+        exit_code = main([
+            "scrape", "dQw4w9WgXcQ",
+            "--bronze-dir", str(tmp_path / "bronze"),
+            "--data-root", str(tmp_path),
+            "--daily-quota", "500",
+        ])
+
+    assert exit_code == 0
+    quota = client_cls.call_args.kwargs["quota"]
+    assert isinstance(quota, QuotaLedger) # single-video scrapes are charged like the channel commands
+    assert quota.daily_budget == 500
+
+    quota.charge("key-1", "commentThreads")
+    quota.flush()
+    assert (tmp_path / "state" / "quota_ledger.json").exists()
+    client_cls.return_value.close.assert_called_once() # flushes the ledger
+
+
+def test_cli_scrape_rejects_invalid_daily_quota() -> None:
+    assert main(["scrape", "dQw4w9WgXcQ", "--daily-quota", "0"]) == 2
+
+
 def test_cli_help_exits_zero() -> None:
     with pytest.raises(SystemExit) as exc:
         main(["--help"])
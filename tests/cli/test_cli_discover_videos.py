@@ -80,3 +80,56 @@ def test_cli_discover_videos(capsys):
     
     assert actual == expected
 
+
+
+def test_cli_discover_videos_uploads_engine(capsys):
+    mock_client = Mock()
+    mock_client.resolve_channel_id.return_value = "UC_test"
+    
+    mock_discovery_service = Mock()
+    mock_discovery_service.run.return_value = ChannelVideoDiscoveryResult(video_count=0, videos=[])
+
+    with (
+        patch.dict("os.environ", {"YOUTUBE_API_KEY": "test-key"}), 
+        patch(
+            "yt_comments.cli.commands.channel.YouTubeApiClient",
+            return_value=mock_client,
+        ), 
+        patch(
+            "yt_comments.cli.commands.channel.ChannelVideoDiscoveryService",
+            return_value=mock_discovery_service,
+        ) as mock_service_cls, 
+    ):
+        exit_code = main(["discover-videos", "@chan123", "--discovery-engine", "uploads"])
+
+    assert exit_code == 0
+    assert mock_service_cls.call_args.kwargs["request"].engine == "uploads"
+    assert "Total videos=0" in capsys.readouterr().out
+
+
+def test_cli_discover_videos_reuses_saved_channel_ref(tmp_path):
+    mock_client = Mock()
+    mock_client.resolve_channel_id.return_value = "UC_test"
+    
+    mock_discovery_service = Mock()
+    mock_discovery_service.run.return_value = ChannelVideoDiscoveryResult(video_count=0, videos=[])
+    
+    argv = ["discover-videos", "@chan123", "--data-root", str(tmp_path)]
+    with (
+        patch.dict("os.environ", {"YOUTUBE_API_KEY": "test-key"}), 
+        patch("yt_comments.cli.commands.channel.YouTubeApiClient", return_value=mock_client), 
+        patch(
+            "yt_comments.cli.commands.channel.ChannelVideoDiscoveryService",
+            return_value=mock_discovery_service,
+        ) as mock_discovery_cls, 
+    ):
+        assert main(argv) == 0
+        assert main(argv) == 0
+        assert mock_client.resolve_channel_id.call_count == 1
+        
+        assert main(argv + ["--refresh-ref"]) == 0
+        assert main(argv + ["--ref-ttl-days", "0"]) == 0
+        assert mock_client.resolve_channel_id.call_count == 3
+    
+    requests = [c.kwargs["request"] for c in mock_discovery_cls.call_args_list]
+    assert {r.channel_id for r in requests} == {"UC_test"}
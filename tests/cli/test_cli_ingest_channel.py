@@ -0,0 +1,81 @@
+from pathlib import Path
+from unittest.mock import Mock, patch
+
+import pyarrow.parquet as pq
+
+from yt_comments.cli.main import main
+from yt_comments.ingestion.channel_video_discovery_service import ChannelVideoDiscoveryResult
+from yt_comments.ingestion.models import ChannelVideo, Comment
+from yt_comments.ingestion.scrape_service import ScrapeResult
+
+
+
+
+def test_cli_ingest_channel_preprocesses_every_scraped_video(capsys, tmp_path: Path):
+    discovered_videos = [
+        ChannelVideo(video_id=f"v{i}", channel_id="UC_test", title=f"Example video {i}")
+        for i in range(1, 5)
+    ]
+    mock_client = Mock()
+    mock_client.fetch_video_statistics.return_value = {}
+    mock_client.resolve_channel_id.return_value = "UC_test"
+    mock_discovery_service = Mock()
+    mock_discovery_service.run.return_value = ChannelVideoDiscoveryResult(
+        video_count=len(discovered_videos),
+        videos=discovered_videos,
+    )
+    
+    def fake_scrape(*, video_id, repo, **kwargs):
+        if video_id == "v3":
+            raise ValueError("Comments are disabled for video 'v3'.")
+        comments = [
+            Comment(video_id=video_id, comment_id=f"{video_id}-c{i}", text=f"Great VIDEO {i}!")
+            for i in range(int(video_id[1:]))
+        ]
+        path = repo.save(video_id, comments)
+        return ScrapeResult(video_id=video_id, saved_count=len(comments), path=path)
+    
+    with (
+        patch.dict("os.environ", {"YOUTUBE_API_KEY": "test-key"}), 
+        patch("yt_comments.cli.commands.channel.YouTubeApiClient", return_value=mock_client), 
+        patch(
+            "yt_comments.cli.commands.channel.ChannelVideoDiscoveryService",
+            return_value=mock_discovery_service,
+        ), 
+        patch("yt_comments.cli.commands.channel._scrape_video", side_effect=fake_scrape),
+    ):
+        exit_code = main(
+            [
+                "ingest-channel",
+                "UCaaaaaaaaaaaaaaaaaaaaaa",
+                "--jobs",
+                "2",
+                "--queue-size",
+                "1",
+                "--bronze-dir",
+                str(tmp_path / "bronze"),
+                "--silver-dir",
+                str(tmp_path / "silver"),
+                "--data-root",
+                str(tmp_path),
+            ]
+        )
+    
+    out = capsys.readouterr().out
+    
+    assert exit_code == 0
+    assert "Failed to scrape | video_id=v3" in out
+    assert "TOTAL | videos=4 | comments=7 | errors=1" in out
+    assert "| preprocessed=3 | preprocess_errors=0" in out
+    
+    for video_id, rows in (("v1", 1), ("v2", 2), ("v4", 4)):
+        table = pq.read_table(tmp_path / "silver" / video_id / "comments.parquet")
+        assert table.num_rows == rows
+        assert table.column("text_clean")[0].as_py() == "great video 0!"
+    assert not (tmp_path / "silver" / "v3").exists()
+
+
+def test_cli_ingest_channel_rejects_invalid_queue_size(tmp_path: Path):
+    exit_code = main(["ingest-channel", "UCaaaaaaaaaaaaaaaaaaaaaa", "--queue-size", "0", "--data-root", str(tmp_path)])
+    
+    assert exit_code == 2
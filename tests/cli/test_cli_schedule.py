@@ -0,0 +1,106 @@
+from pathlib import Path
+from unittest.mock import Mock, patch
+
+from yt_comments.cli.main import main
+from yt_comments.ingestion.channel_video_discovery_service import ChannelVideoDiscoveryResult
+from yt_comments.ingestion.models import ChannelVideo, VideoStatistics
+from yt_comments.ingestion.scrape_service import ScrapeResult
+from yt_comments.storage.gold_channel_run_summary_repository import JSONChannelRunSummaryRepository
+from yt_comments.storage.refresh_state_repository import JSONRefreshStateRepository
+
+
+
+
+def _stats(**counts: int) -> dict[str, VideoStatistics]:
+    return {video_id: VideoStatistics(video_id=video_id, comment_count=count) for video_id, count in counts.items()}
+
+
+def _run_schedule(tmp_path: Path, mock_client: Mock, fake_scrape, cycles: int) -> tuple[int, int]:
+    """Runs the scheduler; returns the exit code and how many channel discoveries it made."""
+    videos = [
+        ChannelVideo(video_id="v1", channel_id="UC_test", title="Busy video"),
+        ChannelVideo(video_id="v2", channel_id="UC_test", title="Quiet video"),
+    ]
+    mock_discovery_service = Mock()
+    mock_discovery_service.run.return_value = ChannelVideoDiscoveryResult(video_count=len(videos), videos=videos)
+    
+    refs_file = tmp_path / "channels.txt"
+    refs_file.write_text("@test\n", encoding="utf-8")
+    
+    with (
+        patch.dict("os.environ", {"YOUTUBE_API_KEY": "test-key"}), 
+        patch("yt_comments.cli.commands.channel.YouTubeApiClient", return_value=mock_client), 
+        patch(
+            "yt_comments.cli.commands.channel.ChannelVideoDiscoveryService",
+            return_value=mock_discovery_service,
+        ), 
+        patch("yt_comments.cli.commands.channel._scrape_video", side_effect=fake_scrape),
+        patch("yt_comments.cli.commands.channel.time.sleep") as mock_sleep,
+    ):
+        exit_code = main(
+            [
+                "schedule",
+                str(refs_file),
+                "--cycles",
+                str(cycles),
+                "--min-new-comments",
+                "10",
+                "--min-interval-hours",
+                "0",
+                "--bronze-dir",
+                str(tmp_path / "bronze"),
+                "--data-root",
+                str(tmp_path),
+            ]
+        )
+    assert mock_sleep.call_count == cycles - 1
+    return exit_code, mock_discovery_service.run.call_count
+
+
+def test_cli_schedule_refreshes_videos_with_new_comments_and_resumes_state(capsys, tmp_path: Path):
+    scraped: list[str] = []
+    
+    def fake_scrape(*, video_id, incremental, **kwargs):
+        assert incremental
+        scraped.append(video_id)
+        return ScrapeResult(video_id=video_id, saved_count=3, path=tmp_path / f"{video_id}.jsonl")
+    
+    mock_client = Mock()
+    mock_client.resolve_channel_id.return_value = "UC_test"
+    mock_client.fetch_video_statistics.side_effect = [_stats(v1=100, v2=5), _stats(v1=150, v2=6)]
+    
+    exit_code, _ = _run_schedule(tmp_path, mock_client, fake_scrape, cycles=2)
+    out = capsys.readouterr().out
+    
+    assert exit_code == 0
+    # cycle 1 scrapes every new video (busiest first), cycle 2 only the one that gained 50 comments
+    assert scraped == ["v1", "v2", "v1"]
+    assert "CYCLE | n=1 | tracked=2 | due=2 | scraped=2" in out
+    assert "CYCLE | n=2 | tracked=2 | due=1 | scraped=1" in out
+    assert "TOTAL | cycles=2 | channels=1 | scraped=3 | comments=9 | errors=0" in out
+    
+    states = JSONRefreshStateRepository(data_root=tmp_path).load("UC_test")
+    assert states["v1"].scraped_comment_count == 150
+    assert states["v2"].scraped_comment_count == 5
+    assert JSONChannelRunSummaryRepository(data_root=tmp_path).load_latest("UC_test").video_ids == ("v1", "v2")
+    
+    # a restarted scheduler remembers what was scraped: nothing changed, nothing to do
+    scraped.clear()
+    mock_client.fetch_video_statistics.side_effect = [_stats(v1=150, v2=6)]
+    
+    exit_code, discoveries = _run_schedule(tmp_path, mock_client, fake_scrape, cycles=1)
+    out = capsys.readouterr().out
+    
+    assert exit_code == 0
+    assert discoveries == 0 # the channel was discovered less than --rediscover-hours ago
+    assert scraped == []
+    assert "CYCLE | n=1 | tracked=2 | due=0 | scraped=0" in out
+
+
+def test_cli_schedule_rejects_retry_failed(tmp_path: Path):
+    refs_file = tmp_path / "channels.txt"
+    refs_file.write_text("@test\n", encoding="utf-8")
+    
+    exit_code = main(["schedule", str(refs_file), "--retry-failed", "--data-root", str(tmp_path)])
+    
+    assert exit_code == 2
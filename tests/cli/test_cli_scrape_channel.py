@@ -1,11 +1,16 @@
+import time
 from datetime import datetime, timezone
 from pathlib import Path
 from unittest.mock import Mock, patch
 
 from yt_comments.cli.main import main
 from yt_comments.ingestion.channel_video_discovery_service import ChannelVideoDiscoveryResult
-from yt_comments.ingestion.models import ChannelVideo
+from yt_comments.ingestion.models import ChannelVideo, VideoStatistics
 from yt_comments.ingestion.scrape_service import ScrapeResult
+from yt_comments.storage.bronze_comments_repository import JSONLCommentsRepository
+from yt_comments.storage.comment_count_repository import JSONCommentCountRepository
+from yt_comments.storage.failed_video_repository import JSONFailedVideoRepository
+from yt_comments.storage.gold_channel_run_summary_repository import JSONChannelRunSummaryRepository
 
 
 
@@ -38,6 +43,7 @@ def test_cli_scrape_channel(capsys, tmp_path: Path):
     )
     
     mock_client = Mock()
+    mock_client.fetch_video_statistics.return_value = {}
     mock_client.resolve_channel_id.return_value = "UC_test"
     
     mock_discovery_service = Mock()
@@ -98,4 +104,467 @@ def test_cli_scrape_channel(capsys, tmp_path: Path):
     
     mock_client.resolve_channel_id.assert_called_once()
     
-    assert mock_scrape_videos.call_count == 3
\ No newline at end of file
+    assert mock_scrape_videos.call_count == 3
+
+def test_cli_scrape_channel_jobs_keeps_discovery_order_and_isolates_errors(capsys, tmp_path: Path):
+    discovered_videos = [
+        ChannelVideo(video_id=f"v{i}", channel_id="UC_test", title=f"Example video {i}")
+        for i in range(1, 7)
+    ]
+    discovered_result = ChannelVideoDiscoveryResult(
+        video_count=len(discovered_videos),
+        videos=discovered_videos,
+    )
+    
+    mock_client = Mock()
+    mock_client.fetch_video_statistics.return_value = {}
+    mock_client.resolve_channel_id.return_value = "UC_test"
+    
+    mock_discovery_service = Mock()
+    mock_discovery_service.run.return_value = discovered_result
+    
+    def fake_scrape(*, video_id, **kwargs):
+        if video_id == "v3":
+            raise ValueError("Comments are disabled for video 'v3'.")
+        # earlier videos finish last to shuffle completion order
+        time.sleep(0.01 * (7 - int(video_id[1:])))
+        return ScrapeResult(video_id=video_id, saved_count=1, path=tmp_path / f"{video_id}.jsonl")
+    
+    with (
+        patch.dict("os.environ", {"YOUTUBE_API_KEY": "test-key"}), 
+        patch(
+            "yt_comments.cli.commands.channel.YouTubeApiClient",
+            return_value=mock_client,
+        ), 
+        patch(
+            "yt_comments.cli.commands.channel.ChannelVideoDiscoveryService",
+            return_value=mock_discovery_service,
+        ), 
+        patch(
+            "yt_comments.cli.commands.channel._scrape_video",
+            side_effect=fake_scrape,
+        ) as mock_scrape_videos
+    ):
+        exit_code = main(
+            [
+                "scrape-channel",
+                "UCaaaaaaaaaaaaaaaaaaaaaa",
+                "--jobs",
+                "4",
+                "--bronze-dir",
+                str(tmp_path / "bronze"),
+                "--data-root",
+                str(tmp_path),
+            ]
+        )
+        
+    out = capsys.readouterr().out
+    
+    assert exit_code == 0
+    assert mock_scrape_videos.call_count == 6
+    assert "Failed to scrape | video_id=v3" in out
+    assert "TOTAL | videos=6 | comments=5 | errors=1" in out
+    
+    summary = JSONChannelRunSummaryRepository(data_root=tmp_path).load_latest("UC_test")
+    assert summary.video_ids == ("v1", "v2", "v4", "v5", "v6")
+    assert summary.error_count == 1
+
+
+def test_cli_scrape_channel_rejects_invalid_jobs(tmp_path: Path):
+    exit_code = main(["scrape-channel", "UCaaaaaaaaaaaaaaaaaaaaaa", "--jobs", "0", "--data-root", str(tmp_path)])
+    
+    assert exit_code == 2
+
+
+def test_cli_scrape_channel_defers_videos_beyond_quota_budget(capsys, tmp_path: Path):
+    discovered_videos = [
+        ChannelVideo(video_id=f"v{i}", channel_id="UC_test", title=f"Example video {i}")
+        for i in range(1, 5)
+    ]
+    discovered_result = ChannelVideoDiscoveryResult(
+        video_count=len(discovered_videos),
+        videos=discovered_videos,
+    )
+    
+    mock_client = Mock()
+    mock_client.fetch_video_statistics.return_value = {}
+    mock_client.resolve_channel_id.return_value = "UC_test"
+    
+    mock_discovery_service = Mock()
+    mock_discovery_service.run.return_value = discovered_result
+    
+    def fake_scrape(*, video_id, **kwargs):
+        return ScrapeResult(video_id=video_id, saved_count=1, path=tmp_path / f"{video_id}.jsonl")
+    
+    with (
+        patch.dict("os.environ", {"YOUTUBE_API_KEY": "test-key"}), 
+        patch(
+            "yt_comments.cli.commands.channel.YouTubeApiClient",
+            return_value=mock_client,
+        ), 
+        patch(
+            "yt_comments.cli.commands.channel.ChannelVideoDiscoveryService",
+            return_value=mock_discovery_service,
+        ), 
+        patch(
+            "yt_comments.cli.commands.channel._scrape_video",
+            side_effect=fake_scrape,
+        ) as mock_scrape_videos
+    ):
+        exit_code = main(
+            [
+                "scrape-channel",
+                "UCaaaaaaaaaaaaaaaaaaaaaa",
+                "--comments-limit",
+                "5000",
+                "--daily-quota",
+                "120",
+                "--data-root",
+                str(tmp_path),
+                "--bronze-dir",
+                str(tmp_path / "bronze"),
+            ]
+        )
+        
+    out = capsys.readouterr().out
+    
+    assert exit_code == 0
+    # 5000 comments = 50 one-unit pages per video, so 120 units cover two videos
+    assert mock_scrape_videos.call_count == 2
+    assert "Deferred (quota budget) | video_id=v3" in out
+    assert "Deferred (quota budget) | video_id=v4" in out
+    assert "deferred=2" in out
+    
+    summary = JSONChannelRunSummaryRepository(data_root=tmp_path).load_latest("UC_test")
+    assert summary.video_ids == ("v1", "v2")
+
+
+def test_cli_scrape_channel_prices_videos_by_known_comment_count(capsys, tmp_path: Path):
+    discovered_videos = [
+        ChannelVideo(video_id=f"v{i}", channel_id="UC_test", title=f"Example video {i}")
+        for i in range(1, 5)
+    ]
+    mock_client = Mock()
+    mock_client.resolve_channel_id.return_value = "UC_test"
+    mock_client.fetch_video_statistics.return_value = {
+        "v1": VideoStatistics(video_id="v1", comment_count=120),
+        "v2": VideoStatistics(video_id="v2", comment_count=120),
+        "v3": VideoStatistics(video_id="v3", comment_count=9000),
+        "v4": VideoStatistics(video_id="v4", comment_count=None),
+    }
+    
+    mock_discovery_service = Mock()
+    mock_discovery_service.run.return_value = ChannelVideoDiscoveryResult(
+        video_count=len(discovered_videos),
+        videos=discovered_videos,
+    )
+    
+    def fake_scrape(*, video_id, **kwargs):
+        return ScrapeResult(video_id=video_id, saved_count=1, path=tmp_path / f"{video_id}.jsonl")
+    
+    with (
+        patch.dict("os.environ", {"YOUTUBE_API_KEY": "test-key"}), 
+        patch(
+            "yt_comments.cli.commands.channel.YouTubeApiClient",
+            return_value=mock_client,
+        ), 
+        patch(
+            "yt_comments.cli.commands.channel.ChannelVideoDiscoveryService",
+            return_value=mock_discovery_service,
+        ), 
+        patch(
+            "yt_comments.cli.commands.channel._scrape_video",
+            side_effect=fake_scrape,
+        ) as mock_scrape_videos
+    ):
+        exit_code = main(
+            [
+                "scrape-channel",
+                "UCaaaaaaaaaaaaaaaaaaaaaa",
+                "--comments-limit",
+                "5000",
+                "--daily-quota",
+                "100",
+                "--data-root",
+                str(tmp_path),
+                "--bronze-dir",
+                str(tmp_path / "bronze"),
+            ]
+        )
+        
+    out = capsys.readouterr().out
+    
+    assert exit_code == 0
+    # v1/v2 need 2 pages each, v3 is capped at the limit (50), v4's unknown count falls back to the limit
+    assert [c.kwargs["video_id"] for c in mock_scrape_videos.call_args_list] == ["v1", "v2", "v3"]
+    assert "Deferred (quota budget) | video_id=v4" in out
+
+
+def test_cli_scrape_channel_skips_videos_with_unchanged_comment_count(capsys, tmp_path: Path):
+    discovered_videos = [
+        ChannelVideo(video_id=f"v{i}", channel_id="UC_test", title=f"Example video {i}")
+        for i in range(1, 4)
+    ]
+    discovered_result = ChannelVideoDiscoveryResult(
+        video_count=len(discovered_videos),
+        videos=discovered_videos,
+    )
+    
+    mock_client = Mock()
+    mock_client.resolve_channel_id.return_value = "UC_test"
+    mock_client.fetch_video_statistics.return_value = {
+        "v1": VideoStatistics(video_id="v1", comment_count=10),
+        "v2": VideoStatistics(video_id="v2", comment_count=5),
+        "v3": VideoStatistics(video_id="v3", comment_count=7),
+    }
+    
+    mock_discovery_service = Mock()
+    mock_discovery_service.run.return_value = discovered_result
+    
+    # v1 and v2 were scraped before; only v1 still has the same number of comments
+    JSONCommentCountRepository(data_root=tmp_path).save({"v1": 10, "v2": 4})
+    bronze = JSONLCommentsRepository(tmp_path / "bronze")
+    bronze.save("v1", [])
+    bronze.save("v2", [])
+    
+    def fake_scrape(*, video_id, **kwargs):
+        return ScrapeResult(video_id=video_id, saved_count=1, path=tmp_path / f"{video_id}.jsonl")
+    
+    with (
+        patch.dict("os.environ", {"YOUTUBE_API_KEY": "test-key"}), 
+        patch(
+            "yt_comments.cli.commands.channel.YouTubeApiClient",
+            return_value=mock_client,
+        ), 
+        patch(
+            "yt_comments.cli.commands.channel.ChannelVideoDiscoveryService",
+            return_value=mock_discovery_service,
+        ), 
+        patch(
+            "yt_comments.cli.commands.channel._scrape_video",
+            side_effect=fake_scrape,
+        ) as mock_scrape_videos
+    ):
+        exit_code = main(
+            [
+                "scrape-channel",
+                "UCaaaaaaaaaaaaaaaaaaaaaa",
+                "--skip-unchanged",
+                "--bronze-dir",
+                str(tmp_path / "bronze"),
+                "--data-root",
+                str(tmp_path),
+            ]
+        )
+        
+    out = capsys.readouterr().out
+    
+    assert exit_code == 0
+    assert [c.kwargs["video_id"] for c in mock_scrape_videos.call_args_list] == ["v2", "v3"]
+    assert "Skipped (unchanged) | video_id=v1 | comments=10" in out
+    assert "TOTAL | videos=3 | comments=2 | errors=0 | skipped_unchanged=1" in out
+    assert JSONCommentCountRepository(data_root=tmp_path).load() == {"v1": 10, "v2": 5, "v3": 7}
+    
+    summary = JSONChannelRunSummaryRepository(data_root=tmp_path).load_latest("UC_test")
+    assert summary.video_ids == ("v1", "v2", "v3")
+    assert summary.skipped_unchanged_count == 1
+
+
+def test_cli_scrape_channel_records_comment_counts_only_for_complete_scrapes(capsys, tmp_path: Path):
+    discovered_videos = [
+        ChannelVideo(video_id=f"v{i}", channel_id="UC_test", title=f"Example video {i}")
+        for i in range(1, 4)
+    ]
+    mock_client = Mock()
+    mock_client.resolve_channel_id.return_value = "UC_test"
+    mock_client.fetch_video_statistics.return_value = {
+        "v1": VideoStatistics(video_id="v1", comment_count=10),
+        "v2": VideoStatistics(video_id="v2", comment_count=9000),
+        "v3": VideoStatistics(video_id="v3", comment_count=7),
+    }
+    
+    mock_discovery_service = Mock()
+    mock_discovery_service.run.return_value = ChannelVideoDiscoveryResult(
+        video_count=len(discovered_videos),
+        videos=discovered_videos,
+    )
+    
+    # v2 was fully scraped before; this run stops on --comments-limit and overwrites it with a partial file
+    JSONCommentCountRepository(data_root=tmp_path).save({"v2": 9000})
+    
+    def fake_scrape(*, video_id, **kwargs):
+        return ScrapeResult(
+            video_id=video_id, saved_count=1, path=tmp_path / f"{video_id}.jsonl", truncated=video_id == "v2"
+        )
+    
+    with (
+        patch.dict("os.environ", {"YOUTUBE_API_KEY": "test-key"}), 
+        patch(
+            "yt_comments.cli.commands.channel.YouTubeApiClient",
+            return_value=mock_client,
+        ), 
+        patch(
+            "yt_comments.cli.commands.channel.ChannelVideoDiscoveryService",
+            return_value=mock_discovery_service,
+        ), 
+        patch(
+            "yt_comments.cli.commands.channel._scrape_video",
+            side_effect=fake_scrape,
+        ),
+    ):
+        exit_code = main(
+            [
+                "scrape-channel",
+                "UCaaaaaaaaaaaaaaaaaaaaaa",
+                "--bronze-dir",
+                str(tmp_path / "bronze"),
+                "--data-root",
+                str(tmp_path),
+            ]
+        )
+    
+    assert exit_code == 0
+    # counts are seeded without --skip-unchanged, and the truncated v2 isn't left looking unchanged
+    assert JSONCommentCountRepository(data_root=tmp_path).load() == {"v1": 10, "v3": 7}
+
+
+def test_cli_scrape_channel_queues_failed_videos_and_retries_them(capsys, tmp_path: Path):
+    discovered_videos = [
+        ChannelVideo(video_id=f"v{i}", channel_id="UC_test", title=f"Example video {i}")
+        for i in range(1, 4)
+    ]
+    mock_client = Mock()
+    mock_client.fetch_video_statistics.return_value = {}
+    mock_client.resolve_channel_id.return_value = "UC_test"
+    
+    mock_discovery_service = Mock()
+    mock_discovery_service.run.return_value = ChannelVideoDiscoveryResult(
+        video_count=len(discovered_videos),
+        videos=discovered_videos,
+    )
+    
+    failing = {"v2"}
+    
+    def fake_scrape(*, video_id, **kwargs):
+        if video_id in failing:
+            raise ValueError("YouTube API error: Backend Error")
+        return ScrapeResult(video_id=video_id, saved_count=3, path=tmp_path / f"{video_id}.jsonl")
+    
+    argv = [
+        "scrape-channel",
+        "UCaaaaaaaaaaaaaaaaaaaaaa",
+        "--bronze-dir",
+        str(tmp_path / "bronze"),
+        "--data-root",
+        str(tmp_path),
+    ]
+    with (
+        patch.dict("os.environ", {"YOUTUBE_API_KEY": "test-key"}), 
+        patch("yt_comments.cli.commands.channel.YouTubeApiClient", return_value=mock_client), 
+        patch(
+            "yt_comments.cli.commands.channel.ChannelVideoDiscoveryService",
+            return_value=mock_discovery_service,
+        ) as mock_discovery_cls, 
+        patch("yt_comments.cli.commands.channel._scrape_video", side_effect=fake_scrape) as mock_scrape_videos,
+    ):
+        assert main(argv) == 0
+        # still failing: the attempt count goes up
+        assert main(argv + ["--retry-failed"]) == 0
+        queue = JSONFailedVideoRepository(data_root=tmp_path).load("UC_test")
+        assert queue["v2"].attempts == 2
+        assert queue["v2"].error == "YouTube API error: Backend Error"
+        
+        failing.clear()
+        mock_scrape_videos.reset_mock()
+        assert main(argv + ["--retry-failed"]) == 0
+    
+    out = capsys.readouterr().out
+    
+    assert mock_discovery_cls.call_count == 1 # retry runs skip discovery
+    assert [c.kwargs["video_id"] for c in mock_scrape_videos.call_args_list] == ["v2"]
+    assert "recovered=1 | queued_failed=0" in out
+    assert JSONFailedVideoRepository(data_root=tmp_path).load("UC_test") == {}
+    
+    summary = JSONChannelRunSummaryRepository(data_root=tmp_path).load_latest("UC_test")
+    assert summary.video_ids == ("v1", "v3", "v2")
+    assert summary.comment_count == 9
+    assert summary.error_count == 0
+
+
+def test_cli_scrape_channel_splits_comment_budget_by_comment_count(capsys, tmp_path: Path):
+    discovered_videos = [
+        ChannelVideo(video_id="v1", channel_id="UC_test", title="Tiny", comment_count=30),
+        ChannelVideo(video_id="v2", channel_id="UC_test", title="Popular", comment_count=9_000),
+        ChannelVideo(video_id="v3", channel_id="UC_test", title="Average", comment_count=3_000),
+        ChannelVideo(video_id="v4", channel_id="UC_test", title="Silent", comment_count=0),
+    ]
+    mock_client = Mock()
+    mock_client.resolve_channel_id.return_value = "UC_test"
+    
+    mock_discovery_service = Mock()
+    mock_discovery_service.run.return_value = ChannelVideoDiscoveryResult(
+        video_count=len(discovered_videos),
+        videos=discovered_videos,
+    )
+    
+    def fake_scrape(*, video_id, limit, **kwargs):
+        return ScrapeResult(video_id=video_id, saved_count=limit, path=tmp_path / f"{video_id}.jsonl")
+    
+    with (
+        patch.dict("os.environ", {"YOUTUBE_API_KEY": "test-key"}), 
+        patch("yt_comments.cli.commands.channel.YouTubeApiClient", return_value=mock_client), 
+        patch(
+            "yt_comments.cli.commands.channel.ChannelVideoDiscoveryService",
+            return_value=mock_discovery_service,
+        ), 
+        patch("yt_comments.cli.commands.channel._scrape_video", side_effect=fake_scrape) as mock_scrape_videos,
+    ):
+        exit_code = main(
+            [
+                "scrape-channel",
+                "UCaaaaaaaaaaaaaaaaaaaaaa",
+                "--comment-budget",
+                "4030",
+                "--min-comments-per-video",
+                "100",
+                "--max-comments-per-video",
+                "3000",
+                "--bronze-dir",
+                str(tmp_path / "bronze"),
+                "--data-root",
+                str(tmp_path),
+            ]
+        )
+    
+    out = capsys.readouterr().out
+    
+    assert exit_code == 0
+    limits = {c.kwargs["video_id"]: c.kwargs["limit"] for c in mock_scrape_videos.call_args_list}
+    # minimums first (v1 only has 30), the remaining 3800 split 3:1 by commentCount
+    assert limits == {"v1": 30, "v2": 2_950, "v3": 1_050}
+    assert "Deferred (comment budget) | video_id=v4" in out
+    mock_client.fetch_video_statistics.assert_not_called() # the uploads engine already reported the counts
+
+
+def test_cli_scrape_channel_sizes_connection_pool_for_reply_fan_out(tmp_path: Path):
+    mock_client = Mock()
+    mock_client.resolve_channel_id.return_value = "UC_test"
+    mock_discovery_service = Mock()
+    mock_discovery_service.run.return_value = ChannelVideoDiscoveryResult(video_count=0, videos=[])
+    
+    def pool_size(*extra_args):
+        with (
+            patch.dict("os.environ", {"YOUTUBE_API_KEY": "test-key"}),
+            patch("yt_comments.cli.commands.channel.HttpTransport") as transport_cls,
+            patch("yt_comments.cli.commands.channel.YouTubeApiClient", return_value=mock_client),
+            patch("yt_comments.cli.commands.channel.ChannelVideoDiscoveryService", return_value=mock_discovery_service),
+        ):
+            assert main(["scrape-channel", "UCaaaaaaaaaaaaaaaaaaaaaa", "--data-root", str(tmp_path), *extra_args]) == 0
+        return transport_cls.call_args.args[0].pool_size
+    
+    assert pool_size("--jobs", "2") == 2
+    # every job can have its page request and all reply requests in flight at once
+    assert pool_size("--jobs", "2", "--replies", "--reply-workers", "8") == 18
+    assert pool_size("--jobs", "2", "--discovery-shards", "4") == 8
+    assert pool_size("--jobs", "2", "--replies", "--max-in-flight", "3") == 3
+    assert pool_size("--jobs", "2", "--replies", "--pool-size", "5") == 5
@@ -0,0 +1,116 @@
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from unittest.mock import Mock, patch
+
+from yt_comments.cli.main import main
+from yt_comments.ingestion.channel_video_discovery_service import ChannelVideoDiscoveryResult
+from yt_comments.ingestion.models import ChannelVideo
+from yt_comments.ingestion.scrape_service import ScrapeResult
+from yt_comments.storage.gold_channel_ref_mapping_repository import JSONChannelRefRepository
+from yt_comments.storage.gold_channel_run_summary_repository import JSONChannelRunSummaryRepository
+
+
+
+
+def _discovery_for(videos_by_channel: dict[str, list[ChannelVideo]]):
+    def build(*, client, request, shards):
+        videos = videos_by_channel[request.channel_id]
+        service = Mock()
+        service.run.return_value = ChannelVideoDiscoveryResult(video_count=len(videos), videos=videos)
+        return service
+    return build
+
+
+def test_cli_scrape_channels_shares_pool_and_saves_summary_per_channel(capsys, tmp_path: Path):
+    videos_by_channel = {
+        "UC_alpha": [
+            ChannelVideo(video_id="a1", channel_id="UC_alpha", title="Alpha 1"),
+            ChannelVideo(video_id="a2", channel_id="UC_alpha", title="Alpha 2"),
+        ],
+        "UC_beta": [
+            ChannelVideo(video_id="b1", channel_id="UC_beta", title="Beta 1"),
+        ],
+    }
+    saved = {"a1": 4, "a2": 6, "b1": 5}
+    
+    # @beta was resolved in an earlier run, so it must not cost another API call
+    JSONChannelRefRepository(data_root=tmp_path).save(raw_input="@beta", channel_id="UC_beta")
+    
+    refs_file = tmp_path / "channels.txt"
+    refs_file.write_text("# channels to scrape\n@alpha\n\n@beta  # already resolved\n", encoding="utf-8")
+    
+    mock_client = Mock()
+    mock_client.fetch_video_statistics.return_value = {}
+    mock_client.resolve_channel_id.return_value = "UC_alpha"
+    
+    def fake_scrape(*, video_id, **kwargs):
+        return ScrapeResult(video_id=video_id, saved_count=saved[video_id], path=tmp_path / f"{video_id}.jsonl")
+    
+    with (
+        patch.dict("os.environ", {"YOUTUBE_API_KEY": "test-key"}), 
+        patch("yt_comments.cli.commands.channel.YouTubeApiClient", return_value=mock_client), 
+        patch(
+            "yt_comments.cli.commands.channel.ChannelVideoDiscoveryService",
+            side_effect=_discovery_for(videos_by_channel),
+        ), 
+        patch("yt_comments.cli.commands.channel._scrape_video", side_effect=fake_scrape) as mock_scrape,
+        patch("yt_comments.cli.commands.channel.ThreadPoolExecutor", wraps=ThreadPoolExecutor) as mock_pool,
+    ):
+        exit_code = main(
+            [
+                "scrape-channels",
+                str(refs_file),
+                "--jobs",
+                "3",
+                "--bronze-dir",
+                str(tmp_path / "bronze"),
+                "--data-root",
+                str(tmp_path),
+            ]
+        )
+    
+    out = capsys.readouterr().out
+    
+    assert exit_code == 0
+    assert mock_pool.call_count == 1
+    mock_client.resolve_channel_id.assert_called_once()
+    assert mock_scrape.call_count == 3
+    
+    assert "CHANNEL | channel_id=UC_alpha | videos=2 | comments=10 | errors=0" in out
+    assert "CHANNEL | channel_id=UC_beta | videos=1 | comments=5 | errors=0" in out
+    assert "TOTAL | channels=2 | failed_channels=0 | videos=3 | comments=15 | errors=0" in out
+    
+    summary_repo = JSONChannelRunSummaryRepository(data_root=tmp_path)
+    assert summary_repo.load_latest("UC_alpha").video_ids == ("a1", "a2")
+    assert summary_repo.load_latest("UC_beta").video_ids == ("b1",)
+    
+    
+def test_cli_scrape_channels_skips_unresolvable_channel(capsys, tmp_path: Path):
+    refs_file = tmp_path / "channels.txt"
+    refs_file.write_text("@alpha\n@missing\n", encoding="utf-8")
+    
+    mock_client = Mock()
+    mock_client.fetch_video_statistics.return_value = {}
+    mock_client.resolve_channel_id.side_effect = ["UC_alpha", ValueError("Channel not found")]
+    
+    videos_by_channel = {"UC_alpha": [ChannelVideo(video_id="a1", channel_id="UC_alpha", title="Alpha 1")]}
+    
+    with (
+        patch.dict("os.environ", {"YOUTUBE_API_KEY": "test-key"}), 
+        patch("yt_comments.cli.commands.channel.YouTubeApiClient", return_value=mock_client), 
+        patch(
+            "yt_comments.cli.commands.channel.ChannelVideoDiscoveryService",
+            side_effect=_discovery_for(videos_by_channel),
+        ), 
+        patch(
+            "yt_comments.cli.commands.channel._scrape_video",
+            return_value=ScrapeResult(video_id="a1", saved_count=2, path=tmp_path / "a1.jsonl"),
+        ),
+    ):
+        exit_code = main(["scrape-channels", str(refs_file), "--data-root", str(tmp_path), "--bronze-dir", str(tmp_path / "bronze")])
+    
+    out = capsys.readouterr().out
+    
+    assert exit_code == 1
+    assert "Failed to resolve | channel_ref=@missing" in out
+    assert "TOTAL | channels=1 | failed_channels=1 | videos=1 | comments=2 | errors=0" in out
@@ -0,0 +1,151 @@
+import pytest
+
+from datetime import datetime, timezone
+
+from yt_comments.ingestion.api_emulator import EmulatorConfig, YouTubeApiEmulator, channel_id, video_id
+from yt_comments.ingestion.api_key_pool import ApiKeyPool
+from yt_comments.ingestion.channel_ref_parser import parse_channel_ref
+from yt_comments.ingestion.channel_video_discovery_service import ChannelVideoDiscoveryService
+from yt_comments.ingestion.models import ChannelVideoDiscovery
+from yt_comments.ingestion.response_cache import ResponseCache
+from yt_comments.ingestion.retry import RetryPolicy
+from yt_comments.ingestion.youtube_api_client import YouTubeApiClient
+
+
+@pytest.fixture
+def emulator():
+    with YouTubeApiEmulator(EmulatorConfig(videos_per_channel=60, comments_per_video=230)) as emulator:
+        yield emulator
+
+
+def test_client_scrapes_paginated_comments_from_emulator(emulator):
+    client = YouTubeApiClient(api_key="emu-key", base_url=emulator.base_url)
+    
+    pages = list(client.fetch_comment_pages(video_id(0, 3)))
+    comments = [c for page in pages for c in page.comments]
+    
+    assert [len(page.comments) for page in pages] == [100, 100, 30]
+    assert len({c.comment_id for c in comments}) == 230
+    # newest first, and the same data on every run
+    assert comments[0].published_at > comments[-1].published_at
+    assert [c.text for c in comments] == [c.text for c in client.fetch_comments(video_id(0, 3))]
+    client.close()
+
+
+def test_client_discovers_videos_from_emulator_with_both_engines(emulator):
+    client = YouTubeApiClient(api_key="emu-key", base_url=emulator.base_url)
+    
+    resolved = client.resolve_channel_id(parse_channel_ref("@emuchannel0"))
+    assert resolved == channel_id(0)
+    
+    searched = list(client.discover_videos(ChannelVideoDiscovery(channel_id=resolved)))
+    uploads = list(client.discover_videos(ChannelVideoDiscovery(channel_id=resolved, engine="uploads")))
+    
+    assert [v.video_id for v in searched] == [v.video_id for v in uploads]
+    assert len(uploads) == 60
+    assert uploads[0].comment_count == 230
+    
+    # two search pages at 100 units versus channels + two playlist pages + two videos batches
+    assert emulator.units_used("emu-key") == 1 + 200 + 1 + 2 + 2
+    client.close()
+
+
+def test_client_retries_injected_errors_against_emulator():
+    config = EmulatorConfig(comments_per_video=500, rate_limit_rate=0.3, server_error_rate=0.2, seed=7)
+    with YouTubeApiEmulator(config) as emulator:
+        client = YouTubeApiClient(
+            api_key="emu-key",
+            base_url=emulator.base_url,
+            retry_policy=RetryPolicy(max_attempts=20),
+            sleep=lambda _: None,
+        )
+        comments = list(client.fetch_comments(video_id(0, 0)))
+        
+    assert len(comments) == 500
+    assert emulator.requests["commentThreads"] > 5 # some requests were answered with 429/503
+    client.close()
+
+
+def test_emulator_reports_quota_exhaustion():
+    with YouTubeApiEmulator(EmulatorConfig(quota_per_key=2)) as emulator:
+        client = YouTubeApiClient(api_key="emu-key", base_url=emulator.base_url)
+        with pytest.raises(ValueError, match="quota exceeded"):
+            list(client.fetch_comments(video_id(0, 0)))
+    client.close()
+
+
+def test_client_ingests_replies_from_emulator():
+    with YouTubeApiEmulator(EmulatorConfig(comments_per_video=120, max_replies_per_thread=9)) as emulator:
+        client = YouTubeApiClient(api_key="emu-key", base_url=emulator.base_url)
+        comments = [c for page in client.fetch_comment_pages(video_id(0, 0), include_replies=True) for c in page.comments]
+        
+    top_level = [c for c in comments if not c.is_reply]
+    replies = [c for c in comments if c.is_reply]
+    assert len(top_level) == 120
+    assert len({c.comment_id for c in replies}) == len(replies) > 0
+    assert all(r.parent_id and r.comment_id.startswith(r.parent_id) for r in replies)
+    
+    # one comments.list call per thread with more replies than the 5 inlined ones
+    threads_over_inline = sum(1 for c in top_level if sum(r.parent_id == c.comment_id for r in replies) > 5)
+    assert emulator.requests["comments"] == threads_over_inline
+    client.close()
+
+
+def test_client_finishes_scrape_across_key_pool_against_emulator():
+    # 5 pages, but no key may spend more than 2 units
+    config = EmulatorConfig(comments_per_video=500, quota_per_key=2, invalid_keys=frozenset({"emu-bad"}))
+    with YouTubeApiEmulator(config) as emulator:
+        client = YouTubeApiClient(
+            api_key="emu-bad",
+            base_url=emulator.base_url,
+            key_pool=ApiKeyPool(["emu-bad", "emu-1", "emu-2", "emu-3"]),
+        )
+        comments = list(client.fetch_comments(video_id(0, 0)))
+        
+    assert len(comments) == 500
+    assert sum(emulator.units_used(key) for key in ("emu-1", "emu-2", "emu-3")) == 5
+    assert client.key_pool.retired()["emu-bad"] == "keyInvalid"
+
+
+def test_client_serves_discovery_from_response_cache_against_emulator(emulator, tmp_path):
+    now = [1_000.0]
+    cache = ResponseCache(tmp_path / "http", ttl=60, clock=lambda: now[0])
+    request = ChannelVideoDiscovery(channel_id=channel_id(0))
+    
+    def discover() -> list[str]:
+        client = YouTubeApiClient(api_key="emu-key", base_url=emulator.base_url, response_cache=cache)
+        videos = [v.video_id for v in client.discover_videos(request)]
+        client.close()
+        return videos
+    
+    first = discover()
+    sent = emulator.requests["search"]
+    
+    assert discover() == first
+    assert emulator.requests["search"] == sent # served from disk, no quota spent
+    
+    now[0] += 61
+    assert discover() == first
+    assert emulator.requests["search"] == 2 * sent # revalidated with If-None-Match
+    assert cache.stats().hits == sent
+    assert cache.stats().revalidated == sent
+
+
+def test_sharded_discovery_hits_response_cache_on_repeated_run(emulator, tmp_path):
+    cache = ResponseCache(tmp_path / "http", ttl=3600)
+    request = ChannelVideoDiscovery(channel_id=channel_id(0))
+    
+    def discover(minute: int) -> list[str]:
+        client = YouTubeApiClient(api_key="emu-key", base_url=emulator.base_url, response_cache=cache)
+        now = datetime(2026, 1, 2, 9, minute, tzinfo=timezone.utc) # a day after the newest emulated video
+        service = ChannelVideoDiscoveryService(client=client, request=request, shards=3, clock=lambda: now)
+        videos = [v.video_id for v in service.run().videos]
+        client.close()
+        return videos
+    
+    first = discover(minute=10)
+    sent = emulator.requests["search"]
+    
+    assert discover(minute=40) == first
+    assert emulator.requests["search"] == sent # every shard URL was cached by the first run
+    assert cache.stats().hits == sent
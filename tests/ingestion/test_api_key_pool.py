@@ -0,0 +1,56 @@
+import pytest
+
+from yt_comments.ingestion.api_key_pool import ApiKeyPool, NoUsableApiKeyError
+from yt_comments.ingestion.quota import QuotaBudgetExceededError, QuotaLedger
+
+
+def test_pool_round_robins_without_ledger():
+    pool = ApiKeyPool(["k1", "k2", "k1", ""])
+    
+    assert pool.keys == ("k1", "k2")
+    assert [pool.acquire("commentThreads") for _ in range(4)] == ["k1", "k2", "k1", "k2"]
+
+
+def test_pool_prefers_key_with_most_remaining_quota():
+    ledger = QuotaLedger(daily_budget=10)
+    for _ in range(4):
+        ledger.charge("k1", "commentThreads")
+    pool = ApiKeyPool(["k1", "k2"])
+    
+    picked = [pool.acquire("commentThreads", quota=ledger) for _ in range(6)]
+    
+    # k2 catches up with k1 first, then the keys alternate
+    assert picked == ["k2", "k2", "k2", "k2", "k1", "k2"]
+    assert ledger.used("k1") == 5
+    assert ledger.used("k2") == 5
+    assert pool.remaining(ledger) == 10
+
+
+def test_pool_raises_budget_error_when_every_key_is_spent():
+    ledger = QuotaLedger(daily_budget=1)
+    pool = ApiKeyPool(["k1", "k2"])
+    pool.acquire("videos", quota=ledger)
+    pool.acquire("videos", quota=ledger)
+    
+    assert not pool.has_capacity(ledger)
+    with pytest.raises(QuotaBudgetExceededError):
+        pool.acquire("videos", quota=ledger)
+
+
+def test_retired_keys_leave_rotation():
+    pool = ApiKeyPool(["k1", "k2"])
+    
+    assert pool.retire("k1", "keyInvalid") is True
+    assert pool.retire("k1", "keyInvalid") is False
+    assert pool.retired() == {"k1": "keyInvalid"}
+    assert {pool.acquire("videos") for _ in range(3)} == {"k2"}
+    
+    pool.retire("k2", "quotaExceeded")
+    assert not pool.has_capacity()
+    with pytest.raises(NoUsableApiKeyError):
+        pool.acquire("videos")
+
+
+def test_pool_needs_a_key():
+    with pytest.raises(ValueError):
+        ApiKeyPool(["", ""])
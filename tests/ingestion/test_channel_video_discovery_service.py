@@ -1,4 +1,4 @@
-from datetime import datetime, timezone
+from datetime import datetime, timedelta, timezone
 
 from yt_comments.ingestion.channel_video_discovery_client import StubChannelVideoDiscoveryClient
 from yt_comments.ingestion.channel_video_discovery_service import ChannelVideoDiscoveryService, ChannelVideoDiscoveryResult
@@ -36,4 +36,78 @@ def test_channel_video_discovery_service_returns_result():
     
     assert result.video_count == 3
     assert result.videos == expected
-    
\ No newline at end of file
+    
+
+class _WindowedClient:
+    """Search-like fake: newest first within the requested window, truncated at `cap` results."""
+    
+    def __init__(self, videos, cap):
+        self.videos = sorted(videos, key=lambda v: v.published_at, reverse=True)
+        self.cap = cap
+        self.requests = []
+        
+    def discover_videos(self, request):
+        self.requests.append(request)
+        matching = [
+            v for v in self.videos
+            if request.published_after <= v.published_at <= request.published_before
+        ]
+        limit = min(self.cap, request.limit) if request.limit is not None else self.cap
+        return matching[:limit]
+
+
+def _daily_videos(days):
+    start = datetime(2026, 1, 1, 12, 0, tzinfo=timezone.utc)
+    return [
+        ChannelVideo(video_id=f"v{i:02d}", channel_id="chan123", title=f"Video {i}", published_at=start + timedelta(days=i))
+        for i in range(days)
+    ]
+
+
+def test_sharded_discovery_bisects_capped_shards_and_merges_in_date_order():
+    videos = _daily_videos(20)
+    client = _WindowedClient(videos, cap=4)
+    request = ChannelVideoDiscovery(
+        channel_id="chan123",
+        published_after=datetime(2026, 1, 1, tzinfo=timezone.utc),
+        published_before=datetime(2026, 1, 21, tzinfo=timezone.utc),
+    )
+    
+    service = ChannelVideoDiscoveryService(client=client, request=request, shards=2, result_cap=4)
+    result = service.run()
+    
+    # a single walk would have stopped at 4 videos; bisection recovers the whole window
+    assert result.video_count == 20
+    assert [v.video_id for v in result.videos] == [f"v{i:02d}" for i in reversed(range(20))]
+    assert len(client.requests) > 2
+
+
+def test_sharded_discovery_applies_limit_to_newest_videos():
+    videos = _daily_videos(10)
+    client = _WindowedClient(videos, cap=100)
+    request = ChannelVideoDiscovery(
+        channel_id="chan123",
+        published_after=datetime(2026, 1, 1, tzinfo=timezone.utc),
+        published_before=datetime(2026, 1, 11, tzinfo=timezone.utc),
+        limit=3,
+    )
+    
+    result = ChannelVideoDiscoveryService(client=client, request=request, shards=3).run()
+    
+    assert [v.video_id for v in result.videos] == ["v09", "v08", "v07"]
+    assert all(r.limit == 3 for r in client.requests)
+    assert len(client.requests) == 3
+
+
+def test_sharded_discovery_open_window_bounds_are_stable_within_the_hour():
+    client = _WindowedClient(_daily_videos(10), cap=100)
+    request = ChannelVideoDiscovery(channel_id="chan123", published_after=datetime(2026, 1, 1, tzinfo=timezone.utc))
+    
+    for minute in (5, 55):
+        now = datetime(2026, 1, 20, 9, minute, 30, tzinfo=timezone.utc)
+        ChannelVideoDiscoveryService(client=client, request=request, shards=3, clock=lambda: now).run()
+    
+    # same shard requests (and cache keys) on both runs, the newest one ending at the next full hour
+    first, second = client.requests[:3], client.requests[3:]
+    assert first == second
+    assert max(r.published_before for r in first) == datetime(2026, 1, 20, 10, tzinfo=timezone.utc)
@@ -0,0 +1,69 @@
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+from yt_comments.ingestion.comment_allocation import allocate_comment_limits
+from yt_comments.ingestion.models import ChannelVideo
+
+
+NOW = datetime(2026, 3, 1, tzinfo=timezone.utc)
+
+
+def _video(video_id, comment_count=None, age_days=0):
+    return ChannelVideo(
+        video_id=video_id,
+        channel_id="UC_test",
+        title=video_id,
+        published_at=NOW - timedelta(days=age_days),
+        comment_count=comment_count,
+    )
+
+
+def test_allocation_follows_comment_count_and_redistributes_capped_share():
+    videos = [_video("tiny", 20), _video("mid", 1_000), _video("viral", 50_000)]
+    
+    limits = allocate_comment_limits(videos, total=7_000, min_per_video=100, max_per_video=5_000, now=NOW)
+    
+    # tiny can't use more than it has, viral is capped, the rest goes to mid (and 980 stay unused)
+    assert limits == {"tiny": 20, "mid": 1_000, "viral": 5_000}
+
+
+def test_allocation_is_proportional_within_budget():
+    videos = [_video("a", 3_000), _video("b", 1_000)]
+    
+    limits = allocate_comment_limits(videos, total=1_000, min_per_video=0, now=NOW)
+    
+    assert limits == {"a": 750, "b": 250}
+    assert sum(limits.values()) == 1_000
+
+
+def test_allocation_by_recency_prefers_new_videos():
+    videos = [_video("new", 1_000, age_days=0), _video("old", 1_000, age_days=30)]
+    
+    limits = allocate_comment_limits(videos, total=900, weighting="recency", now=NOW)
+    
+    assert limits == {"new": 600, "old": 300}
+
+
+def test_allocation_minimums_in_order_when_budget_is_short():
+    videos = [_video("a", 500), _video("b", 500), _video("c", 500)]
+    
+    limits = allocate_comment_limits(videos, total=250, min_per_video=100, now=NOW)
+    
+    assert limits == {"a": 100, "b": 100, "c": 50}
+    assert sum(limits.values()) == 250
+
+
+def test_allocation_with_unknown_counts_uses_max_cap():
+    videos = [_video("a"), _video("b", 10)]
+    
+    limits = allocate_comment_limits(videos, total=1_000, min_per_video=50, max_per_video=300, now=NOW)
+    
+    assert limits == {"a": 300, "b": 10}
+
+
+def test_allocation_rejects_bad_arguments():
+    with pytest.raises(ValueError):
+        allocate_comment_limits([], total=10, weighting="views")
+    with pytest.raises(ValueError):
+        allocate_comment_limits([], total=10, min_per_video=10, max_per_video=5)
@@ -0,0 +1,118 @@
+import gzip
+import json
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+from yt_comments.ingestion.http_transport import HttpTransport, HttpTransportConfig
+
+
+class _JsonHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1" # keep-alive capable
+    
+    def do_GET(self):
+        body = json.dumps({"items": []}).encode("utf-8")
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+        
+    def log_message(self, format, *args):
+        pass
+
+
+@pytest.fixture
+def local_server():
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _JsonHandler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{server.server_address[1]}/youtube/v3/commentThreads"
+    server.shutdown()
+    server.server_close()
+
+
+def test_transport_reuses_connection_across_requests(local_server):
+    transport = HttpTransport(HttpTransportConfig(pool_size=2))
+    
+    for _ in range(5):
+        resp = transport.get(local_server, params={"videoId": "vid1"})
+        assert resp.json() == {"items": []}
+        
+    stats = transport.stats()
+    assert stats.request_count == 5
+    assert stats.connection_count == 1
+    assert stats.reused_count == 4
+    transport.close()
+
+
+def test_transport_without_keep_alive_opens_connection_per_request(local_server):
+    transport = HttpTransport(HttpTransportConfig(keep_alive=False))
+    
+    for _ in range(3):
+        transport.get(local_server, params={"videoId": "vid1"})
+        
+    stats = transport.stats()
+    assert stats.request_count == 3
+    assert stats.connection_count == 3
+    assert stats.reused_count == 0
+    transport.close()
+
+
+def test_transport_rejects_empty_pool():
+    with pytest.raises(ValueError, match="pool_size"):
+        HttpTransport(HttpTransportConfig(pool_size=0))
+
+
+class _GzipHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    
+    def do_GET(self):
+        body = json.dumps({"items": [{"text": "same comment " * 20}] * 50}).encode("utf-8")
+        # like Google APIs: compress only when both the header and a gzip User-Agent ask for it
+        if "gzip" in self.headers.get("Accept-Encoding", "") and "gzip" in self.headers.get("User-Agent", ""):
+            body = gzip.compress(body)
+            self.send_response(200)
+            self.send_header("Content-Encoding", "gzip")
+        else:
+            self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+        
+    def log_message(self, format, *args):
+        pass
+
+
+@pytest.fixture
+def gzip_server():
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _GzipHandler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{server.server_address[1]}/youtube/v3/commentThreads"
+    server.shutdown()
+    server.server_close()
+
+
+def test_transport_requests_gzip_and_counts_wire_bytes(gzip_server):
+    transport = HttpTransport()
+    
+    resp = transport.get(gzip_server, params={"videoId": "vid1"})
+    assert len(resp.json()["items"]) == 50
+    
+    stats = transport.stats()
+    assert stats.decoded_bytes == len(resp.content)
+    assert 0 < stats.wire_bytes < stats.decoded_bytes / 10
+    transport.close()
+
+
+def test_transport_without_compression_transfers_plain_bodies(gzip_server):
+    transport = HttpTransport(HttpTransportConfig(compress=False))
+    
+    transport.get(gzip_server, params={"videoId": "vid1"})
+    
+    stats = transport.stats()
+    assert stats.wire_bytes == stats.decoded_bytes > 0
+    transport.close()
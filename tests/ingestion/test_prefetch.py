@@ -0,0 +1,47 @@
+import time
+
+import pytest
+
+from yt_comments.ingestion.prefetch import prefetch
+
+
+def test_prefetch_keeps_order():
+    assert list(prefetch(range(10), 3)) == list(range(10))
+
+
+def test_prefetch_raises_producer_error_after_earlier_items():
+    def items():
+        yield 1
+        yield 2
+        raise RuntimeError("page 3 failed")
+    
+    seen = []
+    with pytest.raises(RuntimeError, match="page 3 failed"):
+        for item in prefetch(items(), 2):
+            seen.append(item)
+    assert seen == [1, 2]
+
+
+def test_prefetch_stays_bounded_and_stops_when_consumer_stops():
+    produced = []
+    
+    def items():
+        for i in range(100):
+            produced.append(i)
+            yield i
+    
+    it = prefetch(items(), 2)
+    assert next(it) == 0
+    time.sleep(0.3) # give the producer time to fill the buffer
+    # item 0 handed over, 2 buffered and at most one more waiting to be put
+    assert len(produced) <= 4
+    it.close()
+    
+    count = len(produced)
+    time.sleep(0.3)
+    assert len(produced) <= count + 1
+
+
+def test_prefetch_rejects_invalid_depth():
+    with pytest.raises(ValueError, match="depth"):
+        list(prefetch([], 0))
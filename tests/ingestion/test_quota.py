@@ -0,0 +1,125 @@
+from datetime import datetime, timezone
+
+import pytest
+
+from yt_comments.ingestion.quota import (
+    QuotaBudgetExceededError, QuotaLedger, RateLimiter, estimate_comment_units, 
+    key_fingerprint, plan_within_budget, quota_day
+)
+from yt_comments.storage.quota_ledger_repository import JSONQuotaLedgerRepository
+
+
+def test_ledger_charges_endpoint_costs_and_persists(tmp_path):
+    repo = JSONQuotaLedgerRepository(data_root=tmp_path)
+    ledger = QuotaLedger(daily_budget=1000, repo=repo)
+    
+    ledger.charge("key-a", "search")
+    ledger.charge("key-a", "commentThreads")
+    ledger.charge("key-b", "channels")
+    
+    assert ledger.used("key-a") == 101
+    assert ledger.remaining("key-a") == 899
+    assert ledger.used("key-b") == 1
+    
+    # a new run sees what previous runs spent (the client flushes the ledger on close)
+    ledger.flush()
+    reloaded = QuotaLedger(daily_budget=1000, repo=repo)
+    assert reloaded.used("key-a") == 101
+    
+    raw = (tmp_path / "state" / "quota_ledger.json").read_text(encoding="utf-8")
+    assert "key-a" not in raw
+    assert key_fingerprint("key-a") in raw
+
+
+def test_ledgers_of_overlapping_processes_add_up_their_usage(tmp_path):
+    repo = JSONQuotaLedgerRepository(data_root=tmp_path)
+    schedule = QuotaLedger(daily_budget=1000, repo=repo, flush_interval=0)
+    scrape = QuotaLedger(daily_budget=1000, repo=JSONQuotaLedgerRepository(data_root=tmp_path), flush_interval=0)
+    
+    schedule.charge("key-a", "search")
+    scrape.charge("key-a", "commentThreads")
+    schedule.charge("key-a", "commentThreads")
+    
+    # neither overwrote the other's usage, and each write picked up what the other spent
+    assert QuotaLedger(daily_budget=1000, repo=repo).used("key-a") == 102
+    assert schedule.used("key-a") == 102
+    assert scrape.used("key-a") == 101
+
+
+def test_ledger_debounces_writes(tmp_path):
+    path = tmp_path / "state" / "quota_ledger.json"
+    clock = [0.0]
+    ledger = QuotaLedger(
+        daily_budget=1000,
+        repo=JSONQuotaLedgerRepository(data_root=tmp_path),
+        flush_interval=1.0,
+        monotonic=lambda: clock[0],
+    )
+    
+    for _ in range(50):
+        ledger.charge("key-a", "commentThreads")
+    assert not path.exists()
+    
+    clock[0] = 1.5
+    ledger.charge("key-a", "commentThreads")
+    assert JSONQuotaLedgerRepository(data_root=tmp_path).load()
+    assert QuotaLedger(repo=JSONQuotaLedgerRepository(data_root=tmp_path)).used("key-a") == 51
+    
+    ledger.mark_exhausted("key-a") # written right away
+    assert QuotaLedger(daily_budget=1000, repo=JSONQuotaLedgerRepository(data_root=tmp_path)).remaining("key-a") == 0
+
+
+def test_ledger_refuses_requests_over_budget():
+    ledger = QuotaLedger(daily_budget=150)
+    ledger.charge("key-a", "search")
+    
+    with pytest.raises(QuotaBudgetExceededError, match="budget exhausted"):
+        ledger.charge("key-a", "search")
+        
+    assert ledger.used("key-a") == 100
+    ledger.charge("key-a", "commentThreads")
+    assert ledger.remaining("key-a") == 49
+
+
+def test_ledger_resets_on_new_pacific_quota_day():
+    now = datetime(2026, 1, 10, 7, 30, tzinfo=timezone.utc) # 23:30 PT on 2026-01-09
+    ledger = QuotaLedger(daily_budget=100, clock=lambda: now)
+    ledger.mark_exhausted("key-a")
+    assert ledger.remaining("key-a") == 0
+    
+    now = datetime(2026, 1, 10, 8, 30, tzinfo=timezone.utc) # past midnight PT
+    assert ledger.remaining("key-a") == 100
+    assert quota_day(now).isoformat() == "2026-01-10"
+
+
+def test_plan_within_budget_keeps_order():
+    planned, deferred = plan_within_budget(["v1", "v2", "v3", "v4"], remaining=120, unit_cost=50)
+    
+    assert planned == ["v1", "v2"]
+    assert deferred == ["v3", "v4"]
+    assert estimate_comment_units(5000) == 50
+    assert estimate_comment_units(None) == 1
+
+
+def test_plan_within_budget_with_per_item_cost():
+    costs = {"v1": 10, "v2": 50, "v3": 5}
+    planned, deferred = plan_within_budget(["v1", "v2", "v3"], remaining=40, unit_cost=costs.__getitem__)
+    
+    # stops at the first video that doesn't fit, so the order is kept
+    assert planned == ["v1"]
+    assert deferred == ["v2", "v3"]
+
+
+def test_rate_limiter_spaces_requests():
+    clock = [0.0]
+    sleeps = []
+    
+    def sleep(seconds):
+        sleeps.append(seconds)
+        clock[0] += seconds
+    
+    limiter = RateLimiter(4.0, monotonic=lambda: clock[0], sleep=sleep)
+    for _ in range(3):
+        limiter.acquire()
+        
+    assert sleeps == [0.25, 0.25]
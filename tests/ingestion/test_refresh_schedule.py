@@ -0,0 +1,58 @@
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+from yt_comments.ingestion.models import VideoRefreshState
+from yt_comments.ingestion.refresh_schedule import (
+    due_for_refresh, expected_new_comments, mark_scraped, observe_comment_count
+)
+
+
+NOW = datetime(2026, 3, 1, 12, 0, tzinfo=timezone.utc)
+
+
+def _state(video_id: str, **kwargs) -> VideoRefreshState:
+    return VideoRefreshState(video_id=video_id, channel_id="UC_test", title=video_id, **kwargs)
+
+
+def test_observe_comment_count_seeds_and_smooths_growth_rate():
+    state = _state("v1", published_at=NOW - timedelta(days=10))
+    
+    state = observe_comment_count(state, 100, NOW)
+    assert state.comments_per_day == pytest.approx(10.0) # lifetime average
+    
+    state = observe_comment_count(state, 130, NOW + timedelta(days=1))
+    assert state.comments_per_day == pytest.approx(20.0) # half of 30/day, half of 10/day
+    assert state.observed_comment_count == 130
+
+
+def test_expected_new_comments_counts_growth_since_last_scrape():
+    state = mark_scraped(observe_comment_count(_state("v1"), 40, NOW), NOW)
+    state = observe_comment_count(state, 65, NOW + timedelta(days=1))
+    
+    assert state.scraped_comment_count == 40
+    assert expected_new_comments(state, NOW + timedelta(days=1)) == pytest.approx(25.0)
+    # the growth rate keeps adding expected comments after the reading
+    assert expected_new_comments(state, NOW + timedelta(days=2)) == pytest.approx(50.0)
+
+
+def test_due_for_refresh_ranks_by_expected_comments():
+    quiet = mark_scraped(observe_comment_count(_state("quiet"), 10, NOW - timedelta(days=1)), NOW - timedelta(days=1))
+    quiet = observe_comment_count(quiet, 12, NOW)
+    busy = mark_scraped(observe_comment_count(_state("busy"), 10, NOW - timedelta(days=1)), NOW - timedelta(days=1))
+    busy = observe_comment_count(busy, 90, NOW)
+    recent = mark_scraped(observe_comment_count(_state("recent"), 10, NOW), NOW - timedelta(hours=1))
+    recent = observe_comment_count(recent, 500, NOW)
+    disabled = observe_comment_count(_state("disabled"), None, NOW)
+    new = _state("new", published_at=NOW - timedelta(days=30))
+    
+    due = due_for_refresh(
+        [quiet, busy, recent, disabled, new],
+        now=NOW,
+        min_new_comments=5,
+        min_interval=timedelta(hours=6),
+    )
+    
+    assert [state.video_id for state, _ in due] == ["busy", "new"]
+    assert due[0][1] == pytest.approx(80.0)
+    assert due[1][1] == pytest.approx(0.5) # never scraped: always due, ranked by the age prior
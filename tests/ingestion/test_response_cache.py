@@ -0,0 +1,72 @@
+from pathlib import Path
+
+import pytest
+
+from yt_comments.ingestion.response_cache import ResponseCache
+
+
+class _Clock:
+    def __init__(self, now: float = 1_000.0) -> None:
+        self.now = now
+    
+    def __call__(self) -> float:
+        return self.now
+
+
+URL = "https://www.googleapis.com/youtube/v3/search"
+
+
+def test_cache_key_ignores_api_key_and_param_order():
+    a = ResponseCache.key(URL, {"channelId": "UC1", "key": "key-a", "pageToken": "t"})
+    b = ResponseCache.key(URL, {"pageToken": "t", "key": "key-b", "channelId": "UC1"})
+    c = ResponseCache.key(URL, {"channelId": "UC1", "key": "key-a", "pageToken": "t2"})
+    
+    assert a == b
+    assert a != c
+
+
+def test_cache_round_trip_and_ttl(tmp_path: Path):
+    clock = _Clock()
+    cache = ResponseCache(tmp_path, ttl=60, clock=clock)
+    params = {"channelId": "UC1", "key": "secret"}
+    
+    assert cache.get(URL, params) is None
+    cache.put(URL, params, b'{"items": []}', '"etag-1"')
+    
+    # a new instance (next run) sees the entry, and the key never reached the disk
+    entry = ResponseCache(tmp_path, ttl=60, clock=clock).get(URL, {"channelId": "UC1", "key": "other"})
+    assert entry.body == b'{"items": []}'
+    assert entry.etag == '"etag-1"'
+    assert cache.is_fresh(entry)
+    assert all("secret" not in p.read_text(encoding="utf-8") for p in tmp_path.iterdir())
+    
+    clock.now += 61
+    assert not cache.is_fresh(entry)
+    assert cache.is_fresh(cache.refresh(URL, params, entry))
+
+
+def test_cache_evicts_least_recently_used(tmp_path: Path):
+    clock = _Clock()
+    body = b"x" * 400
+    cache = ResponseCache(tmp_path, max_bytes=2000, clock=clock)
+    
+    for page in range(3):
+        clock.now += 1
+        cache.put(URL, {"pageToken": str(page)}, body, None)
+    clock.now += 1
+    assert cache.get(URL, {"pageToken": "0"}) is not None # page 0 is now the most recently used
+    
+    clock.now += 1
+    cache.put(URL, {"pageToken": "3"}, body, None)
+    
+    assert cache.size_bytes() <= 2000
+    assert cache.get(URL, {"pageToken": "1"}) is None
+    assert cache.get(URL, {"pageToken": "0"}) is not None
+    assert cache.get(URL, {"pageToken": "3"}) is not None
+
+
+def test_cache_rejects_invalid_settings(tmp_path: Path):
+    with pytest.raises(ValueError):
+        ResponseCache(tmp_path, ttl=-1)
+    with pytest.raises(ValueError):
+        ResponseCache(tmp_path, max_bytes=0)
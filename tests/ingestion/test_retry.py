@@ -0,0 +1,38 @@
+import random
+from datetime import datetime, timezone
+
+import pytest
+
+from yt_comments.ingestion.retry import RetryPolicy, parse_retry_after
+
+
+def test_backoff_delay_grows_exponentially_and_is_capped():
+    policy = RetryPolicy(base_delay=1.0, max_delay=5.0, jitter=0.0)
+    
+    assert [policy.backoff_delay(n) for n in range(1, 6)] == [1.0, 2.0, 4.0, 5.0, 5.0]
+    
+
+def test_backoff_delay_jitter_stays_within_bounds():
+    policy = RetryPolicy(base_delay=2.0, max_delay=60.0, jitter=0.5)
+    rng = random.Random(42)
+    
+    delays = [policy.backoff_delay(3, rng) for _ in range(100)]
+    
+    assert all(4.0 <= d <= 8.0 for d in delays)
+    assert len(set(delays)) > 1
+    
+
+def test_parse_retry_after_seconds_and_http_date():
+    now = datetime(2026, 1, 1, 12, 0, 0, tzinfo=timezone.utc)
+    
+    assert parse_retry_after("12") == 12.0
+    assert parse_retry_after("Thu, 01 Jan 2026 12:00:30 GMT", now=now) == 30.0
+    assert parse_retry_after(None) is None
+    assert parse_retry_after("soon") is None
+    
+
+def test_retry_policy_rejects_invalid_settings():
+    with pytest.raises(ValueError, match="max_attempts"):
+        RetryPolicy(max_attempts=0)
+    with pytest.raises(ValueError, match="jitter"):
+        RetryPolicy(jitter=1.5)
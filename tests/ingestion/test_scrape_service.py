@@ -1,7 +1,9 @@
 from datetime import datetime, timezone
 from unittest.mock import Mock
 
-from yt_comments.ingestion.models import Comment
+import pytest
+
+from yt_comments.ingestion.models import Comment, CommentPage
 from yt_comments.ingestion.scrape_service import ScrapeCommentsService
 from yt_comments.storage.bronze_comments_repository import JSONLCommentsRepository
 
@@ -41,7 +43,7 @@ def test_scrape_service_saves_comments_and_returns_result(tmp_path) -> None:
             ),
         ]
     mock_client = Mock()
-    mock_client.fetch_comments.return_value = fake_client
+    mock_client.fetch_comment_pages.return_value = [CommentPage(video_id=video_id, comments=fake_client)]
     
     client = mock_client
     repo = JSONLCommentsRepository(tmp_path)
@@ -55,4 +57,230 @@ def test_scrape_service_saves_comments_and_returns_result(tmp_path) -> None:
     
     loaded = repo.load(video_id)
     assert len(loaded) == 3
-    assert all(c.video_id == video_id for c in loaded)
\ No newline at end of file
+    assert all(c.video_id == video_id for c in loaded)
+
+
+def _comment(video_id: str, comment_id: str) -> Comment:
+    return Comment(
+        video_id=video_id,
+        comment_id=comment_id,
+        text=f"text of {comment_id}",
+        published_at=datetime(2026, 1, 1, 12, 0, 0, tzinfo=timezone.utc),
+    )
+
+
+class _FailingPagesClient:
+    """Serves pages of two comments and fails when asked for the page named `fail_on`."""
+    
+    def __init__(self, video_id: str, page_count: int, fail_on: str | None = None) -> None:
+        self.video_id = video_id
+        self.page_count = page_count
+        self.fail_on = fail_on
+        self.requested_tokens: list[str | None] = []
+        
+    def fetch_comment_pages(self, video_id, *, page_token=None, prefetch=0, include_replies=False, reply_workers=4):
+        index = 0 if page_token is None else int(page_token.removeprefix("p"))
+        while index < self.page_count:
+            token = None if index == 0 else f"p{index}"
+            self.requested_tokens.append(token)
+            if token is not None and token == self.fail_on:
+                raise ValueError("YouTube API error: Backend Error")
+            next_token = f"p{index + 1}" if index + 1 < self.page_count else None
+            yield CommentPage(
+                video_id=video_id,
+                comments=[_comment(video_id, f"c{index}-{i}") for i in range(2)],
+                next_page_token=next_token,
+            )
+            index += 1
+
+
+def test_scrape_service_resumes_from_checkpoint(tmp_path) -> None:
+    video_id = "vid1"
+    repo = JSONLCommentsRepository(tmp_path)
+    
+    failing = _FailingPagesClient(video_id, page_count=4, fail_on="p2")
+    with pytest.raises(ValueError):
+        ScrapeCommentsService(client=failing, repo=repo).run(video_id)
+        
+    checkpoint = repo.load_checkpoint(video_id)
+    assert checkpoint is not None
+    assert checkpoint.next_page_token == "p2"
+    assert checkpoint.row_count == 4
+    # the pages fetched before the failure are on disk, the Bronze file itself isn't published yet
+    assert (tmp_path / f"{video_id}.jsonl.part").exists()
+    assert repo.load(video_id) == []
+    
+    client = _FailingPagesClient(video_id, page_count=4)
+    result = ScrapeCommentsService(client=client, repo=repo).run(video_id, resume=True)
+    
+    assert client.requested_tokens == ["p2", "p3"]
+    assert result.saved_count == 8
+    assert [c.comment_id for c in repo.load(video_id)] == [f"c{p}-{i}" for p in range(4) for i in range(2)]
+    assert repo.load_checkpoint(video_id) is None
+
+
+def test_scrape_service_resume_keeps_appended_base_rows_out_of_limit(tmp_path) -> None:
+    video_id = "vid1"
+    repo = JSONLCommentsRepository(tmp_path)
+    repo.save(video_id, [_comment(video_id, f"old{i}") for i in range(5)])
+    
+    with pytest.raises(ValueError):
+        ScrapeCommentsService(client=_FailingPagesClient(video_id, 4, fail_on="p2"), repo=repo).run(
+            video_id, overwrite=False, limit=5
+        )
+    assert repo.load_checkpoint(video_id).base_rows == 5
+    
+    client = _FailingPagesClient(video_id, page_count=4)
+    result = ScrapeCommentsService(client=client, repo=repo).run(video_id, overwrite=False, limit=5, resume=True)
+    
+    # the 5 rows copied from the old file are neither new nor part of the limit
+    assert client.requested_tokens == ["p2"]
+    assert (result.saved_count, result.truncated) == (5, True)
+    assert len(repo.load(video_id)) == 10
+
+
+def test_scrape_service_resume_drops_rows_after_checkpoint(tmp_path) -> None:
+    video_id = "vid1"
+    repo = JSONLCommentsRepository(tmp_path)
+    
+    with pytest.raises(ValueError):
+        ScrapeCommentsService(client=_FailingPagesClient(video_id, 4, fail_on="p2"), repo=repo).run(video_id)
+    
+    # simulate a crash after a page was written but before its checkpoint was stored
+    with (tmp_path / f"{video_id}.jsonl.part").open("a", encoding="utf-8") as f:
+        f.write('{"video_id": "vid1", "comment_id": "c2-0", "text": "x"}\n{"video_id": "vid1", "comm')
+    
+    result = ScrapeCommentsService(client=_FailingPagesClient(video_id, 4), repo=repo).run(video_id, resume=True)
+    
+    ids = [c.comment_id for c in repo.load(video_id)]
+    assert result.saved_count == 8
+    assert len(ids) == len(set(ids)) == 8
+
+
+def test_scrape_service_limit_stops_mid_page_without_checkpoint(tmp_path) -> None:
+    video_id = "vid1"
+    repo = JSONLCommentsRepository(tmp_path)
+    client = _FailingPagesClient(video_id, page_count=4)
+    
+    result = ScrapeCommentsService(client=client, repo=repo).run(video_id, limit=3)
+    
+    assert result.saved_count == 3
+    assert client.requested_tokens == [None, "p1"]
+    assert len(repo.load(video_id)) == 3
+    assert repo.load_checkpoint(video_id) is None
+    assert result.truncated
+
+
+def test_scrape_service_limit_reached_on_last_comment_is_not_truncated(tmp_path) -> None:
+    video_id = "vid1"
+    repo = JSONLCommentsRepository(tmp_path)
+    
+    full = ScrapeCommentsService(client=_FailingPagesClient(video_id, page_count=2), repo=repo).run(video_id, limit=4)
+    cut = ScrapeCommentsService(client=_FailingPagesClient(video_id, page_count=3), repo=repo).run(video_id, limit=4)
+    
+    assert (full.saved_count, full.truncated) == (4, False)
+    assert (cut.saved_count, cut.truncated) == (4, True)
+
+
+class _NewestFirstClient:
+    def __init__(self, pages: list[list[Comment]]) -> None:
+        self.pages = pages
+        self.orders: list[str | None] = []
+        self.pages_served = 0
+        
+    def fetch_comment_pages(self, video_id, *, page_token=None, order=None, prefetch=0, include_replies=False, reply_workers=4):
+        self.orders.append(order)
+        for i, comments in enumerate(self.pages):
+            self.pages_served += 1
+            next_token = f"p{i + 1}" if i + 1 < len(self.pages) else None
+            yield CommentPage(video_id=video_id, comments=comments, next_page_token=next_token)
+
+
+def _timed_comment(video_id: str, comment_id: str, hour: int) -> Comment:
+    return Comment(
+        video_id=video_id,
+        comment_id=comment_id,
+        text=f"text of {comment_id}",
+        published_at=datetime(2026, 1, 1, hour, 0, 0, tzinfo=timezone.utc),
+    )
+
+
+def test_scrape_service_incremental_appends_only_new_comments(tmp_path) -> None:
+    video_id = "vid1"
+    repo = JSONLCommentsRepository(tmp_path)
+    repo.save(video_id, [_timed_comment(video_id, "old1", 8), _timed_comment(video_id, "old2", 10)])
+    
+    client = _NewestFirstClient(
+        [
+            [_timed_comment(video_id, "new3", 13), _timed_comment(video_id, "new2", 12)],
+            [_timed_comment(video_id, "new1", 11), _timed_comment(video_id, "old2", 10)],
+            [_timed_comment(video_id, "old1", 8)],
+        ]
+    )
+    
+    result = ScrapeCommentsService(client=client, repo=repo).run(video_id, incremental=True)
+    
+    assert client.orders == ["time"]
+    assert client.pages_served == 2 # stops at the first known comment
+    assert result.saved_count == 3
+    assert [c.comment_id for c in repo.load(video_id)] == ["old1", "old2", "new3", "new2", "new1"]
+
+
+def test_scrape_service_incremental_skips_same_timestamp_duplicates(tmp_path) -> None:
+    video_id = "vid1"
+    repo = JSONLCommentsRepository(tmp_path)
+    repo.save(video_id, [_timed_comment(video_id, "a", 10)])
+    
+    client = _NewestFirstClient([[_timed_comment(video_id, "b", 10), _timed_comment(video_id, "a", 10)]])
+    
+    result = ScrapeCommentsService(client=client, repo=repo).run(video_id, incremental=True)
+    
+    assert result.saved_count == 1
+    assert [c.comment_id for c in repo.load(video_id)] == ["a", "b"]
+
+
+def test_scrape_service_incremental_rescrapes_when_new_comments_exceed_limit(tmp_path) -> None:
+    video_id = "vid1"
+    repo = JSONLCommentsRepository(tmp_path)
+    repo.save(video_id, [_timed_comment(video_id, "old1", 8)])
+    
+    client = _NewestFirstClient(
+        [
+            [_timed_comment(video_id, "new3", 13), _timed_comment(video_id, "new2", 12)],
+            [_timed_comment(video_id, "new1", 11), _timed_comment(video_id, "old1", 8)],
+        ]
+    )
+    
+    result = ScrapeCommentsService(client=client, repo=repo).run(video_id, incremental=True, limit=2)
+    
+    # appending new3 + new2 would lose new1 for good: the next run stops at new3
+    assert client.orders == ["time", None]
+    assert result.saved_count == 2
+    assert [c.comment_id for c in repo.load(video_id)] == ["new3", "new2"]
+    assert result.truncated
+
+
+def test_scrape_service_incremental_without_bronze_runs_full_scrape(tmp_path) -> None:
+    video_id = "vid1"
+    repo = JSONLCommentsRepository(tmp_path)
+    client = _FailingPagesClient(video_id, page_count=2)
+    
+    result = ScrapeCommentsService(client=client, repo=repo).run(video_id, incremental=True)
+    
+    assert result.saved_count == 4
+    assert client.requested_tokens == [None, "p1"]
+
+
+def test_scrape_service_checkpoints_on_periodic_flush(tmp_path) -> None:
+    video_id = "vid1"
+    repo = JSONLCommentsRepository(tmp_path)
+    checkpoints = []
+    save_checkpoint = repo.save_checkpoint
+    repo.save_checkpoint = lambda cp: checkpoints.append(cp) or save_checkpoint(cp)
+    
+    service = ScrapeCommentsService(client=_FailingPagesClient(video_id, page_count=5), repo=repo, flush_every_pages=2)
+    result = service.run(video_id)
+    
+    assert result.saved_count == 10
+    assert [(cp.next_page_token, cp.row_count) for cp in checkpoints] == [("p2", 4), ("p4", 8)]
+    assert repo.load_checkpoint(video_id) is None
@@ -1,3 +1,6 @@
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timezone 
 
 import pytest
@@ -5,8 +8,11 @@ from unittest.mock import Mock, patch
 
 import requests
 
+from yt_comments.ingestion.api_key_pool import ApiKeyPool
 from yt_comments.ingestion.models import ChannelVideoDiscovery
-from yt_comments.ingestion.youtube_api_client import YouTubeApiClient
+from yt_comments.ingestion.quota import QuotaBudgetExceededError, QuotaLedger
+from yt_comments.ingestion.retry import RetryPolicy
+from yt_comments.ingestion.youtube_api_client import FIELD_MASKS, YouTubeApiClient
 
 
 def test_fetch_comments_single_page():
@@ -71,7 +77,7 @@ def test_fetch_comments_single_page():
     
     mock_session.get.assert_called_once()
     _, kwargs = mock_session.get.call_args
-    assert kwargs["timeout"] == 30
+    assert kwargs["timeout"] == (10.0, 30.0)
     assert kwargs["params"]["key"] == "test-key"
     assert kwargs["params"]["videoId"] == "vid1"
     assert kwargs["params"]["maxResults"] == 100
@@ -250,7 +256,7 @@ def test_discover_videos_single_page():
     
     mock_session.get.assert_called_once()
     _, kwargs = mock_session.get.call_args
-    assert kwargs["timeout"] == 30
+    assert kwargs["timeout"] == (10.0, 30.0)
     assert kwargs["params"]["key"] == "test-key"
     assert kwargs["params"]["channelId"] == "chan123"
     assert kwargs["params"]["type"] == "video"
@@ -431,3 +437,393 @@ def test_discover_videos_passes_published_after_and_before_params():
     assert kwargs["params"]["publishedAfter"] == "2026-01-01T00:00:00Z"
     assert kwargs["params"]["publishedBefore"] == "2026-02-01T00:00:00Z"
     
+
+
+def test_max_in_flight_caps_concurrent_requests():
+    client = YouTubeApiClient(api_key="test-key", max_in_flight=2)
+    
+    lock = threading.Lock()
+    in_flight = 0
+    peak = 0
+    
+    def slow_get(url, params, timeout):
+        nonlocal in_flight, peak
+        with lock:
+            in_flight += 1
+            peak = max(peak, in_flight)
+        time.sleep(0.02)
+        with lock:
+            in_flight -= 1
+        response = Mock()
+        response.raise_for_status.return_value = None
+        response.json.return_value = {"items": []}
+        return response
+    
+    mock_session = Mock()
+    mock_session.get.side_effect = slow_get
+    
+    with patch("yt_comments.ingestion.youtube_api_client.requests.Session", return_value=mock_session):
+        with ThreadPoolExecutor(max_workers=6) as pool:
+            list(pool.map(lambda v: list(client.fetch_comments(video_id=v)), [f"vid{i}" for i in range(6)]))
+    
+    assert mock_session.get.call_count == 6
+    assert peak == 2
+
+
+def test_max_in_flight_must_be_positive():
+    with pytest.raises(ValueError, match="max_in_flight"):
+        YouTubeApiClient(api_key="test-key", max_in_flight=0)
+
+
+def _response(status_code, payload, headers=None):
+    response = Mock()
+    response.status_code = status_code
+    response.headers = headers or {}
+    response.json.return_value = payload
+    if status_code >= 400:
+        response.raise_for_status.side_effect = requests.HTTPError()
+    else:
+        response.raise_for_status.return_value = None
+    return response
+
+
+def _comment_item(comment_id):
+    return {
+        "snippet": {
+            "topLevelComment": {
+                "id": comment_id,
+                "snippet": {"textOriginal": "text", "publishedAt": "2026-01-01T12:34:56Z"},
+            }
+        }
+    }
+
+
+def test_fetch_comments_retries_failing_page_only():
+    sleeps = []
+    client = YouTubeApiClient(api_key="test-key", sleep=sleeps.append)
+    
+    page_1 = _response(200, {"items": [_comment_item("comm1")], "nextPageToken": "token-2"})
+    backend_error = _response(503, {"error": {"message": "Backend Error", "errors": [{"reason": "backendError"}]}})
+    page_2 = _response(200, {"items": [_comment_item("comm2")]})
+    
+    mock_session = Mock()
+    mock_session.get.side_effect = [page_1, backend_error, requests.ConnectionError("reset"), page_2]
+    
+    with patch("yt_comments.ingestion.youtube_api_client.requests.Session", return_value=mock_session):
+        comments = list(client.fetch_comments(video_id="vid1"))
+        
+    assert [c.comment_id for c in comments] == ["comm1", "comm2"]
+    assert mock_session.get.call_count == 4
+    assert len(sleeps) == 2
+    
+    # the first page is never requested again, retries go straight to the failing page
+    page_tokens = [call.kwargs["params"].get("pageToken") for call in mock_session.get.call_args_list]
+    assert page_tokens == [None, "token-2", "token-2", "token-2"]
+
+
+def test_fetch_comments_honors_retry_after():
+    sleeps = []
+    client = YouTubeApiClient(api_key="test-key", sleep=sleeps.append)
+    
+    throttled = _response(429, {"error": {"message": "Too many requests"}}, headers={"Retry-After": "7"})
+    ok = _response(200, {"items": [_comment_item("comm1")]})
+    
+    mock_session = Mock()
+    mock_session.get.side_effect = [throttled, ok]
+    
+    with patch("yt_comments.ingestion.youtube_api_client.requests.Session", return_value=mock_session):
+        comments = list(client.fetch_comments(video_id="vid1"))
+        
+    assert [c.comment_id for c in comments] == ["comm1"]
+    assert sleeps == [7.0]
+
+
+def test_fetch_comments_does_not_retry_terminal_reasons():
+    sleeps = []
+    client = YouTubeApiClient(api_key="test-key", sleep=sleeps.append)
+    
+    quota = _response(403, {"error": {"message": "Quota exceeded", "errors": [{"reason": "quotaExceeded"}]}})
+    
+    mock_session = Mock()
+    mock_session.get.return_value = quota
+    
+    with patch("yt_comments.ingestion.youtube_api_client.requests.Session", return_value=mock_session):
+        with pytest.raises(ValueError, match="quota exceeded"):
+            list(client.fetch_comments(video_id="vid1"))
+            
+    assert mock_session.get.call_count == 1
+    assert sleeps == []
+
+
+def test_fetch_comments_gives_up_after_max_attempts():
+    sleeps = []
+    client = YouTubeApiClient(api_key="test-key", retry_policy=RetryPolicy(max_attempts=3), sleep=sleeps.append)
+    
+    mock_session = Mock()
+    mock_session.get.return_value = _response(500, {"error": {"message": "Internal error"}})
+    
+    with patch("yt_comments.ingestion.youtube_api_client.requests.Session", return_value=mock_session):
+        with pytest.raises(ValueError, match="Internal error"):
+            list(client.fetch_comments(video_id="vid1"))
+            
+    assert mock_session.get.call_count == 3
+    assert len(sleeps) == 2
+
+
+def test_client_charges_quota_and_marks_key_exhausted():
+    ledger = QuotaLedger(daily_budget=500)
+    client = YouTubeApiClient(api_key="test-key", quota=ledger)
+    
+    ok = _response(200, {"items": [_comment_item("comm1")], "nextPageToken": "token-2"})
+    quota = _response(403, {"error": {"message": "Quota exceeded", "errors": [{"reason": "quotaExceeded"}]}})
+    
+    mock_session = Mock()
+    mock_session.get.side_effect = [ok, quota]
+    
+    with patch("yt_comments.ingestion.youtube_api_client.requests.Session", return_value=mock_session):
+        with pytest.raises(ValueError, match="quota exceeded"):
+            list(client.fetch_comments(video_id="vid1"))
+            
+    assert client.remaining_quota() == 0
+    
+    # with the budget spent locally, no further request is sent
+    with pytest.raises(QuotaBudgetExceededError):
+        list(client.fetch_comments(video_id="vid2"))
+    assert mock_session.get.call_count == 2
+
+
+def _playlist_item(video_id, published_at, title="title"):
+    return {
+        "snippet": {"title": title},
+        "contentDetails": {"videoId": video_id, "videoPublishedAt": published_at},
+    }
+
+
+def test_discover_uploads_filters_window_and_enriches_statistics():
+    client = YouTubeApiClient(api_key="test-key")
+    
+    channel = _response(200, {"items": [{"contentDetails": {"relatedPlaylists": {"uploads": "UU_test"}}}]})
+    page_1 = _response(
+        200,
+        {
+            "items": [
+                _playlist_item("vid_new", "2026-03-01T00:00:00Z"), # after published_before
+                _playlist_item("vid1", "2026-02-01T00:00:00Z", title="Video 1"),
+                {"snippet": {"title": "Private video"}, "contentDetails": {"videoId": "vid_private"}},
+            ],
+            "nextPageToken": "token-2",
+        },
+    )
+    stats_1 = _response(200, {"items": [{"id": "vid1", "statistics": {"viewCount": "120", "commentCount": "7"}}]})
+    page_2 = _response(
+        200,
+        {
+            "items": [
+                _playlist_item("vid2", "2026-01-15T00:00:00Z", title="Video 2"),
+                _playlist_item("vid_old", "2025-12-01T00:00:00Z"),
+            ],
+            "nextPageToken": "token-3",
+        },
+    )
+    stats_2 = _response(200, {"items": [{"id": "vid2", "statistics": {"viewCount": "5"}}]})
+    page_3 = _response(200, {"items": [_playlist_item("vid_older", "2025-11-01T00:00:00Z")], "nextPageToken": "token-4"})
+    
+    mock_session = Mock()
+    mock_session.get.side_effect = [channel, page_1, stats_1, page_2, stats_2, page_3]
+    
+    request = ChannelVideoDiscovery(
+        channel_id="UC_test",
+        published_after=datetime(2026, 1, 1, tzinfo=timezone.utc),
+        published_before=datetime(2026, 2, 15, tzinfo=timezone.utc),
+        engine="uploads",
+    )
+    with patch("yt_comments.ingestion.youtube_api_client.requests.Session", return_value=mock_session):
+        videos = list(client.discover_videos(request))
+        
+    assert [(v.video_id, v.title, v.view_count, v.comment_count) for v in videos] == [
+        ("vid1", "Video 1", 120, 7),
+        ("vid2", "Video 2", 5, None),
+    ]
+    assert all(v.channel_id == "UC_test" for v in videos)
+    
+    # page 3 lies entirely before published_after, so paging stops there (token-4 is never requested)
+    assert mock_session.get.call_count == 6
+    urls = [call.args[0].rsplit("/", 1)[-1] for call in mock_session.get.call_args_list]
+    assert urls == ["channels", "playlistItems", "videos", "playlistItems", "videos", "playlistItems"]
+    assert mock_session.get.call_args_list[1].kwargs["params"]["playlistId"] == "UU_test"
+    assert mock_session.get.call_args_list[2].kwargs["params"]["id"] == "vid1"
+
+
+def test_discover_uploads_respects_limit_and_costs_single_units():
+    ledger = QuotaLedger(daily_budget=100)
+    client = YouTubeApiClient(api_key="test-key", quota=ledger)
+    
+    channel = _response(200, {"items": [{"contentDetails": {"relatedPlaylists": {"uploads": "UU_test"}}}]})
+    page_1 = _response(
+        200,
+        {
+            "items": [_playlist_item(f"vid{i}", "2026-01-01T00:00:00Z") for i in range(5)],
+            "nextPageToken": "token-2",
+        },
+    )
+    stats = _response(200, {"items": [{"id": f"vid{i}", "statistics": {"viewCount": "1"}} for i in range(2)]})
+    
+    mock_session = Mock()
+    mock_session.get.side_effect = [channel, page_1, stats]
+    
+    request = ChannelVideoDiscovery(channel_id="UC_test", limit=2, engine="uploads")
+    with patch("yt_comments.ingestion.youtube_api_client.requests.Session", return_value=mock_session):
+        videos = list(client.discover_videos(request))
+        
+    assert [v.video_id for v in videos] == ["vid0", "vid1"]
+    assert mock_session.get.call_args_list[2].kwargs["params"]["id"] == "vid0,vid1"
+    assert ledger.used("test-key") == 3
+
+
+def test_fetch_video_statistics_batches_fifty_ids_per_call():
+    client = YouTubeApiClient(api_key="test-key")
+    video_ids = [f"vid{i}" for i in range(120)]
+    
+    def fake_get(url, params, timeout):
+        ids = params["id"].split(",")
+        return _response(200, {"items": [{"id": v, "statistics": {"commentCount": "3"}} for v in ids]})
+    
+    mock_session = Mock()
+    mock_session.get.side_effect = fake_get
+    
+    with patch("yt_comments.ingestion.youtube_api_client.requests.Session", return_value=mock_session):
+        stats = client.fetch_video_statistics(video_ids)
+        
+    assert [len(call.kwargs["params"]["id"].split(",")) for call in mock_session.get.call_args_list] == [50, 50, 20]
+    assert len(stats) == 120
+    assert stats["vid119"].comment_count == 3
+    assert stats["vid119"].view_count is None
+
+
+def test_requests_carry_field_masks():
+    client = YouTubeApiClient(api_key="test-key")
+    
+    mock_session = Mock()
+    mock_session.get.side_effect = [
+        _response(200, {"items": [_comment_item("comm1")]}),
+        _response(200, {"items": []}),
+    ]
+    
+    with patch("yt_comments.ingestion.youtube_api_client.requests.Session", return_value=mock_session):
+        list(client.fetch_comments(video_id="vid1"))
+        list(client.discover_videos(ChannelVideoDiscovery(channel_id="chan123")))
+        
+    comment_fields, search_fields = [call.kwargs["params"]["fields"] for call in mock_session.get.call_args_list]
+    assert comment_fields == FIELD_MASKS["commentThreads"]
+    assert "topLevelComment(id," in comment_fields
+    assert search_fields == FIELD_MASKS["search"]
+
+
+def test_pipelined_pagination_requests_next_page_while_caller_works():
+    client = YouTubeApiClient(api_key="test-key")
+    
+    pages = {
+        None: _response(200, {"items": [_comment_item("comm1")], "nextPageToken": "token-2"}),
+        "token-2": _response(200, {"items": [_comment_item("comm2")], "nextPageToken": "token-3"}),
+        "token-3": _response(200, {"items": [_comment_item("comm3")]}),
+    }
+    requested = set()
+    
+    def fake_get(url, params, timeout):
+        token = params.get("pageToken")
+        requested.add(token)
+        return pages[token]
+    
+    mock_session = Mock()
+    mock_session.get.side_effect = fake_get
+    
+    comment_ids = []
+    with patch("yt_comments.ingestion.youtube_api_client.requests.Session", return_value=mock_session):
+        for page in client.fetch_comment_pages("vid1", prefetch=1):
+            if page.comments[0].comment_id == "comm1":
+                # the next page goes out while the first one is still being handled here
+                deadline = time.monotonic() + 2.0
+                while "token-2" not in requested and time.monotonic() < deadline:
+                    time.sleep(0.01)
+                assert "token-2" in requested
+            comment_ids.extend(c.comment_id for c in page.comments)
+            
+    assert comment_ids == ["comm1", "comm2", "comm3"]
+    assert mock_session.get.call_count == 3
+
+
+def _reply_item(reply_id, parent_id):
+    return {"id": reply_id, "snippet": {"parentId": parent_id, "textOriginal": "reply", "publishedAt": "2026-01-02T00:00:00Z"}}
+
+
+def test_fetch_comments_with_replies_only_follows_up_on_truncated_threads():
+    client = YouTubeApiClient(api_key="test-key")
+    
+    def thread(comment_id, inline, total):
+        item = _comment_item(comment_id)
+        item["snippet"]["totalReplyCount"] = total
+        if inline:
+            item["replies"] = {"comments": [_reply_item(f"{comment_id}.{i}", comment_id) for i in range(inline)]}
+        return item
+    
+    threads = _response(200, {"items": [thread("c1", 2, 2), thread("c2", 5, 7), thread("c3", 0, 0)]})
+    full_replies = _response(200, {"items": [_reply_item(f"c2.{i}", "c2") for i in range(7)]})
+    
+    mock_session = Mock()
+    mock_session.get.side_effect = [threads, full_replies]
+    
+    with patch("yt_comments.ingestion.youtube_api_client.requests.Session", return_value=mock_session):
+        pages = list(client.fetch_comment_pages("vid1", include_replies=True))
+        
+    comments = pages[0].comments
+    assert [c.comment_id for c in comments] == (
+        ["c1", "c1.0", "c1.1", "c2"] + [f"c2.{i}" for i in range(7)] + ["c3"]
+    )
+    assert [c.is_reply for c in comments[:3]] == [False, True, True]
+    assert comments[1].parent_id == "c1"
+    
+    thread_call, replies_call = mock_session.get.call_args_list
+    assert thread_call.kwargs["params"]["part"] == "snippet,replies"
+    assert replies_call.args[0].endswith("/comments")
+    assert replies_call.kwargs["params"]["parentId"] == "c2"
+
+
+def test_client_retries_page_on_next_key_after_quota_exceeded():
+    ledger = QuotaLedger(daily_budget=500)
+    client = YouTubeApiClient(api_key="key-a", quota=ledger, key_pool=ApiKeyPool(["key-a", "key-b"]))
+    
+    page_1 = _response(200, {"items": [_comment_item("comm1")], "nextPageToken": "token-2"})
+    quota = _response(403, {"error": {"message": "Quota exceeded", "errors": [{"reason": "quotaExceeded"}]}})
+    page_2 = _response(200, {"items": [_comment_item("comm2")]})
+    
+    mock_session = Mock()
+    mock_session.get.side_effect = [page_1, quota, page_2]
+    
+    with patch("yt_comments.ingestion.youtube_api_client.requests.Session", return_value=mock_session):
+        comments = list(client.fetch_comments(video_id="vid1"))
+    
+    assert [c.comment_id for c in comments] == ["comm1", "comm2"]
+    sent = [c.kwargs["params"] for c in mock_session.get.call_args_list]
+    # the key with more quota left gets the next page; the rejected page goes out again on the other key
+    assert [p["key"] for p in sent] == ["key-a", "key-b", "key-a"]
+    assert sent[1]["pageToken"] == sent[2]["pageToken"] == "token-2"
+    assert ledger.remaining("key-b") == 0
+    assert client.remaining_quota() == 498
+
+
+def test_client_drops_invalid_key_from_rotation():
+    client = YouTubeApiClient(api_key="bad-key", key_pool=ApiKeyPool(["bad-key", "good-key"]))
+    
+    invalid = _response(400, {"error": {"message": "API key not valid", "errors": [{"reason": "keyInvalid"}]}})
+    ok = _response(200, {"items": [_comment_item("comm1")]})
+    
+    mock_session = Mock()
+    mock_session.get.side_effect = [invalid, ok, ok]
+    
+    with patch("yt_comments.ingestion.youtube_api_client.requests.Session", return_value=mock_session):
+        list(client.fetch_comments(video_id="vid1"))
+        list(client.fetch_comments(video_id="vid2"))
+    
+    keys = [c.kwargs["params"]["key"] for c in mock_session.get.call_args_list]
+    assert keys == ["bad-key", "good-key", "good-key"]
+    assert client.key_pool.retired() == {"bad-key": "keyInvalid"}
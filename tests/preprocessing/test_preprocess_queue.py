@@ -0,0 +1,62 @@
+from __future__ import annotations
+
+import threading
+from unittest.mock import Mock
+
+import pytest
+
+from yt_comments.preprocessing.preprocess_queue import PreprocessQueue
+
+
+
+def test_preprocess_queue_collects_paths_and_errors() -> None:
+    service = Mock()
+    def run(video_id, *, overwrite, batch_size):
+        if video_id == "bad":
+            raise ValueError("broken bronze file")
+        return f"silver/{video_id}/comments.parquet"
+    service.run.side_effect = run
+    
+    preprocess = PreprocessQueue(service, workers=2, maxsize=1, batch_size=10)
+    for video_id in ("a", "bad", "b"):
+        preprocess.submit(video_id)
+    results = preprocess.close()
+    
+    assert results["a"] == "silver/a/comments.parquet"
+    assert results["b"] == "silver/b/comments.parquet"
+    assert isinstance(results["bad"], ValueError)
+    service.run.assert_any_call("a", overwrite=True, batch_size=10)
+    assert preprocess.close() == results
+
+
+def test_preprocess_queue_blocks_submit_when_full() -> None:
+    started = threading.Event()
+    release = threading.Event()
+    service = Mock()
+    def run(video_id, **kwargs):
+        started.set()
+        release.wait()
+        return video_id
+    service.run.side_effect = run
+    
+    preprocess = PreprocessQueue(service, workers=1, maxsize=1)
+    preprocess.submit("a")
+    assert started.wait(timeout=5) # taken by the worker
+    preprocess.submit("b") # fills the queue
+    
+    third = threading.Thread(target=preprocess.submit, args=("c",))
+    third.start()
+    third.join(timeout=0.1)
+    assert third.is_alive()
+    
+    release.set()
+    third.join(timeout=5)
+    assert not third.is_alive()
+    assert set(preprocess.close()) == {"a", "b", "c"}
+
+
+def test_preprocess_queue_rejects_invalid_sizes() -> None:
+    with pytest.raises(ValueError):
+        PreprocessQueue(Mock(), workers=0)
+    with pytest.raises(ValueError):
+        PreprocessQueue(Mock(), maxsize=0)
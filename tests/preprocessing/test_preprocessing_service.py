@@ -66,4 +66,59 @@ def test_preprocess_streaming_writes_parquet(tmp_path: Path) -> None:
     assert df.loc[0, "author"] == "bob"
     assert df.loc[0, "like_count"] == 0
     assert df.loc[0, "preprocess_version"] == "v1"
-    assert df.loc[0, "published_at"].to_pydatetime() == datetime(2026, 1, 1, 10, 0, tzinfo=timezone.utc)
\ No newline at end of file
+    assert df.loc[0, "published_at"].to_pydatetime() == datetime(2026, 1, 1, 10, 0, tzinfo=timezone.utc)
+
+def test_preprocess_streams_bronze_in_parquet_batches(tmp_path: Path) -> None:
+    bronze_repo = JSONLCommentsRepository(tmp_path / "bronze")
+    silver_repo = ParquetSilverCommentsRepository(tmp_path / "silver")
+    bronze_repo.save(
+        "abc123",
+        [Comment(video_id="abc123", comment_id=f"c{i}", text=f"Comment {i}") for i in range(7)],
+    )
+    svc = PreprocessCommentsService(
+        bronze_repo=bronze_repo,
+        silver_repo=silver_repo,
+        text_preprocessor=TextPreprocessor(),
+    )
+
+    out_path = svc.run("abc123", batch_size=3)
+
+    parquet = pq.ParquetFile(out_path)
+    assert parquet.metadata.num_rows == 7
+    assert parquet.metadata.num_row_groups == 3 # one row group per batch: never more than 3 rows in memory
+    assert parquet.read().column("comment_id").to_pylist() == [f"c{i}" for i in range(7)]
+
+
+def test_preprocess_arrow_and_rows_engines_write_the_same_silver(tmp_path: Path) -> None:
+    bronze_repo = JSONLCommentsRepository(tmp_path / "bronze", codec="gzip")
+    bronze_repo.save(
+        "abc123",
+        [
+            Comment(
+                video_id="abc123",
+                comment_id=f"c{i}",
+                text=f"Comment {i}  ΣΟΦΟΣ https://x.y/{i}",
+                author=None if i % 3 else f"user{i}",
+                like_count=None if i % 2 else i,
+                published_at=(
+                    None if i % 4 == 0
+                    else datetime(2026, 1, 1, 10, i, tzinfo=timezone.utc) if i % 4 == 1
+                    else datetime(2026, 1, 1, 10, i) # naive, stored as UTC
+                ),
+                is_reply=bool(i % 2),
+                parent_id="c0" if i % 2 else None,
+            )
+            for i in range(20)
+        ],
+    )
+    tables = {}
+    for engine in PreprocessCommentsService.ENGINES:
+        svc = PreprocessCommentsService(
+            bronze_repo=bronze_repo,
+            silver_repo=ParquetSilverCommentsRepository(tmp_path / engine),
+            text_preprocessor=TextPreprocessor(),
+        )
+        tables[engine] = pq.read_table(svc.run("abc123", batch_size=8, engine=engine)).drop_columns(["processed_at"])
+
+    assert tables["arrow"].equals(tables["rows"])
+    assert tables["arrow"].num_rows == 20
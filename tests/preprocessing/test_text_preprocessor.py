@@ -0,0 +1,33 @@
+from __future__ import annotations
+
+import sys
+
+import pyarrow as pa
+
+from yt_comments.preprocessing.text_preprocessor import TextPreprocessor
+
+
+
+def test_clean_array_matches_clean_row_by_row() -> None:
+    texts = [
+        "Hello   WORLD! https://example.com/a?b=1",
+        "see WWW.Example.com　next line\tend  ",
+        "  ﬁne ＦＵＬＬＷＩＤＴＨ   spaces ",
+        "İstanbul ΟΔΥΣΣΕΥΣ", # special casing: dotted I, final sigma
+        "emoji 🎉🔥 and ÄÖÜ ẞ",
+        "HTTP://X.Y/Z\u0085tail\x1cx",
+        "",
+        "   ",
+    ]
+    tp = TextPreprocessor()
+    
+    cleaned = tp.clean_array(pa.chunked_array([texts[:3], texts[3:] + [None]]))
+    
+    assert cleaned.to_pylist() == [tp.clean(t) for t in texts] + [None]
+
+
+def test_clean_array_whitespace_class_covers_python_whitespace() -> None:
+    whitespace = "".join(chr(c) for c in range(sys.maxunicode + 1) if chr(c).isspace())
+    tp = TextPreprocessor()
+    
+    assert tp.clean_array(pa.array([f"a{whitespace}b"])).to_pylist() == ["a b"]
@@ -3,7 +3,7 @@ from datetime import datetime, timezone
 
 import pytest
 
-from yt_comments.ingestion.models import Comment
+from yt_comments.ingestion.models import Comment, ScrapeCheckpoint
 from yt_comments.storage.bronze_comments_repository import JSONLCommentsRepository
 
 
@@ -74,3 +74,174 @@ def test_repo_load_invalid_record_raises_value_error(tmp_path) -> None:
         repo.load("dQw4w9WgXcQ")
 
 
+def test_repo_writer_commits_atomically(tmp_path) -> None:
+    repo = JSONLCommentsRepository(tmp_path)
+    old = [Comment(video_id="vid1", comment_id="old", text="hello")]
+    repo.save("vid1", old)
+    
+    with repo.open_writer("vid1") as writer:
+        writer.write([Comment(video_id="vid1", comment_id="c0", text="hello")])
+        writer.flush()
+        # until commit, readers still see the previous complete file
+        assert repo.load("vid1") == old
+        path = writer.commit()
+        
+    assert path == tmp_path / "vid1.jsonl"
+    assert [c.comment_id for c in repo.load("vid1")] == ["c0"]
+    assert not (tmp_path / "vid1.jsonl.part").exists()
+    
+    
+def test_repo_writer_resume_drops_rows_after_checkpoint_and_partial_line(tmp_path) -> None:
+    repo = JSONLCommentsRepository(tmp_path)
+    
+    with repo.open_writer("vid1") as writer:
+        writer.write([Comment(video_id="vid1", comment_id=f"c{i}", text="hello") for i in range(3)])
+    part_path = tmp_path / "vid1.jsonl.part"
+    with part_path.open("a", encoding="utf-8") as f:
+        f.write('{"video_id": "vid1", "comm') # interrupted write
+        
+    with repo.open_writer("vid1", resume_rows=2) as writer:
+        assert writer.row_count == 2
+        writer.write([Comment(video_id="vid1", comment_id="c9", text="hello")])
+        writer.commit()
+        
+    assert [c.comment_id for c in repo.load("vid1")] == ["c0", "c1", "c9"]
+    
+    
+def test_repo_writer_without_overwrite_appends_to_existing_file(tmp_path) -> None:
+    repo = JSONLCommentsRepository(tmp_path)
+    repo.save("vid1", [Comment(video_id="vid1", comment_id="old", text="hello")])
+    
+    with repo.open_writer("vid1", overwrite=False) as writer:
+        assert writer.row_count == 1
+        writer.write([Comment(video_id="vid1", comment_id="new", text="hello")])
+        writer.commit()
+        
+    assert [c.comment_id for c in repo.load("vid1")] == ["old", "new"]
+    
+    
+def test_repo_checkpoint_round_trip(tmp_path) -> None:
+    repo = JSONLCommentsRepository(tmp_path)
+    checkpoint = ScrapeCheckpoint(
+        video_id="vid1",
+        next_page_token="token-2",
+        row_count=100,
+        updated_at_utc=datetime(2026, 1, 1, 12, 0, 0, tzinfo=timezone.utc),
+    )
+    
+    assert repo.load_checkpoint("vid1") is None
+    
+    path = repo.save_checkpoint(checkpoint)
+    assert path == tmp_path / "_checkpoints" / "vid1.json"
+    assert repo.load_checkpoint("vid1") == checkpoint
+    
+    repo.clear_checkpoint("vid1")
+    assert repo.load_checkpoint("vid1") is None
+
+
+def test_repo_newest_marker_ignores_replies(tmp_path) -> None:
+    repo = JSONLCommentsRepository(tmp_path)
+    repo.save(
+        "vid1",
+        [
+            Comment(video_id="vid1", comment_id="c1", text="top", published_at=datetime(2026, 1, 1, tzinfo=timezone.utc)),
+            Comment(
+                video_id="vid1",
+                comment_id="c1.r1",
+                text="late reply",
+                published_at=datetime(2026, 3, 1, tzinfo=timezone.utc),
+                is_reply=True,
+                parent_id="c1",
+            ),
+        ],
+    )
+    
+    assert repo.newest_marker("vid1") == (datetime(2026, 1, 1, tzinfo=timezone.utc), frozenset({"c1"}))
+    assert repo.load("vid1")[1].parent_id == "c1"
+
+
+@pytest.mark.parametrize("codec, suffix", [("gzip", ".jsonl.gz"), ("zstd", ".jsonl.zst")])
+def test_repo_compressed_codec_round_trip(tmp_path, codec, suffix) -> None:
+    repo = JSONLCommentsRepository(tmp_path, codec=codec)
+    comments = [Comment(video_id="vid1", comment_id=f"c{i}", text="same text " * 20) for i in range(50)]
+    
+    with repo.open_writer("vid1") as writer:
+        writer.write(comments[:30])
+        path = writer.commit()
+    repo.save("vid1", comments[30:], overwrite=False) # appended as a new gzip member / zstd frame
+    
+    assert path == tmp_path / f"vid1{suffix}"
+    assert not (tmp_path / "vid1.jsonl.part").exists()
+    assert path.stat().st_size < len("same text " * 20) * 50 / 5
+    # a plain repository reads it too: the codec comes from the file name
+    assert JSONLCommentsRepository(tmp_path).load("vid1") == comments
+
+
+def test_repo_compressed_write_replaces_plain_file(tmp_path) -> None:
+    JSONLCommentsRepository(tmp_path).save("vid1", [Comment(video_id="vid1", comment_id="old", text="hello")])
+    repo = JSONLCommentsRepository(tmp_path, codec="gzip")
+    assert repo.exists("vid1")
+    
+    with repo.open_writer("vid1", overwrite=False) as writer:
+        assert writer.row_count == 1
+        writer.write([Comment(video_id="vid1", comment_id="new", text="hello")])
+        writer.commit()
+    
+    assert not (tmp_path / "vid1.jsonl").exists()
+    assert [c.comment_id for c in repo.load("vid1")] == ["old", "new"]
+
+
+def test_repo_rejects_unknown_codec(tmp_path) -> None:
+    with pytest.raises(ValueError):
+        JSONLCommentsRepository(tmp_path, codec="lz4")
+
+
+def test_repo_iterates_comments_lazily(tmp_path) -> None:
+    repo = JSONLCommentsRepository(tmp_path)
+    repo.save("vid1", [Comment(video_id="vid1", comment_id=f"c{i}", text="hello") for i in range(5)])
+    
+    comments = repo.iter_comments("vid1")
+    assert next(comments).comment_id == "c0"
+    assert [c.comment_id for c in comments] == ["c1", "c2", "c3", "c4"]
+    assert list(repo.iter_comments("missing")) == []
+
+
+def test_repo_reads_comments_as_arrow_tables_in_chunks(tmp_path) -> None:
+    repo = JSONLCommentsRepository(tmp_path, codec="zstd")
+    comments = [
+        Comment(
+            video_id="vid1",
+            comment_id=f"c{i}",
+            text=f"hello {i}",
+            like_count=i,
+            published_at=datetime(2026, 1, 1, 12, i, tzinfo=timezone.utc),
+        )
+        for i in range(10)
+    ]
+    repo.save("vid1", comments[:6])
+    repo.save("vid1", comments[6:], overwrite=False) # second zstd frame
+    
+    tables = list(repo.iter_comment_tables("vid1", chunk_bytes=300))
+    
+    assert len(tables) > 1
+    table = repo.read_table("vid1")
+    assert table.schema == JSONLCommentsRepository.BRONZE_SCHEMA
+    assert table.column("comment_id").to_pylist() == [c.comment_id for c in comments]
+    assert table.column("published_at").to_pylist() == [c.published_at for c in comments]
+    assert repo.read_table("missing").num_rows == 0
+
+
+def test_repo_arrow_read_fills_missing_fields_and_rejects_invalid_json(tmp_path) -> None:
+    repo = JSONLCommentsRepository(tmp_path)
+    (tmp_path / "vid1.jsonl").write_text(
+        '{"video_id": "vid1", "comment_id": "c0", "text": "old row", "published_at": "2026-01-01T10:00:00", "extra": 1}\n',
+        encoding="utf-8",
+    )
+    
+    [row] = repo.read_table("vid1").to_pylist()
+    assert row["parent_id"] is None and row["like_count"] is None
+    assert row["published_at"] == datetime(2026, 1, 1, 10, 0, tzinfo=timezone.utc)
+    
+    (tmp_path / "vid2.jsonl").write_text('{"ok": 1}\n{"not ok"}\n', encoding="utf-8")
+    with pytest.raises(ValueError):
+        repo.read_table("vid2")
@@ -0,0 +1,43 @@
+from datetime import datetime, timezone
+from pathlib import Path
+
+from yt_comments.ingestion.models import FailedVideo
+from yt_comments.storage.failed_video_repository import JSONFailedVideoRepository
+
+
+def test_failed_video_repository_round_trip(tmp_path: Path):
+    repo = JSONFailedVideoRepository(data_root=tmp_path)
+    
+    assert repo.load("UC_test") == {}
+    
+    failed = FailedVideo(
+        video_id="v1",
+        channel_id="UC_test",
+        title="Video 1",
+        error="YouTube API error: Backend Error",
+        attempts=2,
+        last_failed_at_utc=datetime(2026, 1, 1, 12, 0, tzinfo=timezone.utc),
+    )
+    path = repo.save("UC_test", {"v1": failed})
+    
+    assert path == tmp_path / "state" / "failed_videos" / "UC_test.json"
+    assert repo.load("UC_test") == {"v1": failed}
+    assert repo.load("UC_other") == {}
+    
+
+def test_failed_video_repository_removes_empty_queue(tmp_path: Path):
+    repo = JSONFailedVideoRepository(data_root=tmp_path)
+    failed = FailedVideo(
+        video_id="v1",
+        channel_id="UC_test",
+        title="Video 1",
+        error="boom",
+        attempts=1,
+        last_failed_at_utc=datetime(2026, 1, 1, tzinfo=timezone.utc),
+    )
+    path = repo.save("UC_test", {"v1": failed})
+    
+    repo.save("UC_test", {})
+    
+    assert not path.exists()
+    assert repo.load("UC_test") == {}
@@ -1,5 +1,9 @@
+import json
+from datetime import timedelta
 from pathlib import Path
 
+import pytest
+
 from yt_comments.storage.gold_channel_ref_mapping_repository import JSONChannelRefRepository
 
 
@@ -17,3 +21,18 @@ def test_channel_ref_repository_round_trip(tmp_path: Path):
     assert got == channel_id
 
 
+
+
+def test_channel_ref_repository_treats_old_mapping_as_missing(tmp_path: Path):
+    repo = JSONChannelRefRepository(data_root=tmp_path)
+    path = repo.save(raw_input="@test_handle", channel_id="chan123")
+    
+    assert repo.load("@test_handle", max_age=timedelta(days=1)) == "chan123"
+    
+    payload = json.loads(path.read_text(encoding="utf-8"))
+    payload["@test_handle"]["resolved_at_utc"] = "2020-01-01T00:00:00Z"
+    path.write_text(json.dumps(payload), encoding="utf-8")
+    
+    assert repo.load("@test_handle") == "chan123"
+    with pytest.raises(KeyError):
+        repo.load("@test_handle", max_age=timedelta(days=1))
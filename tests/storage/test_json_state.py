@@ -0,0 +1,15 @@
+import json
+from pathlib import Path
+
+from yt_comments.storage.json_state import _atomic_write_json
+
+
+def test_atomic_write_json_replaces_file_without_leftovers(tmp_path: Path):
+    path = tmp_path / "state.json"
+    path.write_text('{"old": 1}', encoding="utf-8")
+    
+    _atomic_write_json(path, {"b": 2, "a": "ü"}, sort_keys=True)
+    
+    assert json.loads(path.read_text(encoding="utf-8")) == {"a": "ü", "b": 2}
+    assert path.read_text(encoding="utf-8").index('"a"') < path.read_text(encoding="utf-8").index('"b"')
+    assert list(tmp_path.iterdir()) == [path]
@@ -0,0 +1,26 @@
+from pathlib import Path
+
+from yt_comments.storage.quota_ledger_repository import JSONQuotaLedgerRepository
+
+
+def test_quota_ledger_repository_round_trip(tmp_path: Path):
+    repo = JSONQuotaLedgerRepository(data_root=tmp_path)
+    
+    assert repo.load() == {}
+    
+    path = repo.save({"2026-01-01": {"abc": 150}})
+    
+    assert path == tmp_path / "state" / "quota_ledger.json"
+    assert repo.load() == {"2026-01-01": {"abc": 150}}
+    
+
+def test_quota_ledger_repository_keeps_recent_days_only(tmp_path: Path):
+    repo = JSONQuotaLedgerRepository(data_root=tmp_path, keep_days=2)
+    
+    repo.save({
+        "2026-01-01": {"abc": 1},
+        "2026-01-02": {"abc": 2},
+        "2026-01-03": {"abc": 3},
+    })
+    
+    assert sorted(repo.load()) == ["2026-01-02", "2026-01-03"]
@@ -0,0 +1,47 @@
+import json
+from datetime import datetime, timezone
+from pathlib import Path
+
+from yt_comments.ingestion.models import VideoRefreshState
+from yt_comments.storage.refresh_state_repository import JSONRefreshStateRepository
+
+
+def test_refresh_state_repository_round_trip(tmp_path: Path):
+    repo = JSONRefreshStateRepository(data_root=tmp_path)
+    
+    assert repo.load("UC_test") == {}
+    
+    states = {
+        "v1": VideoRefreshState(
+            video_id="v1",
+            channel_id="UC_test",
+            title="Video 1",
+            published_at=datetime(2026, 1, 1, tzinfo=timezone.utc),
+            observed_comment_count=120,
+            observed_at_utc=datetime(2026, 2, 1, 12, 0, tzinfo=timezone.utc),
+            scraped_comment_count=100,
+            last_scraped_at_utc=datetime(2026, 2, 1, 6, 0, tzinfo=timezone.utc),
+            comments_per_day=3.5,
+        ),
+        "v2": VideoRefreshState(video_id="v2", channel_id="UC_test", title="Video 2"),
+    }
+    path = repo.save("UC_test", states)
+    
+    assert path == tmp_path / "state" / "refresh" / "UC_test.json"
+    assert repo.load("UC_test") == states
+    assert repo.load_discovered_at("UC_test") is None
+    
+    discovered_at = datetime(2026, 2, 1, 5, 0, tzinfo=timezone.utc)
+    repo.save("UC_test", states, discovered_at_utc=discovered_at)
+    assert repo.load("UC_test") == states
+    assert repo.load_discovered_at("UC_test") == discovered_at
+
+
+def test_refresh_state_repository_reads_files_without_discovery_time(tmp_path: Path):
+    path = tmp_path / "state" / "refresh" / "UC_test.json"
+    path.parent.mkdir(parents=True)
+    path.write_text(json.dumps({"v1": {"video_id": "v1", "channel_id": "UC_test", "title": "Video 1"}}), encoding="utf-8")
+    repo = JSONRefreshStateRepository(data_root=tmp_path)
+    
+    assert repo.load("UC_test") == {"v1": VideoRefreshState(video_id="v1", channel_id="UC_test", title="Video 1")}
+    assert repo.load_discovered_at("UC_test") is None